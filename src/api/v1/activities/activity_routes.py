@@ -3,16 +3,22 @@
 from typing import List, Optional
 from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.exc import SQLAlchemyError
+from fastapi.responses import StreamingResponse
 from src.models.activity_models import ActivityType
 from src.services.activity_services import ActivityServices, get_activity_service
-from src.schemas.activity_schemas import CreateActivity, ReadActivity
+from src.schemas.activity_schemas import CreateActivity, ReadActivity, READ_ACTIVITY_LIST_ADAPTER
 from src.api.v1.auth.auths import current_active_user
+from src.core.utils.pagination import Cursor, get_cursor, page_response
 from src.models.user_models import User
 
 activity_router = APIRouter(tags=["activities"])
 
 
-@activity_router.post("/create/new", response_model=ReadActivity)
+@activity_router.post(
+    "/create/new", response_model=ReadActivity,
+    response_model_exclude_none=True
+)
 async def create_activity(
     activity: CreateActivity,
     activity_services: ActivityServices = Depends(get_activity_service),
@@ -33,6 +39,10 @@ async def create_activity(
         return await activity_services.create_activity(
             activity_data=activity_data
         )
+    except HTTPException as http_exc:
+        raise http_exc
+    except SQLAlchemyError:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -41,10 +51,12 @@ async def create_activity(
 
 
 @activity_router.get(
-    "", response_model=List[ReadActivity]
+    "", response_model=List[ReadActivity],
+    response_model_exclude_none=True
 )
 async def get_activities(
     project_id: UUID, order: str = "asc", limit: int = 10, offset: int = 0,
+    cursor: Optional[Cursor] = Depends(get_cursor),
     activity_services: ActivityServices = Depends(get_activity_service),
     user: User = Depends(current_active_user),
 ):
@@ -64,14 +76,20 @@ async def get_activities(
         activities = await activity_services.get_all_activities(
             project_id=project_id,
             user_id=user.id, order=order,
-            limit=limit, offset=offset
+            limit=limit, offset=offset, cursor=cursor
         )
         if not activities:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Activities not found"
             )
-        return activities
+        return page_response(
+            READ_ACTIVITY_LIST_ADAPTER, activities, limit, exclude_none=True
+        )
+    except HTTPException as http_exc:
+        raise http_exc
+    except SQLAlchemyError:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -80,10 +98,12 @@ async def get_activities(
 
 
 @activity_router.get(
-    "/users/{user_id}/activities", response_model=List[ReadActivity]
+    "/users/{user_id}/activities", response_model=List[ReadActivity],
+    response_model_exclude_none=True
 )
 async def get_user_activities(
     user_id: UUID, order: str = "asc", limit: int = 10, offset: int = 0,
+    cursor: Optional[Cursor] = Depends(get_cursor),
     activity_services: ActivityServices = Depends(get_activity_service),
     user: User = Depends(current_active_user),
 ):
@@ -102,14 +122,20 @@ async def get_user_activities(
     try:
         activities = await activity_services.get_all_user_activities(
             user_id=user_id, order=order,
-            limit=limit, offset=offset
+            limit=limit, offset=offset, cursor=cursor
         )
         if not activities:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Activities not found"
             )
-        return activities
+        return page_response(
+            READ_ACTIVITY_LIST_ADAPTER, activities, limit, exclude_none=True
+        )
+    except HTTPException as http_exc:
+        raise http_exc
+    except SQLAlchemyError:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -118,11 +144,13 @@ async def get_user_activities(
 
 
 @activity_router.get(
-    "/teams/{team_id}/tasks/{task_id}/activities", response_model=List[ReadActivity]
+    "/teams/{team_id}/tasks/{task_id}/activities", response_model=List[ReadActivity],
+    response_model_exclude_none=True
 )
 async def get_team_activities(
     team_id: UUID, task_id: UUID,
     order: str = "asc", limit: int = 10, offset: int = 0,
+    cursor: Optional[Cursor] = Depends(get_cursor),
     activity_services: ActivityServices = Depends(get_activity_service),
     user: User = Depends(current_active_user),
 ):
@@ -143,14 +171,20 @@ async def get_team_activities(
         activities = await activity_services.get_all_team_activities(
             team_id=team_id, task_id=task_id,
             user_id=user.id, order=order,
-            limit=limit, offset=offset
+            limit=limit, offset=offset, cursor=cursor
         )
         if not activities:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Activities not found"
             )
-        return activities
+        return page_response(
+            READ_ACTIVITY_LIST_ADAPTER, activities, limit, exclude_none=True
+        )
+    except HTTPException as http_exc:
+        raise http_exc
+    except SQLAlchemyError:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -159,10 +193,12 @@ async def get_team_activities(
 
 
 @activity_router.get(
-    "/projects/{project_id}/activities", response_model=List[ReadActivity]
+    "/projects/{project_id}/activities", response_model=List[ReadActivity],
+    response_model_exclude_none=True
 )
 async def get_project_activities(
     project_id: UUID, order: str = "asc", limit: int = 10, offset: int = 0,
+    cursor: Optional[Cursor] = Depends(get_cursor),
     activity_services: ActivityServices = Depends(get_activity_service),
     user: User = Depends(current_active_user),
 ):
@@ -181,14 +217,20 @@ async def get_project_activities(
     try:
         activities = await activity_services.get_all_project_activities(
             project_id=project_id, user_id=user.id, order=order,
-            limit=limit, offset=offset
+            limit=limit, offset=offset, cursor=cursor
         )
         if not activities:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Activities not found"
             )
-        return activities
+        return page_response(
+            READ_ACTIVITY_LIST_ADAPTER, activities, limit, exclude_none=True
+        )
+    except HTTPException as http_exc:
+        raise http_exc
+    except SQLAlchemyError:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -196,8 +238,36 @@ async def get_project_activities(
         ) from e
 
 
+@activity_router.get("/projects/{project_id}/activities/export")
+async def export_project_activities(
+    project_id: UUID, order: str = "asc",
+    activity_services: ActivityServices = Depends(get_activity_service),
+    user: User = Depends(current_active_user),
+):
+    """
+    Export every activity of a project as newline-delimited JSON.
+
+    Args:
+    project_id (UUID): The ID of the project whose activities to export.
+    order (str): Order of the activities (asc or desc).
+
+    Returns:
+    StreamingResponse: One ReadActivity JSON object per line.
+    """
+    activities = await activity_services.stream_project_activities(
+        project_id=project_id, user_id=user.id, order=order
+    )
+
+    async def lines():
+        async for activity in activities:
+            yield ReadActivity.model_validate(activity).model_dump_json(exclude_none=True) + "\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
 @activity_router.get(
-    "/{activity_id}/projects/{project_id}/activities", response_model=ReadActivity
+    "/{activity_id}/projects/{project_id}/activities", response_model=ReadActivity,
+    response_model_exclude_none=True
 )
 async def get_activity_by_id(
     activity_id: UUID, project_id: UUID,
@@ -225,6 +295,10 @@ async def get_activity_by_id(
                 detail="Activity not found"
             )
         return activity
+    except HTTPException as http_exc:
+        raise http_exc
+    except SQLAlchemyError:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -233,10 +307,12 @@ async def get_activity_by_id(
 
 
 @activity_router.get(
-    "/tasks/{task_id}/activities", response_model=List[ReadActivity]
+    "/tasks/{task_id}/activities", response_model=List[ReadActivity],
+    response_model_exclude_none=True
 )
 async def get_task_activities(
     task_id: UUID, order: str = "asc", limit: int = 10, offset: int = 0,
+    cursor: Optional[Cursor] = Depends(get_cursor),
     activity_services: ActivityServices = Depends(get_activity_service),
     user: User = Depends(current_active_user),
 ):
@@ -255,14 +331,20 @@ async def get_task_activities(
     try:
         activities = await activity_services.get_all_task_activities(
             task_id=task_id, user_id=user.id,
-            order=order, limit=limit, offset=offset
+            order=order, limit=limit, offset=offset, cursor=cursor
         )
         if not activities:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Activities not found"
             )
-        return activities
+        return page_response(
+            READ_ACTIVITY_LIST_ADAPTER, activities, limit, exclude_none=True
+        )
+    except HTTPException as http_exc:
+        raise http_exc
+    except SQLAlchemyError:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -271,12 +353,14 @@ async def get_task_activities(
 
 
 @activity_router.get(
-    "/filter", response_model=List[ReadActivity]
+    "/filter", response_model=List[ReadActivity],
+    response_model_exclude_none=True
 )
 async def filter_activities(
     project_id: UUID, activity_type: ActivityType,
     entity: Optional[str] = None,
     order: str = "asc", limit: int = 10, offset: int = 0,
+    cursor: Optional[Cursor] = Depends(get_cursor),
     activity_services: ActivityServices = Depends(get_activity_service),
     user: User = Depends(current_active_user),
 ):
@@ -297,19 +381,26 @@ async def filter_activities(
     try:
         activities = await activity_services.filter_activities(
             project_id=project_id,
-            activity_type=activity_type,
+            type=activity_type,
             entity=entity,
             user_id=user.id,
             order=order,
             limit=limit,
-            offset=offset
+            offset=offset,
+            cursor=cursor
         )
         if not activities:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Activities not found"
             )
-        return activities
+        return page_response(
+            READ_ACTIVITY_LIST_ADAPTER, activities, limit, exclude_none=True
+        )
+    except HTTPException as http_exc:
+        raise http_exc
+    except SQLAlchemyError:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -345,6 +436,10 @@ async def delete_activity_by_id(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Activity not found"
             )
+    except HTTPException as http_exc:
+        raise http_exc
+    except SQLAlchemyError:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -3,12 +3,16 @@
 from typing import List, Optional
 import uuid
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.exc import SQLAlchemyError
+from fastapi.responses import StreamingResponse
 from src.models.user_models import User
 from src.services.project_services import ProjectServices, get_project_services
-from src.schemas.project_schemas import CreateProject, ReadProject, UpdateProject
+from src.schemas.project_schemas import (
+    CreateProject, ReadProject, UpdateProject, READ_PROJECT_LIST_ADAPTER
+)
 from src.api.v1.auth.auths import current_active_user
-from src.models.activity_models import ActivityType
-from src.services.activity_services import ActivityServices, get_activity_service
+from src.core.utils.pagination import Cursor, get_cursor, page_response
+from src.core.utils.responses import json_list_response
 
 project_router = APIRouter(tags=["projects"])
 
@@ -20,8 +24,7 @@ project_router = APIRouter(tags=["projects"])
 async def create_project(
     project: CreateProject,
     user: User = Depends(current_active_user),
-    project_services: ProjectServices = Depends(get_project_services),
-    activity_logs: ActivityServices = Depends(get_activity_service)
+    project_services: ProjectServices = Depends(get_project_services)
 ) -> ReadProject:
     """
     Create a new project.
@@ -41,20 +44,11 @@ async def create_project(
                 status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
                 detail='Project already exists or team not found',
             )
-        data={
-            "user_id": new_project.user_id,
-            "team_id": new_project.team_id,
-            "project_id": new_project.id,
-            "description": f"A new Project with id {str(new_project.id)} has been created.",
-            "activity_type": ActivityType.CREATE,
-            "entity": "project",
-            "entity_id": str(new_project.id)
-        }
-
-        await activity_logs.create_activity(
-            activity_data=data
-        )
         return new_project
+    except HTTPException as http_exc:
+        raise http_exc
+    except SQLAlchemyError:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -74,6 +68,7 @@ async def get_all_projects(
     order: str = Query("asc", min_length=3, max_length=3),
     limit: int = Query(20, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    cursor: Optional[Cursor] = Depends(get_cursor),
 ) -> List[ReadProject]:
     """
     Retrieve all projects from the database.
@@ -82,6 +77,7 @@ async def get_all_projects(
     order (str): Order of the projects (asc or desc).
     limit (int): Maximum number of projects to retrieve.
     offset (int): Number of projects to skip.
+    cursor (Cursor): The (created_at, id) of the last project already seen.
 
     Returns:
     List: A list of projects.
@@ -91,12 +87,16 @@ async def get_all_projects(
             if not user_id:
                 raise HTTPException(status_code=400, detail="User ID is required")
             projects = await project_services.get_all_projects(
-                user_id=user_id, order=order, limit=limit, offset=offset
+                user_id=user_id, order=order, limit=limit, offset=offset, cursor=cursor
             )
         projects = await project_services.get_all_projects(
-            user_id=user.id, order=order, limit=limit, offset=offset
+            user_id=user.id, order=order, limit=limit, offset=offset, cursor=cursor
         )
-        return projects
+        return page_response(READ_PROJECT_LIST_ADAPTER, projects, limit)
+    except HTTPException as http_exc:
+        raise http_exc
+    except SQLAlchemyError:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -104,6 +104,30 @@ async def get_all_projects(
         ) from e
 
 
+@project_router.get("/export")
+async def export_projects(
+    order: str = Query("asc", min_length=3, max_length=4),
+    user: User = Depends(current_active_user),
+    project_services: ProjectServices = Depends(get_project_services),
+):
+    """
+    Export every project of the current user as newline-delimited JSON.
+
+    Args:
+    order (str): Order of the projects (asc or desc).
+
+    Returns:
+    StreamingResponse: One ReadProject JSON object per line.
+    """
+    projects = project_services.stream_user_projects(user_id=user.id, order=order)
+
+    async def lines():
+        async for project in projects:
+            yield ReadProject.model_validate(project).model_dump_json() + "\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
 @project_router.get(
     "/team/project",
     response_model=List[ReadProject],
@@ -131,7 +155,11 @@ async def get_team_projects_for_user(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail='Projects not found for you',
             )
-        return projects
+        return json_list_response(READ_PROJECT_LIST_ADAPTER, projects)
+    except HTTPException as http_exc:
+        raise http_exc
+    except SQLAlchemyError:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -167,6 +195,10 @@ async def get_project_if_member(
                 detail='Project not found',
             )
         return project
+    except HTTPException as http_exc:
+        raise http_exc
+    except SQLAlchemyError:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -202,6 +234,10 @@ async def get_project_by_id(
                 detail='Project not found',
             )
         return project
+    except HTTPException as http_exc:
+        raise http_exc
+    except SQLAlchemyError:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -210,7 +246,7 @@ async def get_project_by_id(
 
 
 @project_router.get(
-    "title/{title}", status_code=status.HTTP_200_OK,
+    "/title/{title}", status_code=status.HTTP_200_OK,
     response_model=ReadProject
 )
 async def get_project_by_title(
@@ -237,6 +273,10 @@ async def get_project_by_title(
                 detail='Project not found',
             )
         return project
+    except HTTPException as http_exc:
+        raise http_exc
+    except SQLAlchemyError:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -252,6 +292,7 @@ async def get_projects_by_team_id(
     team_id: uuid.UUID, order: str = Query("asc", min_length=3, max_length=3),
     limit: int = Query(20, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    cursor: Optional[Cursor] = Depends(get_cursor),
     project_services: ProjectServices = Depends(get_project_services),
     user: User = Depends(current_active_user)
 ) -> List[ReadProject]:
@@ -267,9 +308,18 @@ async def get_projects_by_team_id(
     try:
         projects = await project_services.get_all_team_projects(
             team_id=team_id, owner_id=user.id,
-            order=order, limit=limit, offset=offset
+            order=order, limit=limit, offset=offset, cursor=cursor
         )
-        return projects
+        if projects is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail='Team not found',
+            )
+        return page_response(READ_PROJECT_LIST_ADAPTER, projects, limit)
+    except HTTPException as http_exc:
+        raise http_exc
+    except SQLAlchemyError:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -319,6 +369,10 @@ async def get_project_by_project_id_and_user_id(
                 detail='Project not found',
             )
         return project
+    except HTTPException as http_exc:
+        raise http_exc
+    except SQLAlchemyError:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -334,8 +388,7 @@ async def update_project(
     project_id: uuid.UUID,
     project: UpdateProject,
     project_services: ProjectServices = Depends(get_project_services),
-    user: User = Depends(current_active_user),
-    activity_logs: ActivityServices = Depends(get_activity_service)
+    user: User = Depends(current_active_user)
 ) -> ReadProject:
     """
     Update a project by its ID in the database.
@@ -356,20 +409,11 @@ async def update_project(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail='Project not found',
             )
-        data={
-            "user_id": updated_project.user_id,
-            "team_id": updated_project.team_id,
-            "project_id": updated_project.id,
-            "description": f"Project with id {str(updated_project.id)} has been updated.",
-            "activity_type": ActivityType.UPDATE,
-            "entity": "project",
-            "entity_id": str(updated_project.id)
-        }
-
-        await activity_logs.create_activity(
-            activity_data=data
-        )
         return updated_project
+    except HTTPException as http_exc:
+        raise http_exc
+    except SQLAlchemyError:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -383,8 +427,7 @@ async def update_project(
 async def delete_project(
     project_id: uuid.UUID,
     project_services: ProjectServices = Depends(get_project_services),
-    user: User = Depends(current_active_user),
-    activity_logs: ActivityServices = Depends(get_activity_service)
+    user: User = Depends(current_active_user)
 ) -> None:
     """
     Delete a project by its ID from the database.
@@ -404,19 +447,10 @@ async def delete_project(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail='Project not found',
             )
-        data={
-            "user_id": deleted_project.user_id,
-            "team_id": deleted_project.team_id,
-            "project_id": deleted_project.id,
-            "description": f"Project with id {str(deleted_project.id)} has been deleted.",
-            "activity_type": ActivityType.DELETE,
-            "entity": "project",
-            "entity_id": str(deleted_project.id)
-        }
-
-        await activity_logs.create_activity(
-            activity_data=data
-        )
+    except HTTPException as http_exc:
+        raise http_exc
+    except SQLAlchemyError:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
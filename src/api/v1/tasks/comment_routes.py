@@ -3,25 +3,28 @@
 from typing import List, Optional
 import uuid
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.exc import SQLAlchemyError
 from src.models.user_models import User
 from src.services.task_services import TaskCommentService, get_task_comment_services
-from src.schemas.task_schemas import CreateTaskComment, ReadTaskComment, UpdateTaskComment
+from src.schemas.task_schemas import (
+    CreateTaskComment, ReadTaskComment, UpdateTaskComment, READ_TASK_COMMENT_LIST_ADAPTER
+)
 from src.api.v1.auth.auths import current_active_user
-from src.models.activity_models import ActivityType
-from src.services.activity_services import ActivityServices, get_activity_service
+from src.core.utils.bodies import json_body, json_body_openapi
+from src.core.utils.responses import json_list_response
 
 comment_router = APIRouter(tags=["task comments"])
 
 
 @comment_router.post(
     "/create/new", status_code=status.HTTP_201_CREATED,
-    response_model=Optional[ReadTaskComment]
+    response_model=Optional[ReadTaskComment],
+    openapi_extra=json_body_openapi(CreateTaskComment)
 )
 async def create_comment(
-    task: CreateTaskComment,
+    task: CreateTaskComment = Depends(json_body(CreateTaskComment)),
     comment_manager: TaskCommentService = Depends(get_task_comment_services),
-    user: User = Depends(current_active_user),
-    activity_logs: ActivityServices = Depends(get_activity_service)
+    user: User = Depends(current_active_user)
 ) -> Optional[ReadTaskComment]:
     """
     Create a new comment.
@@ -43,20 +46,11 @@ async def create_comment(
                 status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
                 detail="Error commenting on task"
             )
-        data={
-            "user_id": new_comment.user_id,
-            "comment_id": new_comment.id,
-            "task_id": new_comment.task_id,
-            "description": f"A new comment {str(new_comment.id)} has been created.",
-            "activity_type": ActivityType.CREATE,
-            "entity": "comment",
-            "entity_id": str(new_comment.id)
-        }
-
-        await activity_logs.create_activity(
-            activity_data=data
-        )
         return new_comment
+    except HTTPException as http_exc:
+        raise http_exc
+    except SQLAlchemyError:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -92,6 +86,10 @@ async def get_comment_by_id(
                 detail="Comment not found"
             )
         return comment
+    except HTTPException as http_exc:
+        raise http_exc
+    except SQLAlchemyError:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -129,7 +127,11 @@ async def get_comments_by_task_id(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Comments not found"
             )
-        return comments
+        return json_list_response(READ_TASK_COMMENT_LIST_ADAPTER, comments)
+    except HTTPException as http_exc:
+        raise http_exc
+    except SQLAlchemyError:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -145,8 +147,7 @@ async def update_comment(
     comment_id: uuid.UUID,
     comment: UpdateTaskComment,
     comment_manager: TaskCommentService = Depends(get_task_comment_services),
-    user: User = Depends(current_active_user),
-    activity_logs: ActivityServices = Depends(get_activity_service)
+    user: User = Depends(current_active_user)
 ) -> Optional[ReadTaskComment]:
     """
     Update a comment.
@@ -173,20 +174,11 @@ async def update_comment(
                 status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
                 detail="Error updating comment"
             )
-        data={
-            "user_id": updated_comment.user_id,
-            "comment_id": updated_comment.id,
-            "task_id": updated_comment.task_id,
-            "description": f"Comment with id {str(updated_comment.id)} has been updated.",
-            "activity_type": ActivityType.UPDATE,
-            "entity": "comment",
-            "entity_id": str(updated_comment.id)
-        }
-
-        await activity_logs.create_activity(
-            activity_data=data
-        )
         return updated_comment
+    except HTTPException as http_exc:
+        raise http_exc
+    except SQLAlchemyError:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -200,8 +192,7 @@ async def update_comment(
 async def delete_comment(
     comment_id: uuid.UUID,
     comment_manager: TaskCommentService = Depends(get_task_comment_services),
-    user: User = Depends(current_active_user),
-    activity_logs: ActivityServices = Depends(get_activity_service)
+    user: User = Depends(current_active_user)
 ) -> None:
     """
     Delete a comment by its ID.
@@ -224,20 +215,11 @@ async def delete_comment(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Comment not found"
             )
-        data={
-            "user_id": is_deleted.user_id,
-            "comment_id": comment_id,
-            "task_id": is_deleted.task_id,
-            "description": f"Comment with id {str(comment_id)} has been deleted.",
-            "activity_type": ActivityType.DELETE,
-            "entity": "comment",
-            "entity_id": str(comment_id)
-        }
-
-        await activity_logs.create_activity(
-            activity_data=data
-        )
         return
+    except HTTPException as http_exc:
+        raise http_exc
+    except SQLAlchemyError:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -4,25 +4,26 @@ from datetime import date
 from typing import List, Optional
 import uuid
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.exc import SQLAlchemyError
 from src.models.user_models import User
 from src.services.task_services import TaskServices, get_task_services
-from src.schemas.task_schemas import CreateTask, ReadTask, UpdateTask
+from src.schemas.task_schemas import CreateTask, ReadTask, UpdateTask, READ_TASK_LIST_ADAPTER
 from src.api.v1.auth.auths import current_active_user
-from src.models.activity_models import ActivityType
-from src.services.activity_services import ActivityServices, get_activity_service
+from src.core.utils.bodies import json_body, json_body_openapi
+from src.core.utils.pagination import Cursor, get_cursor, page_response
 
 task_router = APIRouter(tags=["tasks"])
 
 
 @task_router.post(
     "/create/new", status_code=status.HTTP_201_CREATED,
-    response_model=Optional[ReadTask]
+    response_model=Optional[ReadTask],
+    openapi_extra=json_body_openapi(CreateTask)
 )
 async def create_task(
-    task: CreateTask,
+    task: CreateTask = Depends(json_body(CreateTask)),
     task_manager: TaskServices = Depends(get_task_services),
-    user: User = Depends(current_active_user),
-    activity_logs: ActivityServices = Depends(get_activity_service)
+    user: User = Depends(current_active_user)
 ) -> Optional[ReadTask]:
     """
     Create a new task.
@@ -44,20 +45,11 @@ async def create_task(
                 status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
                 detail="Error creating task"
             )
-        data={
-            "user_id": new_task.user_id,
-            "task_id": new_task.id,
-            "project_id": new_task.project_id,
-            "description": f"A new Task with id {str(new_task.id)} has been created.",
-            "activity_type": ActivityType.CREATE,
-            "entity": "task",
-            "entity_id": str(new_task.id)
-        }
-
-        await activity_logs.create_activity(
-            activity_data=data
-        )
         return new_task
+    except HTTPException as http_exc:
+        raise http_exc
+    except SQLAlchemyError:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -72,6 +64,7 @@ async def create_task(
 async def get_all_tasks_by_project_id(
     project_id: uuid.UUID, order: str = Query(...),
     limit: int = Query(...), offset: int = Query(...),
+    cursor: Optional[Cursor] = Depends(get_cursor),
     task_manager: TaskServices = Depends(get_task_services),
     user: User = Depends(current_active_user)
 ) -> Optional[List[ReadTask]]:
@@ -83,6 +76,7 @@ async def get_all_tasks_by_project_id(
         order (str, optional): _description_. Defaults to Query(...).
         limit (int, optional): _description_. Defaults to Query(...).
         offset (int, optional): _description_. Defaults to Query(...).
+        cursor (Cursor, optional): The (created_at, id) of the last task already seen.
         task_manager (TaskServices, optional): Defaults to Depends(get_task_services).
         user (User, optional): Defaults to Depends(current_active_user).
 , user.id
@@ -92,14 +86,18 @@ async def get_all_tasks_by_project_id(
     try:
         tasks = await task_manager.get_tasks_by_project_id(
             project_id=project_id, user_id=user.id,
-            order=order, limit=limit, offset=offset
+            order=order, limit=limit, offset=offset, cursor=cursor
         )
         if not tasks:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="No tasks found for this project"
             )
-        return tasks
+        return page_response(READ_TASK_LIST_ADAPTER, tasks, limit)
+    except HTTPException as http_exc:
+        raise http_exc
+    except SQLAlchemyError:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -135,6 +133,10 @@ async def get_task_by_id(
                 detail="Task not found"
             )
         return task
+    except HTTPException as http_exc:
+        raise http_exc
+    except SQLAlchemyError:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -150,6 +152,8 @@ async def filter_tasks(
     project_id: uuid.UUID, task_status: Optional[str],
     task_priority: Optional[str], assignee_id: Optional[uuid.UUID],
     due_date: Optional[date],
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[Cursor] = Depends(get_cursor),
     task_manager: TaskServices = Depends(get_task_services),
     user: User = Depends(current_active_user)
 ) -> Optional[List[ReadTask]]:
@@ -162,21 +166,27 @@ async def filter_tasks(
         task_priority (str, optional): The priority of the tasks to filter by.
         assignee_id (uuid.UUID, optional): The ID of the assignee to filter tasks by.
         due_date (date, optional): The due date to filter tasks by.
+        limit (int): Maximum number of tasks to retrieve, at most 100.
+        cursor (Cursor, optional): The (created_at, id) of the last task already seen.
 
     Returns:
-        Optional[List[ReadTask]]: A list of tasks that match the filter criteria.
+        Optional[List[ReadTask]]: A page of tasks that match the filter criteria.
     """
     try:
         tasks = await task_manager.filter_tasks(
             project_id, task_status, task_priority,
-            user.id, assignee_id, due_date
+            user.id, assignee_id, due_date, limit=limit, cursor=cursor
         )
         if not tasks:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="No tasks found for this project"
             )
-        return tasks
+        return page_response(READ_TASK_LIST_ADAPTER, tasks, limit)
+    except HTTPException as http_exc:
+        raise http_exc
+    except SQLAlchemyError:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -192,8 +202,7 @@ async def update_task(
     task_id: uuid.UUID,
     task: UpdateTask,
     task_manager: TaskServices = Depends(get_task_services),
-    user: User = Depends(current_active_user),
-    activity_logs: ActivityServices = Depends(get_activity_service)
+    user: User = Depends(current_active_user)
 ) -> Optional[ReadTask]:
     """
     Update a task.
@@ -217,20 +226,11 @@ async def update_task(
                 status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
                 detail="Error updating task"
             )
-        data={
-            "user_id": updated_task.user_id,
-            "task_id": updated_task.id,
-            "project_id": updated_task.project_id,
-            "description": f"Task with id {str(updated_task.id)} has been updated.",
-            "activity_type": ActivityType.UPDATE,
-            "entity": "task",
-            "entity_id": str(updated_task.id)
-        }
-
-        await activity_logs.create_activity(
-            activity_data=data
-        )
         return updated_task
+    except HTTPException as http_exc:
+        raise http_exc
+    except SQLAlchemyError:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -245,8 +245,7 @@ async def update_task(
 async def delete_task(
     task_id: uuid.UUID,
     task_manager: TaskServices = Depends(get_task_services),
-    user: User = Depends(current_active_user),
-    activity_logs: ActivityServices = Depends(get_activity_service)
+    user: User = Depends(current_active_user)
 ) -> Optional[ReadTask]:
     """
     Delete a task.
@@ -266,20 +265,11 @@ async def delete_task(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Task not found"
             )
-        data={
-            "user_id": deleted_task.user_id,
-            "task_id": deleted_task.id,
-            "project_id": deleted_task.project_id,
-            "description": f"Task with id {str(deleted_task.id)} has been deleted.",
-            "activity_type": ActivityType.DELETE,
-            "entity": "task",
-            "entity_id": str(deleted_task.id)
-        }
-
-        await activity_logs.create_activity(
-            activity_data=data
-        )
         return
+    except HTTPException as http_exc:
+        raise http_exc
+    except SQLAlchemyError:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
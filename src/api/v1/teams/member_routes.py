@@ -3,12 +3,16 @@
 from typing import List, Optional
 import uuid
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.exc import SQLAlchemyError
 from src.models.user_models import User
 from src.services.team_services import TeamMemberServices, get_team_member_services
-from src.schemas.team_schemas import CreateTeamMember, ReadTeamMember
+from src.schemas.team_schemas import (
+    CreateTeamMember, CreateTeamMembers, ReadTeamMember, READ_TEAM_MEMBER_LIST_ADAPTER
+)
 from src.api.v1.auth.auths import current_active_user
+from src.core.utils.pagination import Cursor, get_cursor, page_response
 from src.models.activity_models import ActivityType
-from src.services.activity_services import ActivityServices, get_activity_service
+from src.services.activity_queue import activity_queue
 
 team_member_router = APIRouter(tags=["team members"])
 
@@ -20,8 +24,7 @@ team_member_router = APIRouter(tags=["team members"])
 async def create_team_member(
     team_member: CreateTeamMember,
     team_member_manager: TeamMemberServices = Depends(get_team_member_services),
-    user: User = Depends(current_active_user),
-    activity_logs: ActivityServices = Depends(get_activity_service)
+    user: User = Depends(current_active_user)
 ) -> ReadTeamMember:
     """
     Create a new team member.
@@ -56,13 +59,15 @@ async def create_team_member(
                             has been added to team {str(new_team_member.team_id)}.""",
             "activity_type": ActivityType.CREATE,
             "entity": "team_member",
-            "entity_id": str(new_team_member.id)
+            "entity_id": new_team_member.id
         }
 
-        await activity_logs.create_activity(
-            activity_data=data
-        )
+        activity_queue.put(data)
         return new_team_member
+    except HTTPException as http_exc:
+        raise http_exc
+    except SQLAlchemyError:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -70,6 +75,63 @@ async def create_team_member(
         ) from e
 
 
+@team_member_router.post(
+    "/add/batch", status_code=status.HTTP_201_CREATED,
+    response_model=List[ReadTeamMember]
+)
+async def create_team_members(
+    team_members: CreateTeamMembers,
+    team_member_manager: TeamMemberServices = Depends(get_team_member_services),
+    user: User = Depends(current_active_user)
+) -> List[ReadTeamMember]:
+    """
+    Add several members to a team at once.
+
+    Args:
+    team_members (CreateTeamMembers): The team and the users to add to it.
+
+    Returns:
+    List[ReadTeamMember]: The created team members.
+
+    Raises:
+    HTTPException: If the user is not authorized, or if a team member already exists.
+    """
+    try:
+        if not user:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED, detail="Unauthorized"
+            )
+        new_team_members = await team_member_manager.add_members_to_team(
+            team_owner_id=user.id,
+            team_id=team_members.team_id,
+            members=[{"user_id": user_id} for user_id in team_members.user_ids]
+        )
+        if not new_team_members:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT, detail="Team member already exists"
+            )
+        for new_team_member in new_team_members:
+            activity_queue.put({
+                "user_id": new_team_member.user_id,
+                "team_id": new_team_member.team_id,
+                "description": f"""User with id {str(new_team_member.user_id)}
+                            has been added to team {str(new_team_member.team_id)}.""",
+                "activity_type": ActivityType.CREATE,
+                "entity": "team_member",
+                "entity_id": new_team_member.id
+            })
+        return new_team_members
+    except HTTPException as http_exc:
+        raise http_exc
+    except SQLAlchemyError:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="An error occurred while creating the team members"
+        ) from e
+
+
 @team_member_router.get(
     "/all", status_code=status.HTTP_200_OK,
     response_model=List[ReadTeamMember]
@@ -78,6 +140,7 @@ async def get_all_team_members(
     team_id: uuid.UUID, owner_id: Optional[uuid.UUID] = None,
     order: Optional[str] = "asc",
     limit: Optional[int] = 10, offset: Optional[int] = 0,
+    cursor: Optional[Cursor] = Depends(get_cursor),
     team_member_manager: TeamMemberServices = Depends(get_team_member_services),
     user: User = Depends(current_active_user)
 ) -> List[ReadTeamMember]:
@@ -90,6 +153,7 @@ async def get_all_team_members(
     order (str): Order of the team members (asc or desc).
     limit (int): Maximum number of team members to retrieve.
     offset (int): Number of team members to skip.
+    cursor (Cursor): The (created_at, id) of the last team member already seen.
 
     Returns:
     List[ReadTeamMember]: A list of all team members.
@@ -106,14 +170,18 @@ async def get_all_team_members(
                 )
             team_members = await team_member_manager.get_team_members(
                 team_id=team_id, team_owner_id=owner_id,
-                order=order, limit=limit, offset=offset
+                order=order, limit=limit, offset=offset, cursor=cursor
             )
-            return team_members
+            return page_response(READ_TEAM_MEMBER_LIST_ADAPTER, team_members, limit)
         team_members = await team_member_manager.get_team_members(
                 team_id=team_id, team_owner_id=user.id,
-                order=order, limit=limit, offset=offset
+                order=order, limit=limit, offset=offset, cursor=cursor
             )
-        return team_members
+        return page_response(READ_TEAM_MEMBER_LIST_ADAPTER, team_members, limit)
+    except HTTPException as http_exc:
+        raise http_exc
+    except SQLAlchemyError:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -170,6 +238,8 @@ async def get_team_member_by_id(
         return team_member
     except HTTPException as http_exc:
         raise http_exc
+    except SQLAlchemyError:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -184,8 +254,7 @@ async def get_team_member_by_id(
 async def delete_team_member_by_id(
     team_member_id: uuid.UUID, team_id: uuid.UUID,
     team_member_manager: TeamMemberServices = Depends(get_team_member_services),
-    user: User = Depends(current_active_user),
-    activity_logs: ActivityServices = Depends(get_activity_service)
+    user: User = Depends(current_active_user)
 ):
     """
     Delete a team member by its ID from the database.
@@ -216,12 +285,14 @@ async def delete_team_member_by_id(
                             has been removed from team {str(team_id)}.""",
             "activity_type": ActivityType.DELETE,
             "entity": "team_member",
-            "entity_id": str(team_member_id)
+            "entity_id": team_member_id
         }
-        await activity_logs.create_activity(
-            activity_data=data
-        )
+        activity_queue.put(data)
         return
+    except HTTPException as http_exc:
+        raise http_exc
+    except SQLAlchemyError:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
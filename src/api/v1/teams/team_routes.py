@@ -1,18 +1,45 @@
 """Team routes."""
 
-from typing import List, Optional
+from typing import Annotated, List, Optional
 import uuid
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Path, Query, status
+from sqlalchemy.exc import SQLAlchemyError
 from src.models.user_models import User
 from src.services.team_services import TeamServices, get_team_services
-from src.schemas.team_schemas import CreateTeam, ReadTeam, UpdateTeam
+from src.schemas.team_schemas import CreateTeam, ReadTeam, UpdateTeam, READ_TEAM_LIST_ADAPTER
 from src.api.v1.auth.auths import current_active_user
+from src.core.utils.pagination import Cursor, get_cursor, page_response
 from src.models.activity_models import ActivityType
-from src.services.activity_services import ActivityServices, get_activity_service
+from src.services.activity_queue import activity_queue
 
 team_router = APIRouter(tags=["teams"])
 
 
+# A plain str parsed by _parse_team_id, still documented as a UUID.
+TeamIdPath = Annotated[str, Path(json_schema_extra={"format": "uuid"})]
+
+
+def _parse_team_id(team_id: str) -> uuid.UUID:
+    """
+    Parse a team ID path parameter without going through Pydantic.
+
+    Args:
+    team_id (str): The raw team ID from the request path.
+
+    Returns:
+    uuid.UUID: The parsed team ID.
+
+    Raises:
+    HTTPException: If the team ID is not a valid UUID.
+    """
+    try:
+        return uuid.UUID(team_id)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="Invalid team ID"
+        ) from e
+
+
 @team_router.post(
     "/create/new", status_code=status.HTTP_201_CREATED,
     response_model=ReadTeam
@@ -20,8 +47,7 @@ team_router = APIRouter(tags=["teams"])
 async def create_team(
     team: CreateTeam,
     team_manager: TeamServices = Depends(get_team_services),
-    user: User = Depends(current_active_user),
-    activity_logs: ActivityServices = Depends(get_activity_service)
+    user: User = Depends(current_active_user)
 ) -> ReadTeam:
     """
     Create a new team.
@@ -54,19 +80,20 @@ async def create_team(
             "description": f"Team {str(new_team.id)} has been created.",
             "activity_type": ActivityType.CREATE,
             "entity": "team",
-            "entity_id": str(new_team.id)
+            "entity_id": new_team.id
         }
 
-        await activity_logs.create_activity(
-            activity_data=data
-        )
+        activity_queue.put(data)
         return new_team
+    except HTTPException as http_exc:
+        raise http_exc
+    except SQLAlchemyError:
+        raise
     except Exception as e:
-        print(e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="An error occurred while creating the team"
-        )
+        ) from e
 
 
 @team_router.get(
@@ -77,6 +104,7 @@ async def get_all_teams(
     owner_id: Optional[uuid.UUID] = None,
     order: Optional[str] = "asc",
     limit: Optional[int] = 10, offset: Optional[int] = 0,
+    cursor: Optional[Cursor] = Depends(get_cursor),
     team_manager: TeamServices = Depends(get_team_services),
     user: User = Depends(current_active_user)
 ) -> Optional[List[ReadTeam]]:
@@ -87,6 +115,7 @@ async def get_all_teams(
     order (str): Order of the teams (asc or desc).
     limit (int): Maximum number of teams to retrieve.
     offset (int): Number of teams to skip.
+    cursor (Cursor): The (created_at, id) of the last team already seen.
 
     Returns:
     List[ReadTeam]: A list of teams.
@@ -102,13 +131,17 @@ async def get_all_teams(
                     detail="Owner ID is required for superusers"
                 )
             teams = await team_manager.get_all_teams(
-                owner_id=owner_id, order=order, limit=limit, offset=offset
+                owner_id=owner_id, order=order, limit=limit, offset=offset, cursor=cursor
             )
-            return teams
+            return page_response(READ_TEAM_LIST_ADAPTER, teams, limit)
         teams = await team_manager.get_all_teams(
-            owner_id=user.id, order=order, limit=limit, offset=offset
+            owner_id=user.id, order=order, limit=limit, offset=offset, cursor=cursor
         )
-        return teams
+        return page_response(READ_TEAM_LIST_ADAPTER, teams, limit)
+    except HTTPException as http_exc:
+        raise http_exc
+    except SQLAlchemyError:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -121,7 +154,7 @@ async def get_all_teams(
     response_model=Optional[ReadTeam]
 )
 async def get_team_by_id(
-    team_id: uuid.UUID, owner_id: Optional[uuid.UUID] = None,
+    team_id: TeamIdPath, owner_id: Optional[uuid.UUID] = None,
     team_manager: TeamServices = Depends(get_team_services),
     user: User = Depends(current_active_user)
 ) -> Optional[ReadTeam]:
@@ -137,6 +170,7 @@ async def get_team_by_id(
     Raises:
     HTTPException: If the user is not authorized, or if the team is not found.
     """
+    team_id = _parse_team_id(team_id)
     try:
         if user.is_superuser and user.role == "admin":
             if not owner_id:
@@ -158,6 +192,10 @@ async def get_team_by_id(
                 status_code=status.HTTP_404_NOT_FOUND, detail="Team not found"
             )
         return team
+    except HTTPException as http_exc:
+        raise http_exc
+    except SQLAlchemyError:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -212,6 +250,10 @@ async def get_user_team_by_name(
                     status_code=status.HTTP_404_NOT_FOUND, detail="Team not found"
                 )
             return team
+    except HTTPException as http_exc:
+        raise http_exc
+    except SQLAlchemyError:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -249,6 +291,10 @@ async def get_user_team_by_id(
                 status_code=status.HTTP_404_NOT_FOUND, detail="Team not found"
             )
         return team
+    except HTTPException as http_exc:
+        raise http_exc
+    except SQLAlchemyError:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -280,6 +326,10 @@ async def get_user_total_teams(
     try:
         total_teams = await team_manager.get_total_teams(user_id=user.id)
         return total_teams
+    except HTTPException as http_exc:
+        raise http_exc
+    except SQLAlchemyError:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -291,7 +341,7 @@ async def get_user_total_teams(
     "/{team_id}/total/members", status_code=status.HTTP_200_OK,
 )
 async def get_total_members(
-    team_id: uuid.UUID,
+    team_id: TeamIdPath,
     team_manager: TeamServices = Depends(get_team_services),
     user: User = Depends(current_active_user)
 ) -> int:
@@ -308,9 +358,14 @@ async def get_total_members(
     HTTPException: If the user is not authorized, or if an error occurs while
                    retrieving the total number of members.
     """
+    team_id = _parse_team_id(team_id)
     try:
         total_members = await team_manager.get_total_members(team_id=team_id)
         return total_members
+    except HTTPException as http_exc:
+        raise http_exc
+    except SQLAlchemyError:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -323,10 +378,9 @@ async def get_total_members(
     response_model=ReadTeam
 )
 async def update_team(
-    team_id: uuid.UUID, team: UpdateTeam,
+    team_id: TeamIdPath, team: UpdateTeam,
     team_manager: TeamServices = Depends(get_team_services),
-    user: User = Depends(current_active_user),
-    activity_logs: ActivityServices = Depends(get_activity_service)
+    user: User = Depends(current_active_user)
 ) -> ReadTeam:
     """
     Update a team by its ID in the database.
@@ -341,6 +395,7 @@ async def update_team(
     Raises:
     HTTPException: If the user is not authorized, or if an error occurs.
     """
+    team_id = _parse_team_id(team_id)
     try:
         updated_team = await team_manager.update_team(
             team_id=team_id, user_id=user.id, data=team.model_dump()
@@ -356,13 +411,15 @@ async def update_team(
             "description": f"Team {str(updated_team.id)} has been updated.",
             "activity_type": ActivityType.UPDATE,
             "entity": "team",
-            "entity_id": str(updated_team.id)
+            "entity_id": updated_team.id
         }
 
-        await activity_logs.create_activity(
-            activity_data=activity_data
-        )
+        activity_queue.put(activity_data)
         return updated_team
+    except HTTPException as http_exc:
+        raise http_exc
+    except SQLAlchemyError:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -374,10 +431,9 @@ async def update_team(
     "/{team_id}/delete/team", status_code=status.HTTP_204_NO_CONTENT
 )
 async def delete_team(
-    team_id: uuid.UUID,
+    team_id: TeamIdPath,
     team_manager: TeamServices = Depends(get_team_services),
-    user: User = Depends(current_active_user),
-    activity_logs: ActivityServices = Depends(get_activity_service)
+    user: User = Depends(current_active_user)
 ) -> None:
     """
     Delete a team by its ID from the database.
@@ -388,25 +444,27 @@ async def delete_team(
     Raises:
     HTTPException: If the team is not found or if an error occurs during deletion.
     """
-
+    team_id = _parse_team_id(team_id)
     try:
         deleted_team = await team_manager.delete_team(team_id=team_id, user_id=user.id)
         if not deleted_team:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="Team not found"
             )
+        # team_id is left unset: the row has just been deleted.
         data={
             "user_id": user.id,
-            "team_id": team_id,
             "description": f"Team {str(team_id)} has been deleted.",
             "activity_type": ActivityType.DELETE,
             "entity": "team",
-            "entity_id": str(team_id)
+            "entity_id": team_id
         }
 
-        await activity_logs.create_activity(
-            activity_data=data
-        )
+        activity_queue.put(data)
+    except HTTPException as http_exc:
+        raise http_exc
+    except SQLAlchemyError:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
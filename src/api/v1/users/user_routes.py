@@ -2,24 +2,27 @@
 
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.exc import SQLAlchemyError
 from src.models.user_models import User
-from src.services.user_services import UserManager, get_user_db
-from src.schemas.user_schemas import UserRead
+from src.services.user_services import UserManager, get_user_manager
+from src.schemas.user_schemas import UserRead, USER_READ_LIST_ADAPTER
 from src.api.v1.auth.auths import current_active_user
+from src.core.utils.pagination import Cursor, get_cursor, page_response
 
 user_router = APIRouter(tags=["users"])
 
 
 @user_router.get(
     "/users", status_code=status.HTTP_200_OK,
-    response_model=Optional[UserRead]
+    response_model=List[UserRead]
 )
 async def get_all_users(
     order: str = Query(...),
     limit: int = Query(...), offset: int = Query(...),
-    user_manager: UserManager = Depends(get_user_db),
+    cursor: Optional[Cursor] = Depends(get_cursor),
+    user_manager: UserManager = Depends(get_user_manager),
     user: User = Depends(current_active_user)
-) -> Optional[UserRead]:
+) -> List[UserRead]:
     """
     Retrieve all users from the database.
 
@@ -27,6 +30,7 @@ async def get_all_users(
         order (str): Order of the users (asc or desc).
         limit (int): Maximum number of users to retrieve.
         offset (int): Number of users to skip.
+        cursor (Cursor): The (created_at, id) of the last user already seen.
 
     Returns:
         List[User]: A list of users both admin and non-admin.
@@ -37,9 +41,13 @@ async def get_all_users(
                 status_code=status.HTTP_401_UNAUTHORIZED, detail="Unauthorized"
             )
         users = await user_manager.get_all_users(
-            order=order, limit=limit, offset=offset
+            order=order, limit=limit, offset=offset, cursor=cursor
         )
-        return users
+        return page_response(USER_READ_LIST_ADAPTER, users, limit)
+    except HTTPException as http_exc:
+        raise http_exc
+    except SQLAlchemyError:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -54,7 +62,8 @@ async def get_all_users(
 async def get_all_admins(
     order: str = Query(...),
     limit: int = Query(...), offset: int = Query(...),
-    user_manager: UserManager = Depends(get_user_db),
+    cursor: Optional[Cursor] = Depends(get_cursor),
+    user_manager: UserManager = Depends(get_user_manager),
     user: User = Depends(current_active_user)
 ) -> List[UserRead]:
     """
@@ -64,6 +73,7 @@ async def get_all_admins(
         order (str): Order of the users (asc or desc).
         limit (int): Maximum number of users to retrieve.
         offset (int): Number of users to skip.
+        cursor (Cursor): The (created_at, id) of the last user already seen.
 
     Returns:
         List[User]: A list of admin users.
@@ -74,9 +84,13 @@ async def get_all_admins(
                 status_code=status.HTTP_401_UNAUTHORIZED, detail="Unauthorized"
             )
         admins = await user_manager.get_all_admins(
-            order=order, limit=limit, offset=offset
+            order=order, limit=limit, offset=offset, cursor=cursor
         )
-        return admins
+        return page_response(USER_READ_LIST_ADAPTER, admins, limit)
+    except HTTPException as http_exc:
+        raise http_exc
+    except SQLAlchemyError:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -91,7 +105,8 @@ async def get_all_admins(
 async def get_all_members(
     order: str = Query(...),
     limit: int = Query(...), offset: int = Query(...),
-    user_manager: UserManager = Depends(get_user_db),
+    cursor: Optional[Cursor] = Depends(get_cursor),
+    user_manager: UserManager = Depends(get_user_manager),
     user: User = Depends(current_active_user)
 ) -> List[UserRead]:
     """
@@ -101,6 +116,7 @@ async def get_all_members(
         order (str): Order of the users (asc or desc).
         limit (int): Maximum number of users to retrieve.
         offset (int): Number of users to skip.
+        cursor (Cursor): The (created_at, id) of the last user already seen.
 
     Returns:
         List[User]: A list of member users.
@@ -111,9 +127,13 @@ async def get_all_members(
                 status_code=status.HTTP_401_UNAUTHORIZED, detail="Unauthorized"
             )
         members = await user_manager.get_all_members(
-            order=order, limit=limit, offset=offset
+            order=order, limit=limit, offset=offset, cursor=cursor
         )
-        return members
+        return page_response(USER_READ_LIST_ADAPTER, members, limit)
+    except HTTPException as http_exc:
+        raise http_exc
+    except SQLAlchemyError:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -15,6 +15,7 @@ class Settings(BaseSettings):
     OAUTH_SECRET : str
     ACCESS_TOKEN_EXPIRY_WEEKS : int
     ALGORITHM : str
+    ALLOWED_ORIGINS : list[str] = []
 
     model_config = SettingsConfigDict(
         env_file="./.env",
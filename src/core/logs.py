@@ -0,0 +1,33 @@
+"""Logging setup for the Manager API."""
+
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+
+def start_logging(level: int = logging.INFO) -> QueueListener:
+    """
+    Route the app's log records through a queue to a background thread.
+
+    Handlers on the event loop only enqueue records; formatting and the
+    blocking write to stderr happen on the listener's thread.
+
+    Args:
+    level (int): The level for the "src" loggers.
+
+    Returns:
+    QueueListener: The started listener, to be stopped on shutdown.
+    """
+    records: queue.SimpleQueue = queue.SimpleQueue()
+    stream = logging.StreamHandler()
+    stream.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+    listener = QueueListener(records, stream, respect_handler_level=True)
+
+    logger = logging.getLogger("src")
+    logger.setLevel(level)
+    # Replaces the handler left by any earlier start, e.g. between test apps.
+    logger.handlers = [QueueHandler(records)]
+    logger.propagate = False
+
+    listener.start()
+    return listener
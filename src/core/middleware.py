@@ -0,0 +1,135 @@
+"""ASGI middlewares for the Manager API."""
+
+from collections.abc import Sequence
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+class PureCORSMiddleware:
+    """
+    CORS middleware written directly against the ASGI interface.
+
+    Every header value is encoded once at construction time, preflight
+    requests are answered without reaching the app, and actual requests only
+    get their response start message patched, so no Request/Response objects
+    are built per request.
+    """
+
+    def __init__(
+        self, app: ASGIApp,
+        allow_origins: Sequence[str] = (),
+        allow_methods: Sequence[str] = ("GET",),
+        allow_headers: Sequence[str] = (),
+        allow_credentials: bool = False,
+        max_age: int = 600,
+    ):
+        """
+        Initialize the PureCORSMiddleware.
+
+        Args:
+        app (ASGIApp): The ASGI application to wrap.
+        allow_origins (Sequence[str]): Origins allowed to make cross-origin requests.
+        allow_methods (Sequence[str]): Methods allowed for cross-origin requests.
+        allow_headers (Sequence[str]): Request headers allowed for cross-origin requests.
+        allow_credentials (bool): Whether cookies are supported for cross-origin requests.
+        max_age (int): Seconds browsers may cache a preflight response.
+        """
+        if "*" in allow_methods:
+            allow_methods = ("DELETE", "GET", "HEAD", "OPTIONS", "PATCH", "POST", "PUT")
+
+        self.app = app
+        self.allow_all_origins = "*" in allow_origins
+        self.allow_all_headers = "*" in allow_headers
+        self.allow_origins = frozenset(allow_origins)
+        self.allow_credentials = allow_credentials
+        self.allow_methods = frozenset(allow_methods)
+
+        # Origins are echoed back whenever the response depends on them.
+        self.echo_origin = not self.allow_all_origins or allow_credentials
+
+        simple_headers = []
+        if self.allow_all_origins and not allow_credentials:
+            simple_headers.append((b"access-control-allow-origin", b"*"))
+        if allow_credentials:
+            simple_headers.append((b"access-control-allow-credentials", b"true"))
+        self.simple_headers = simple_headers
+
+        preflight_headers = list(simple_headers)
+        preflight_headers += [
+            (b"access-control-allow-methods", ", ".join(sorted(self.allow_methods)).encode()),
+            (b"access-control-max-age", str(max_age).encode()),
+        ]
+        if allow_headers and not self.allow_all_headers:
+            preflight_headers.append(
+                (b"access-control-allow-headers", ", ".join(allow_headers).encode())
+            )
+        if self.echo_origin:
+            preflight_headers.append((b"vary", b"Origin"))
+        self.preflight_headers = preflight_headers
+
+    def is_allowed_origin(self, origin: str) -> bool:
+        """Return True if the origin may make cross-origin requests."""
+        return self.allow_all_origins or origin in self.allow_origins
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle an ASGI connection."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        origin = headers.get("origin")
+        if origin is None:
+            await self.app(scope, receive, send)
+            return
+
+        if scope["method"] == "OPTIONS" and "access-control-request-method" in headers:
+            await self.preflight_response(headers, origin, send)
+            return
+
+        if not self.is_allowed_origin(origin):
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_cors(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                response_headers = MutableHeaders(scope=message)
+                response_headers.raw.extend(self.simple_headers)
+                if self.echo_origin:
+                    response_headers.raw.append(
+                        (b"access-control-allow-origin", origin.encode("latin-1"))
+                    )
+                    response_headers.add_vary_header("Origin")
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
+
+    async def preflight_response(self, headers: Headers, origin: str, send: Send) -> None:
+        """
+        Answer a CORS preflight request without calling the app.
+
+        Args:
+        headers (Headers): The request headers.
+        origin (str): The request's Origin header.
+        send (Send): The ASGI send callable.
+        """
+        if not self.is_allowed_origin(origin) or (
+            headers["access-control-request-method"] not in self.allow_methods
+        ):
+            await send({
+                "type": "http.response.start", "status": 400,
+                "headers": [(b"content-type", b"text/plain; charset=utf-8")]
+            })
+            await send({"type": "http.response.body", "body": b"Disallowed CORS request"})
+            return
+
+        response_headers = list(self.preflight_headers)
+        if self.echo_origin:
+            response_headers.append((b"access-control-allow-origin", origin.encode("latin-1")))
+        requested_headers = headers.get("access-control-request-headers")
+        if self.allow_all_headers and requested_headers:
+            response_headers.append(
+                (b"access-control-allow-headers", requested_headers.encode("latin-1"))
+            )
+        await send({"type": "http.response.start", "status": 204, "headers": response_headers})
+        await send({"type": "http.response.body", "body": b""})
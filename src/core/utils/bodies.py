@@ -0,0 +1,83 @@
+"""Request body utils."""
+
+from typing import Awaitable, Callable, TypeVar
+from fastapi import Request
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel, ValidationError
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+# Request body schemas referenced by json_body_openapi. They are added to
+# the OpenAPI components by add_json_body_schemas when the OpenAPI schema is
+# first generated, so the models can stay deferred until then.
+JSON_BODY_SCHEMAS: dict[str, type[BaseModel]] = {}
+
+
+def json_body(schema: type[ModelT]) -> Callable[[Request], Awaitable[ModelT]]:
+    """
+    Build a dependency that validates the raw JSON request body against a schema.
+
+    The body bytes go straight to model_validate_json, so parsing and
+    validation, UUIDs included, happen in one pass in pydantic-core instead
+    of json.loads followed by validation of the resulting dict.
+
+    Args:
+    schema (type[BaseModel]): The schema of the request body.
+
+    Returns:
+    Callable: The dependency returning the validated body.
+    """
+    async def parse_body(request: Request) -> ModelT:
+        try:
+            return schema.model_validate_json(await request.body())
+        except ValidationError as e:
+            raise RequestValidationError([
+                {**error, "loc": ("body", *error["loc"])}
+                for error in e.errors(include_url=False)
+            ]) from e
+
+    return parse_body
+
+
+def json_body_openapi(schema: type[BaseModel]) -> dict:
+    """
+    Describe a json_body request body for the OpenAPI schema.
+
+    The body refers to the schema by name; its definition is added by
+    add_json_body_schemas, so the model is not built at import time.
+
+    Args:
+    schema (type[BaseModel]): The schema of the request body.
+
+    Returns:
+    dict: The openapi_extra for the route.
+    """
+    JSON_BODY_SCHEMAS[schema.__name__] = schema
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {
+                    "schema": {"$ref": f"#/components/schemas/{schema.__name__}"}
+                }
+            },
+        }
+    }
+
+
+def add_json_body_schemas(openapi_schema: dict) -> dict:
+    """
+    Add the schemas referenced by json_body_openapi to an OpenAPI schema.
+
+    Args:
+    openapi_schema (dict): The generated OpenAPI schema.
+
+    Returns:
+    dict: The same schema, with the request body schemas in its components.
+    """
+    components = openapi_schema.setdefault("components", {}).setdefault("schemas", {})
+    for name, schema in JSON_BODY_SCHEMAS.items():
+        json_schema = schema.model_json_schema(ref_template="#/components/schemas/{model}")
+        components.update(json_schema.pop("$defs", {}))
+        components[name] = json_schema
+    return openapi_schema
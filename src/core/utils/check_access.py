@@ -4,7 +4,46 @@ from functools import wraps
 from fastapi import HTTPException
 from src.models import project_models, team_models, task_models
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import bindparam, exists, or_, select
+
+Project = project_models.Project
+Task = task_models.Task
+Team = team_models.Team
+TeamMember = team_models.TeamMember
+
+
+def _team_access(team_id, user_id):
+    """Build the clause that holds when the user owns or is a member of the team."""
+    return or_(
+        exists().where(Team.id == team_id, Team.user_id == user_id),
+        exists().where(TeamMember.team_id == team_id, TeamMember.user_id == user_id),
+    )
+
+
+# (row exists, user may access it), answered together in one round trip
+# without loading either row.
+_PROJECT_ACCESS = select(
+    exists().where(Project.id == bindparam("project_id")),
+    exists().where(
+        Project.id == bindparam("project_id"),
+        or_(
+            Project.user_id == bindparam("user_id"),
+            _team_access(Project.team_id, bindparam("user_id")),
+        ),
+    ),
+)
+_TASK_ACCESS = select(
+    exists().where(Task.id == bindparam("task_id")),
+    exists().where(
+        Task.id == bindparam("task_id"),
+        Project.id == Task.project_id,
+        or_(
+            Task.assigned_id == bindparam("user_id"),
+            Task.user_id == bindparam("user_id"),
+            _team_access(Project.team_id, bindparam("user_id")),
+        ),
+    ),
+)
 
 
 def require_project_access(project_arg: str, user_arg: str):
@@ -22,20 +61,13 @@ def require_project_access(project_arg: str, user_arg: str):
 
             # Access check
             session: AsyncSession = self.session
-            project = (await session.execute(select(
-                project_models.Project
-            ).where(project_models.Project.id == project_id))).scalar_one_or_none()
-            if project is None:
+            found, allowed = (await session.execute(
+                _PROJECT_ACCESS, {"project_id": project_id, "user_id": user_id}
+            )).one()
+            if not found:
                 raise HTTPException(status_code=404, detail="Project not found")
-
-            if project.owner_id != user_id:
-                membership = (await session.execute(select(team_models.Team).where(
-                    team_models.Team.projects.any(project_models.Project.id == project_id),
-                    team_models.Team.user_id == user_id
-                ))).scalar_one_or_none()
-
-                if membership is None:
-                    raise HTTPException(status_code=403, detail="Access denied to project")
+            if not allowed:
+                raise HTTPException(status_code=403, detail="Access denied to project")
 
             return await func(self, *args, **kwargs)
 
@@ -45,7 +77,7 @@ def require_project_access(project_arg: str, user_arg: str):
 
 def require_task_access(task_arg: str, user_arg: str):
     """
-    Decorator to ensure the user has access to a task (assigned to the user).
+    Decorator to ensure the user has access to a task (assignee, creator or team member).
     `task_arg` and `user_arg` are the argument names in the function signature.
     """
     def decorator(func):
@@ -58,19 +90,13 @@ def require_task_access(task_arg: str, user_arg: str):
 
             # Access check
             session: AsyncSession = self.session
-            task = (await session.execute(select(task_models.Task).where(
-                task_models.Task.id == task_id
-            ))).scalar_one_or_none()
-            if task is None:
+            found, allowed = (await session.execute(
+                _TASK_ACCESS, {"task_id": task_id, "user_id": user_id}
+            )).one()
+            if not found:
                 raise HTTPException(status_code=404, detail="Task not found")
-
-            if task.assigned_id != user_id:
-                membership = (await session.execute(select(team_models.TeamMember).where(
-                    team_models.Team.members.any(team_models.TeamMember.id == user_id)
-                ))).scalar_one_or_none()
-
-                if membership is None:
-                    raise HTTPException(status_code=403, detail="Access denied to task")
+            if not allowed:
+                raise HTTPException(status_code=403, detail="Access denied to task")
 
             return await func(self, *args, **kwargs)
 
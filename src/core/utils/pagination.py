@@ -0,0 +1,81 @@
+"""Keyset pagination utils."""
+
+import uuid
+from datetime import datetime
+from typing import Any, Optional, Sequence
+from fastapi import HTTPException, Response, status
+from pydantic import TypeAdapter
+from sqlalchemy import ColumnElement, tuple_
+from src.core.utils.responses import json_list_response
+
+Cursor = tuple[datetime, uuid.UUID]
+
+
+def get_cursor(
+    cursor_created_at: Optional[datetime] = None, cursor_id: Optional[uuid.UUID] = None
+) -> Optional[Cursor]:
+    """
+    Read the keyset pagination cursor from the query string.
+
+    Args:
+    cursor_created_at (datetime): created_at of the last row already seen.
+    cursor_id (uuid.UUID): ID of the last row already seen.
+
+    Returns:
+    Cursor: The cursor, or None to start from the first page.
+    """
+    if cursor_created_at is None and cursor_id is None:
+        return None
+    if cursor_created_at is None or cursor_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="cursor_created_at and cursor_id must be given together"
+        )
+    return cursor_created_at, cursor_id
+
+
+def after_cursor(created_at: Any, id_: Any, cursor: Cursor, order: str) -> ColumnElement[bool]:
+    """
+    Build the WHERE clause that starts a page right after the cursor.
+
+    Comparing the (created_at, id) row value lets Postgres seek into a
+    (..., created_at, id) index instead of scanning and discarding an offset.
+
+    Args:
+    created_at: The created_at column of the paginated table.
+    id_: The primary key column of the paginated table.
+    cursor (Cursor): The (created_at, id) of the last row already seen.
+    order (str): Order of the rows by creation time (asc or desc).
+
+    Returns:
+    ColumnElement: The keyset condition.
+    """
+    position = tuple_(created_at, id_)
+    return position < cursor if order == "desc" else position > cursor
+
+
+def page_response(
+    adapter: TypeAdapter, items: Sequence[Any], limit: int, **dump_options
+) -> Response:
+    """
+    Serialize a page of rows, pointing to the next page when there may be one.
+
+    The next cursor is returned in the X-Next-Cursor-Created-At and
+    X-Next-Cursor-Id headers, to be passed back as cursor_created_at and
+    cursor_id.
+
+    Args:
+    adapter (TypeAdapter): The list adapter for the response schema.
+    items (Sequence[Any]): The page of rows.
+    limit (int): The requested page size.
+    dump_options: Extra options for dump_json, e.g. exclude_none.
+
+    Returns:
+    Response: The JSON response.
+    """
+    response = json_list_response(adapter, items, **dump_options)
+    if items and len(items) == limit:
+        last = items[-1]
+        response.headers["X-Next-Cursor-Created-At"] = last.created_at.isoformat()
+        response.headers["X-Next-Cursor-Id"] = str(last.id)
+    return response
@@ -0,0 +1,24 @@
+"""Response utils."""
+
+from typing import Any, Iterable
+from fastapi import Response
+from pydantic import TypeAdapter
+
+
+def json_list_response(adapter: TypeAdapter, items: Iterable[Any], **dump_options) -> Response:
+    """
+    Validate a list of ORM rows and serialize it straight to a JSON response.
+
+    The adapter's core schema is built once, and dump_json writes bytes
+    without going through an intermediate list of dicts.
+
+    Args:
+    adapter (TypeAdapter): The list adapter for the response schema.
+    items (Iterable[Any]): The rows to serialize.
+    dump_options: Extra options for dump_json, e.g. exclude_none.
+
+    Returns:
+    Response: The JSON response.
+    """
+    content = adapter.dump_json(adapter.validate_python(items), **dump_options)
+    return Response(content=content, media_type="application/json")
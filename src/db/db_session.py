@@ -2,11 +2,19 @@
 
 import asyncio
 import urllib.parse
+from asyncio import current_task
 from collections.abc import AsyncGenerator
+from contextlib import AsyncExitStack
 from sqlmodel import text
 from sqlalchemy.exc import OperationalError
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine, AsyncSession, async_scoped_session, async_sessionmaker,
+    create_async_engine
+)
 from src.core.configs import settings
+from src.db.triggers import install_activity_triggers
+from src.db.upgrades import upgrade_schema
 from src.models.user_models import Base
 
 PASSWORD = urllib.parse.quote(settings.PASSWORD, safe="")
@@ -20,10 +28,18 @@ else:
 
 engine = create_async_engine(
     DB_URL,
-    echo=True,
-    pool_pre_ping=True
+    echo=settings.ENV == "dev",
+    poolclass=AsyncAdaptedQueuePool,
+    pool_size=20,
+    max_overflow=10,
+    pool_timeout=30,
+    pool_pre_ping=True,
+    pool_recycle=1800,
+    query_cache_size=1200,
+    connect_args={"prepared_statement_cache_size": 500}
 )
 async_session_maker = async_sessionmaker(engine, expire_on_commit=False)
+AsyncScopedSession = async_scoped_session(async_session_maker, scopefunc=current_task)
 
 
 async def init_db():
@@ -33,7 +49,8 @@ async def init_db():
     This function establishes a connection to the database engine and executes
     SQL commands to create the 'pgcrypto' extension if it does not exist. It 
     then synchronously runs the metadata's create_all method to create all 
-    tables defined in the ORM models.
+    tables defined in the ORM models, brings tables created by older versions
+    up to date, and installs the activity log triggers.
 
     The function is asynchronous and should be awaited to ensure that the 
     operations complete successfully before proceeding.
@@ -45,6 +62,8 @@ async def init_db():
                 extension = text("CREATE EXTENSION IF NOT EXISTS pgcrypto")
                 await conn.execute(extension)
                 await conn.run_sync(Base.metadata.create_all)
+                await upgrade_schema(conn)
+                await install_activity_triggers(conn)
                 break
         except OperationalError as e:
             if attempt == 9:
@@ -54,6 +73,36 @@ async def init_db():
             raise RuntimeError("Database connection failed after 10 attempts")
 
 
+async def warm_pool(size: int = 5, bind: AsyncEngine = engine):
+    """
+    Open `size` pooled connections up front so early requests don't pay for them.
+
+    The connections are held open at the same time, forcing the pool to
+    create distinct connections, and then returned to the pool.
+
+    Args:
+    size (int): The number of connections to open.
+    bind (AsyncEngine): The engine whose pool to warm.
+    """
+    async with AsyncExitStack() as stack:
+        for _ in range(size):
+            conn = await stack.enter_async_context(bind.connect())
+            await conn.execute(text("SELECT 1"))
+
+
+def get_session_maker() -> async_sessionmaker[AsyncSession]:
+    """
+    Dependency providing the session factory for work that outlives the request.
+
+    Streamed responses are sent after the request's session has been closed,
+    so the generators producing them open their own session from this factory.
+
+    Returns:
+    async_sessionmaker: The application's session factory.
+    """
+    return async_session_maker
+
+
 async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
     """
     Asynchronous context manager to generate an AsyncSession.
@@ -62,12 +111,12 @@ async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
     AsyncSession object. It is intended to be used with the 'async with'
     statement to ensure that the session is properly closed after use.
 
-    The session is created using the async_session_maker which is defined
-    at the module level. The maker is configured to use the database engine
-    defined by the SQLALCHEMY_DATABASE_URL environment variable.
-
-    The session is committed or rolled back automatically when the context
-    manager is exited, depending on whether an exception was raised or not.
+    The session comes from AsyncScopedSession, which is scoped to the
+    current asyncio task, so every service resolved while handling a request
+    shares a single session and a single pooled connection. The scoped
+    session is closed and removed from the registry once the request ends.
     """
-    async with async_session_maker() as session:
-        yield session
+    try:
+        yield AsyncScopedSession()
+    finally:
+        await AsyncScopedSession.remove()
@@ -0,0 +1,108 @@
+"""Database triggers for the Manager API."""
+
+from sqlmodel import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+# Task and comment writes are logged by AFTER ROW triggers, in the same
+# transaction as the change and without a round trip from the app.
+# Deletes cascaded from a parent row (pg_trigger_depth() > 1) are not
+# logged, matching the single log written for the parent delete. Delete
+# logs leave task_id/comment_id unset since that row is gone.
+ACTIVITY_TRIGGERS = (
+    # Time-ordered ids, matching src.core.utils.uuids.uuid7 used for rows
+    # written from Python: a gen_random_uuid() with its first 48 bits
+    # replaced by the Unix time in milliseconds and the version set to 7.
+    """
+    CREATE OR REPLACE FUNCTION uuid_generate_v7() RETURNS uuid AS $$
+    DECLARE
+        value bytea := uuid_send(gen_random_uuid());
+    BEGIN
+        value := overlay(value PLACING substring(int8send(
+            floor(extract(epoch FROM clock_timestamp()) * 1000)::bigint
+        ) FROM 3) FROM 1 FOR 6);
+        value := set_byte(value, 6, (get_byte(value, 6) & 15) | 112);
+        RETURN encode(value, 'hex')::uuid;
+    END
+    $$ LANGUAGE plpgsql VOLATILE
+    """,
+    """
+    CREATE OR REPLACE FUNCTION log_task_activity() RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP = 'DELETE' THEN
+            IF pg_trigger_depth() = 1 THEN
+                INSERT INTO activity_logs (
+                    id, user_id, project_id, activity_type, entity, entity_id, description
+                ) VALUES (
+                    uuid_generate_v7(), OLD.user_id, OLD.project_id, 'delete', 'task', OLD.id,
+                    format('Task with id %s has been deleted.', OLD.id)
+                );
+            END IF;
+            RETURN OLD;
+        END IF;
+        INSERT INTO activity_logs (
+            id, user_id, task_id, project_id, activity_type, entity, entity_id, description
+        ) VALUES (
+            uuid_generate_v7(), NEW.user_id, NEW.id, NEW.project_id,
+            CASE TG_OP WHEN 'INSERT' THEN 'create' ELSE 'update' END, 'task', NEW.id,
+            CASE TG_OP
+                WHEN 'INSERT' THEN format('A new Task with id %s has been created.', NEW.id)
+                ELSE format('Task with id %s has been updated.', NEW.id)
+            END
+        );
+        RETURN NEW;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE OR REPLACE TRIGGER tasks_activity
+    AFTER INSERT OR UPDATE OR DELETE ON tasks
+    FOR EACH ROW EXECUTE FUNCTION log_task_activity()
+    """,
+    """
+    CREATE OR REPLACE FUNCTION log_comment_activity() RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP = 'DELETE' THEN
+            IF pg_trigger_depth() = 1 THEN
+                INSERT INTO activity_logs (
+                    id, user_id, task_id, activity_type, entity, entity_id, description
+                ) VALUES (
+                    uuid_generate_v7(), OLD.user_id, OLD.task_id, 'delete', 'comment', OLD.id,
+                    format('Comment with id %s has been deleted.', OLD.id)
+                );
+            END IF;
+            RETURN OLD;
+        END IF;
+        INSERT INTO activity_logs (
+            id, user_id, task_id, comment_id, activity_type, entity, entity_id, description
+        ) VALUES (
+            uuid_generate_v7(), NEW.user_id, NEW.task_id, NEW.id,
+            CASE TG_OP WHEN 'INSERT' THEN 'create' ELSE 'update' END, 'comment', NEW.id,
+            CASE TG_OP
+                WHEN 'INSERT' THEN format('A new comment %s has been created.', NEW.id)
+                ELSE format('Comment with id %s has been updated.', NEW.id)
+            END
+        );
+        RETURN NEW;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE OR REPLACE TRIGGER task_comments_activity
+    AFTER INSERT OR UPDATE OR DELETE ON task_comments
+    FOR EACH ROW EXECUTE FUNCTION log_comment_activity()
+    """,
+)
+
+
+async def install_activity_triggers(conn: AsyncConnection):
+    """
+    Create or replace the activity log trigger functions and triggers.
+
+    Safe to run on every start: existing definitions are replaced, so
+    databases created before the triggers existed get them too.
+
+    Args:
+    conn (AsyncConnection): The connection to run the DDL on.
+    """
+    for statement in ACTIVITY_TRIGGERS:
+        await conn.execute(text(statement))
@@ -0,0 +1,106 @@
+"""In-place schema upgrades for databases created by older versions."""
+
+from sqlmodel import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+# create_all only creates missing tables, so column and constraint changes
+# made to the models since a database was created are applied here. Every
+# statement checks the catalog first and is a no-op once applied, so a
+# fresh database or a second start does nothing.
+
+# Timestamps are filled in by the database (server_default=func.now())
+# rather than by Python, so older tables need the column default.
+_TIMESTAMP_COLUMNS = (
+    ("activity_logs", "created_at"),
+    ("projects", "created_at"),
+    ("projects", "updated_at"),
+    ("tasks", "created_at"),
+    ("tasks", "updated_at"),
+    ("task_comments", "created_at"),
+    ("task_comments", "updated_at"),
+    ("teams", "created_at"),
+    ("teams", "updated_at"),
+    ("team_members", "created_at"),
+    ("team_members", "updated_at"),
+    ("user", "created_at"),
+    ("user", "updated_at"),
+)
+
+# Native ENUM columns, which stored the member names ('TODO'), are now
+# VARCHAR(16) columns storing the values ('todo'). Every value is its
+# member name in lower case.
+_ENUM_COLUMNS = (
+    ("activity_logs", "activity_type", "logs"),
+    ("tasks", "status", "status"),
+    ("tasks", "priority", "priorities"),
+    ("user", "role", "roles"),
+)
+
+# Deletes are issued as Core DELETE statements, so the cascades live in the
+# foreign keys. confdeltype is 'c' for CASCADE and 'n' for SET NULL.
+_FOREIGN_KEYS = (
+    ("projects", "team_id", "teams", "CASCADE"),
+    ("team_members", "team_id", "teams", "CASCADE"),
+    ("tasks", "project_id", "projects", "CASCADE"),
+    ("task_comments", "task_id", "tasks", "CASCADE"),
+    ("activity_logs", "project_id", "projects", "SET NULL"),
+    ("activity_logs", "task_id", "tasks", "CASCADE"),
+    ("activity_logs", "team_id", "teams", "CASCADE"),
+    ("activity_logs", "comment_id", "task_comments", "CASCADE"),
+)
+_DELETE_TYPES = {"CASCADE": "c", "SET NULL": "n"}
+
+SCHEMA_UPGRADES = (
+    *(
+        f'ALTER TABLE "{table}" ALTER COLUMN {column} SET DEFAULT now()'
+        for table, column in _TIMESTAMP_COLUMNS
+    ),
+    *(
+        f"""
+        DO $$ BEGIN
+            IF EXISTS (
+                SELECT 1 FROM information_schema.columns
+                WHERE table_schema = current_schema() AND table_name = '{table}'
+                AND column_name = '{column}' AND data_type = 'USER-DEFINED'
+            ) THEN
+                ALTER TABLE "{table}" ALTER COLUMN {column} DROP DEFAULT;
+                ALTER TABLE "{table}" ALTER COLUMN {column}
+                    TYPE VARCHAR(16) USING lower({column}::text);
+                DROP TYPE IF EXISTS {enum_name};
+            END IF;
+        END $$
+        """
+        for table, column, enum_name in _ENUM_COLUMNS
+    ),
+    *(
+        f"""
+        DO $$ BEGIN
+            IF EXISTS (
+                SELECT 1 FROM pg_constraint
+                WHERE conrelid = '"{table}"'::regclass AND conname = '{table}_{column}_fkey'
+                AND confdeltype <> '{_DELETE_TYPES[ondelete]}'
+            ) THEN
+                ALTER TABLE "{table}"
+                    DROP CONSTRAINT {table}_{column}_fkey,
+                    ADD CONSTRAINT {table}_{column}_fkey FOREIGN KEY ({column})
+                        REFERENCES {referred} (id) ON DELETE {ondelete};
+            END IF;
+        END $$
+        """
+        for table, column, referred, ondelete in _FOREIGN_KEYS
+    ),
+)
+
+
+async def upgrade_schema(conn: AsyncConnection):
+    """
+    Bring the columns and foreign keys of existing tables up to date.
+
+    Safe to run on every start: each statement is skipped or a no-op once
+    the table matches the models.
+
+    Args:
+    conn (AsyncConnection): The connection to run the DDL on.
+    """
+    for statement in SCHEMA_UPGRADES:
+        await conn.execute(text(statement))
@@ -1,30 +1,92 @@
 """Entry point for the FastAPI app."""
 
+import asyncio
+import logging
 from contextlib import asynccontextmanager
-from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
-from src.db.db_session import init_db
+from fastapi import FastAPI, Request
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.exc import SQLAlchemyError, TimeoutError as PoolTimeoutError
+from sqlalchemy.orm import configure_mappers
+from src.core.configs import settings
+from src.core.logs import start_logging
+from src.core.utils.bodies import add_json_body_schemas
+from src.core.middleware import PureCORSMiddleware
+from src.db.db_session import engine, init_db, warm_pool
+from src.services.activity_queue import activity_queue
+from src.schemas.activity_schemas import (
+    ReadActivity, CreateActivity, READ_ACTIVITY_LIST_ADAPTER
+)
+from src.schemas.project_schemas import (
+    CreateProject, ReadProject, UpdateProject, READ_PROJECT_LIST_ADAPTER
+)
+from src.schemas.task_schemas import (
+    CreateTask, UpdateTask, ReadTask,
+    CreateTaskComment, ReadTaskComment, UpdateTaskComment,
+    READ_TASK_LIST_ADAPTER, READ_TASK_COMMENT_LIST_ADAPTER
+)
+from src.schemas.team_schemas import (
+    ReadTeam, UpdateTeam, CreateTeamMember, CreateTeamMembers, ReadTeamMember,
+    READ_TEAM_LIST_ADAPTER, READ_TEAM_MEMBER_LIST_ADAPTER
+)
 from src.api.v1.auth.auths import fastapi_users, auth_backend
 from src.schemas.user_schemas import (
-    UserRead, UserCreate, UserUpdate
+    UserRead, UserCreate, UserUpdate, USER_READ_LIST_ADAPTER
 )
 from src.api.v1.users.user_routes import user_router
-from src.api.v1.teams import team_routes, member_routes
+from src.api.v1.teams.team_routes import team_router
+from src.api.v1.teams.member_routes import team_member_router
 from src.api.v1.projects.project_routes import project_router
-from src.api.v1.tasks import task_routes, comment_routes
+from src.api.v1.tasks.task_routes import task_router
+from src.api.v1.tasks.comment_routes import comment_router
 from src.api.v1.activities.activity_routes import activity_router
 
+logger = logging.getLogger(__name__)
+
+try:
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
+
+
+DEFERRED_SCHEMAS = (
+    ReadActivity, CreateActivity,
+    CreateProject, ReadProject, UpdateProject,
+    CreateTask, UpdateTask, ReadTask,
+    CreateTaskComment, ReadTaskComment, UpdateTaskComment,
+    ReadTeam, UpdateTeam, CreateTeamMember, CreateTeamMembers, ReadTeamMember,
+)
+
+DEFERRED_ADAPTERS = (
+    READ_ACTIVITY_LIST_ADAPTER, READ_PROJECT_LIST_ADAPTER,
+    READ_TASK_LIST_ADAPTER, READ_TASK_COMMENT_LIST_ADAPTER,
+    READ_TEAM_LIST_ADAPTER, READ_TEAM_MEMBER_LIST_ADAPTER,
+    USER_READ_LIST_ADAPTER,
+)
+
 
 @asynccontextmanager
 async def life_span(manager: FastAPI):
     """Application lifetime"""
-    print("Server is Starting...")
+    log_listener = start_logging()
+    logger.info("Server is Starting...")
     await init_db()
+    await warm_pool()
+    configure_mappers()
+    for schema in DEFERRED_SCHEMAS:
+        schema.model_rebuild()
+    for adapter in DEFERRED_ADAPTERS:
+        adapter.rebuild()
+    await activity_queue.start()
     yield
-    print("Server has been stopped")
+    await activity_queue.stop()
+    logger.info("Server has been stopped")
+    log_listener.stop()
 
 
 VERSION = 'v1.0.0'
+API_PREFIX = f"/api/{VERSION}"
 
 app = FastAPI(
     title="Manager API",
@@ -33,68 +95,78 @@ app = FastAPI(
     swagger_ui_parameters={
         "persistAuthorization": True,
     },
-    lifespan=life_span
+    lifespan=life_span,
+    default_response_class=ORJSONResponse
 )
 
+
+def openapi() -> dict:
+    """OpenAPI schema, including the json_body request body schemas."""
+    if app.openapi_schema is None:
+        app.openapi_schema = add_json_body_schemas(FastAPI.openapi(app))
+    return app.openapi_schema
+
+
+app.openapi = openapi
+
 app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
+    PureCORSMiddleware,
+    allow_origins=settings.ALLOWED_ORIGINS,
+    allow_credentials=False,
     allow_methods=["*"],
     allow_headers=["*"],
+    max_age=86400,
 )
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 
+@app.exception_handler(PoolTimeoutError)
+async def pool_timeout_handler(request: Request, exc: PoolTimeoutError) -> ORJSONResponse:
+    """Ask clients to back off when no database connection is free."""
+    return ORJSONResponse(
+        status_code=503, content={"detail": "Service temporarily unavailable"},
+        headers={"Retry-After": "1"}
+    )
 
-@app.get(f"/api/{VERSION}")
+
+@app.exception_handler(SQLAlchemyError)
+async def database_error_handler(request: Request, exc: SQLAlchemyError) -> ORJSONResponse:
+    """Report database errors that reach the app as a plain 500."""
+    return ORJSONResponse(status_code=500, content={"detail": "Internal server error"})
+
+
+@app.get(API_PREFIX)
 async def root() -> dict[str, str]:
     """Manager root endpoint."""
     return {"message": "Welcome to the Manager API"}
 
 
-@app.get(f"/api/{VERSION}/health")
+@app.get(API_PREFIX + "/health")
 async def healthz():
-    """Health check endpoint."""
-    return {"status": "ok"}
+    """Health check endpoint, with the connection pool usage."""
+    return {"status": "ok", "pool": engine.pool.status()}
 
 
-app.include_router(
-    fastapi_users.get_auth_router(auth_backend),
-    prefix=f"/api/{VERSION}/auth/jwt", tags=["auth"]
-)
-app.include_router(
-    fastapi_users.get_register_router(UserRead, UserCreate),
-    prefix=f"/api/{VERSION}/auth", tags=["auth"]
-)
-app.include_router(
-    fastapi_users.get_reset_password_router(),
-    prefix=f"/api/{VERSION}/auth/reset-password", tags=["auth"]
-)
-app.include_router(
-    fastapi_users.get_verify_router(UserRead),
-    prefix=f"/api/{VERSION}/auth/verify", tags=["auth"]
-)
-app.include_router(
-    fastapi_users.get_users_router(UserRead, UserUpdate),
-    prefix=f"/api/{VERSION}/users", tags=["users"]
-)
-app.include_router(
-    user_router, prefix=f"/api/{VERSION}"
+AUTH_ROUTERS = (
+    (fastapi_users.get_auth_router(auth_backend), "/auth/jwt", "auth"),
+    (fastapi_users.get_register_router(UserRead, UserCreate), "/auth", "auth"),
+    (fastapi_users.get_reset_password_router(), "/auth/reset-password", "auth"),
+    (fastapi_users.get_verify_router(UserRead), "/auth/verify", "auth"),
+    (fastapi_users.get_users_router(UserRead, UserUpdate), "/users", "users"),
 )
-app.include_router(
-    team_routes.team_router, prefix=f"/api/{VERSION}/teams"
-)
-app.include_router(
-    member_routes.team_member_router, prefix=f"/api/{VERSION}/members"
-)
-app.include_router(
-    project_router, prefix=f"/api/{VERSION}/projects"
-)
-app.include_router(
-    task_routes.task_router, prefix=f"/api/{VERSION}/tasks"
-)
-app.include_router(
-    comment_routes.comment_router, prefix=f"/api/{VERSION}/comments"
-)
-app.include_router(
-    activity_router, prefix=f"/api/{VERSION}/activities"
+
+ROUTERS = (
+    (user_router, ""),
+    (team_router, "/teams"),
+    (team_member_router, "/members"),
+    (project_router, "/projects"),
+    (task_router, "/tasks"),
+    (comment_router, "/comments"),
+    (activity_router, "/activities"),
 )
+
+for router, prefix, tag in AUTH_ROUTERS:
+    app.include_router(router, prefix=API_PREFIX + prefix, tags=[tag])
+
+for router, prefix in ROUTERS:
+    app.include_router(router, prefix=API_PREFIX + prefix)
@@ -0,0 +1,5 @@
+"""Database models for the Manager API."""
+
+from src.models import (  # noqa: F401
+    user_models, team_models, project_models, task_models, activity_models
+)
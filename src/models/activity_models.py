@@ -5,10 +5,11 @@ import enum
 import uuid
 from typing import TYPE_CHECKING
 from datetime import datetime
-from sqlalchemy import ForeignKey, String, text, Enum
-from sqlalchemy.dialects.postgresql import TIMESTAMP
+from sqlalchemy import ForeignKey, Index, String, func, text, Enum
+from sqlalchemy.dialects.postgresql import TIMESTAMP, UUID as PG_UUID
 from sqlalchemy.orm import Mapped, relationship, mapped_column
 from fastapi_users_db_sqlalchemy import UUID_ID
+from src.core.utils.uuids import uuid7
 from src.models.user_models import Base, User
 
 if TYPE_CHECKING:
@@ -30,36 +31,78 @@ class ActivityLog(Base):
     """Activity log database table model."""
 
     __tablename__ = "activity_logs"
+    __table_args__ = (
+        Index("ix_activity_user_created", "user_id", "created_at"),
+        Index(
+            "ix_activity_project_created", "project_id", "created_at",
+            postgresql_where=text("project_id IS NOT NULL")
+        ),
+        Index(
+            "ix_activity_task_created", "task_id", "created_at",
+            postgresql_where=text("task_id IS NOT NULL")
+        ),
+        Index(
+            "ix_activity_team_created", "team_id", "created_at",
+            postgresql_where=text("team_id IS NOT NULL")
+        ),
+        Index(
+            "ix_activity_task_team_created", "task_id", "team_id", "created_at",
+            postgresql_where=text("task_id IS NOT NULL")
+        ),
+        Index(
+            "ix_activity_task_user_created", "task_id", "user_id", "created_at",
+            postgresql_where=text("task_id IS NOT NULL")
+        ),
+        Index(
+            "ix_activity_project_type_entity_created",
+            "project_id", "activity_type", "entity", "created_at",
+            postgresql_where=text("project_id IS NOT NULL")
+        ),
+        Index(
+            "ix_activity_comment", "comment_id",
+            postgresql_where=text("comment_id IS NOT NULL")
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
-        primary_key=True, index=True,
-        default=uuid.uuid4, server_default=text("gen_random_uuid()")
+        primary_key=True, default=uuid7
     )
     user_id: Mapped[UUID_ID] = mapped_column(ForeignKey("user.id"), nullable=True)
     user: Mapped[User] = relationship(back_populates="activity_logs")
-    project_id: Mapped[UUID_ID] = mapped_column(ForeignKey("projects.id"), nullable=True)
+    project_id: Mapped[UUID_ID] = mapped_column(
+        ForeignKey("projects.id", ondelete="SET NULL"), nullable=True
+    )
     project: Mapped["Project"] = relationship(back_populates="activity_logs")
-    task_id: Mapped[UUID_ID] = mapped_column(ForeignKey("tasks.id"), nullable=True)
+    task_id: Mapped[UUID_ID] = mapped_column(
+        ForeignKey("tasks.id", ondelete="CASCADE"), nullable=True
+    )
     task: Mapped["Task"] = relationship(back_populates="activity_logs")
-    team_id: Mapped[UUID_ID] = mapped_column(ForeignKey("teams.id"), nullable=True)
+    team_id: Mapped[UUID_ID] = mapped_column(
+        ForeignKey("teams.id", ondelete="CASCADE"), nullable=True
+    )
     team: Mapped["Team"] = relationship(back_populates="activity_logs")
-    comment_id: Mapped[UUID_ID] = mapped_column(ForeignKey("task_comments.id"), nullable=True)
+    comment_id: Mapped[UUID_ID] = mapped_column(
+        ForeignKey("task_comments.id", ondelete="CASCADE"), nullable=True
+    )
     task_comment: Mapped["TaskComment"] = relationship(back_populates="activity_logs")
     activity_type: Mapped[ActivityType] = mapped_column(
-        Enum(ActivityType, name="logs"), nullable=True
+        Enum(
+            ActivityType, name="logs", native_enum=False, length=16,
+            validate_strings=True, values_callable=lambda enum: [m.value for m in enum]
+        ),
+        nullable=True
     )
     entity: Mapped[str] = mapped_column(String(length=20), nullable=True)
-    entity_id: Mapped[str] = mapped_column(String(length=100), nullable=True)
+    entity_id: Mapped[uuid.UUID] = mapped_column(PG_UUID(as_uuid=True), nullable=True)
     description: Mapped[str] = mapped_column(String(length=320), nullable=True)
     created_at: Mapped[datetime] = mapped_column(
-        TIMESTAMP(timezone=True), nullable=False, default=datetime.now
+        TIMESTAMP(timezone=True), nullable=False, server_default=func.now()
     )
 
     def __repr__(self):
         return (
-            f"ActivityLog({self.id}, {self.user_id}, {self.activity_type}, " \
+            f"ActivityLog({self.id}, {self.user_id}, {self.activity_type}, "
             f"{self.entity}, {self.entity_id}, {self.description}, {self.created_at})"
         )
 
-    def __str__(self):
-        return self.__repr__()
+    __str__ = __repr__
@@ -4,7 +4,7 @@ from __future__ import annotations
 import uuid
 from typing import TYPE_CHECKING
 from datetime import datetime
-from sqlalchemy import ForeignKey, String, UniqueConstraint, text
+from sqlalchemy import ForeignKey, Index, String, UniqueConstraint, func, text
 from sqlalchemy.dialects.postgresql import TIMESTAMP
 from sqlalchemy.orm import Mapped, relationship, mapped_column
 from fastapi_users_db_sqlalchemy import UUID_ID
@@ -22,9 +22,14 @@ class Project(Base):
     __tablename__ = "projects"
     __table_args__ = (
         UniqueConstraint('user_id', 'title', name='uq_user_project_title'),
+        Index("ix_projects_user_created", "user_id", "created_at", "id"),
+        Index(
+            "ix_projects_team_created", "team_id", "created_at", "id",
+            postgresql_where=text("team_id IS NOT NULL")
+        ),
     )
     id: Mapped[uuid.UUID] = mapped_column(
-        primary_key=True, index=True,
+        primary_key=True,
         default=uuid.uuid4, server_default=text("gen_random_uuid()")
     )
     title: Mapped[str] = mapped_column(
@@ -35,20 +40,25 @@ class Project(Base):
     )
     user_id: Mapped[UUID_ID] = mapped_column(ForeignKey("user.id"), nullable=False)
     user: Mapped[User] = relationship(back_populates="projects")
-    team_id: Mapped[UUID_ID] = mapped_column(ForeignKey("teams.id"), nullable=True)
+    team_id: Mapped[UUID_ID] = mapped_column(
+        ForeignKey("teams.id", ondelete="CASCADE"), nullable=True
+    )
     team: Mapped["Team"] = relationship(back_populates="projects")
-    tasks: Mapped[list["Task"]] = relationship(back_populates="project", cascade="all, delete")
-    activity_logs: Mapped[list["ActivityLog"]] = relationship(back_populates="project")
+    tasks: Mapped[list["Task"]] = relationship(
+        back_populates="project", cascade="all, delete", passive_deletes=True
+    )
+    activity_logs: Mapped[list["ActivityLog"]] = relationship(
+        back_populates="project", passive_deletes=True
+    )
     created_at: Mapped[datetime] = mapped_column(
-        TIMESTAMP(timezone=True), nullable=False, default=datetime.now
+        TIMESTAMP(timezone=True), nullable=False, server_default=func.now()
     )
     updated_at: Mapped[datetime] = mapped_column(
         TIMESTAMP(timezone=True), nullable=False,
-        default=datetime.now, onupdate=datetime.now
+        server_default=func.now(), onupdate=func.now()
     )
 
     def __repr__(self):
         return f"Project(id={self.id}, title={self.title}, user_id={self.user_id})"
-    
-    def __str__(self):
-        return self.__repr__()
+
+    __str__ = __repr__
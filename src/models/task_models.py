@@ -6,12 +6,13 @@ from enum import Enum
 from typing import TYPE_CHECKING
 from datetime import datetime, date
 from sqlalchemy import (
-    ForeignKey, String, UniqueConstraint,
-    text, Enum as SAEnum
+    ForeignKey, Index, String, UniqueConstraint,
+    func, text, Enum as SAEnum
 )
 from sqlalchemy.dialects.postgresql import TIMESTAMP, DATE
 from sqlalchemy.orm import Mapped, relationship, mapped_column
 from fastapi_users_db_sqlalchemy import UUID_ID
+from src.core.utils.uuids import uuid7
 from src.models.user_models import Base, User
 
 if TYPE_CHECKING:
@@ -36,21 +37,38 @@ class Task(Base):
     __tablename__ = "tasks"
     __table_args__ = (
         UniqueConstraint('user_id', 'title', name='uq_user_task_title'),
+        Index(
+            "ix_tasks_filter", "project_id", "status", "priority", "due_date", "created_at"
+        ),
+        Index("ix_tasks_project_created", "project_id", "created_at", "id"),
+        Index(
+            "ix_tasks_project_due", "project_id", "due_date", "status", "priority",
+            postgresql_where=text("due_date IS NOT NULL")
+        ),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(
-        primary_key=True, index=True,
-        default=uuid.uuid4, server_default=text("gen_random_uuid()")
+        primary_key=True, default=uuid7
+    )
+    project_id: Mapped[UUID_ID] = mapped_column(
+        ForeignKey("projects.id", ondelete="CASCADE"), nullable=False
     )
-    project_id: Mapped[UUID_ID] = mapped_column(ForeignKey("projects.id"), nullable=False)
     project: Mapped["Project"] = relationship(back_populates="tasks")
     title: Mapped[str] = mapped_column(String(length=20), nullable=False, index=True)
     description: Mapped[str] = mapped_column(String(length=320), nullable=True)
     status: Mapped[TaskStatus] = mapped_column(
-        SAEnum(TaskStatus, name="status"), default=TaskStatus.TODO, nullable=False
+        SAEnum(
+            TaskStatus, name="status", native_enum=False, length=16,
+            validate_strings=True, values_callable=lambda enum: [m.value for m in enum]
+        ),
+        default=TaskStatus.TODO, nullable=False
     )
     priority: Mapped[TaskPriority] = mapped_column(
-        SAEnum(TaskPriority, name="priorities"), default=TaskPriority.LOW, nullable=False
+        SAEnum(
+            TaskPriority, name="priorities", native_enum=False, length=16,
+            validate_strings=True, values_callable=lambda enum: [m.value for m in enum]
+        ),
+        default=TaskPriority.LOW, nullable=False
     )
     due_date: Mapped[date] = mapped_column(DATE, nullable=False)
     user_id: Mapped[UUID_ID] = mapped_column(ForeignKey("user.id"), nullable=False)
@@ -66,18 +84,20 @@ class Task(Base):
     )
     comments: Mapped[list[TaskComment]] = relationship(
         back_populates="task",
-        cascade="all, delete"
+        cascade="all, delete",
+        passive_deletes=True
     )
     activity_logs: Mapped[list[ActivityLog]] = relationship(
         back_populates="task",
-        cascade="all, delete"
+        cascade="all, delete",
+        passive_deletes=True
     )
     created_at: Mapped[datetime] = mapped_column(
-        TIMESTAMP(timezone=True), nullable=False, default=datetime.now
+        TIMESTAMP(timezone=True), nullable=False, server_default=func.now()
     )
     updated_at: Mapped[datetime] = mapped_column(
         TIMESTAMP(timezone=True), nullable=False,
-        default=datetime.now, onupdate=datetime.now
+        server_default=func.now(), onupdate=func.now()
     )
 
     def __repr__(self) -> str:
@@ -88,20 +108,23 @@ class Task(Base):
             f"created_at={self.created_at!r}, updated_at={self.updated_at!r})"
         )
 
-    def __str__(self) -> str:
-        return self.__repr__()
+    __str__ = __repr__
 
 
 class TaskComment(Base):
     """Task comment database table model."""
 
     __tablename__ = "task_comments"
+    __table_args__ = (
+        Index("ix_task_comments_task_created", "task_id", "created_at", "id"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
-        primary_key=True, index=True,
-        default=uuid.uuid4, server_default=text("gen_random_uuid()")
+        primary_key=True, default=uuid7
+    )
+    task_id: Mapped[UUID_ID] = mapped_column(
+        ForeignKey("tasks.id", ondelete="CASCADE"), nullable=False
     )
-    task_id: Mapped[UUID_ID] = mapped_column(ForeignKey("tasks.id"), nullable=False)
     task: Mapped["Task"] = relationship(back_populates="comments")
     user_id: Mapped[UUID_ID] = mapped_column(ForeignKey("user.id"), nullable=False)
     user: Mapped[User] = relationship(
@@ -111,14 +134,15 @@ class TaskComment(Base):
     comment: Mapped[str] = mapped_column(String(length=320), nullable=False)
     activity_logs: Mapped[list[ActivityLog]] = relationship(
         back_populates="task_comment",
-        cascade="all, delete"
+        cascade="all, delete",
+        passive_deletes=True
     )
     created_at: Mapped[datetime] = mapped_column(
-        TIMESTAMP(timezone=True), nullable=False, default=datetime.now
+        TIMESTAMP(timezone=True), nullable=False, server_default=func.now()
     )
     updated_at: Mapped[datetime] = mapped_column(
         TIMESTAMP(timezone=True), nullable=False,
-        default=datetime.now, onupdate=datetime.now
+        server_default=func.now(), onupdate=func.now()
     )
 
     def __repr__(self) -> str:
@@ -127,5 +151,4 @@ class TaskComment(Base):
             f"comment={self.comment[0:20]!r}, created_at={self.created_at!r}, updated_at={self.updated_at!r})"
         )
 
-    def __str__(self) -> str:
-        return self.__repr__()
+    __str__ = __repr__
@@ -4,7 +4,7 @@ from __future__ import annotations
 from enum import Enum
 from datetime import datetime
 from typing import TYPE_CHECKING
-from sqlalchemy import String, Enum as SAEnum
+from sqlalchemy import Index, String, func, Enum as SAEnum
 from sqlalchemy.dialects.postgresql import TIMESTAMP
 from sqlalchemy.orm import (
     DeclarativeBase, Mapped, mapped_column, relationship
@@ -32,6 +32,11 @@ class Roles(str, Enum):
 class User(SQLAlchemyBaseUserTableUUID, Base):
     """User database table model. Extends SQLAlchemyBaseUserTableUUID."""
 
+    __table_args__ = (
+        Index("ix_user_created", "created_at", "id"),
+        Index("ix_user_role_created", "role", "created_at", "id"),
+    )
+
     first_name: Mapped[str] = mapped_column(
         String(length=320), index=True, nullable=True
     )
@@ -51,7 +56,11 @@ class User(SQLAlchemyBaseUserTableUUID, Base):
         String(length=320), nullable=True
     )
     role: Mapped[Roles] = mapped_column(
-        SAEnum(Roles, name="roles"), default=Roles.MEMBER, nullable=False
+        SAEnum(
+            Roles, name="roles", native_enum=False, length=16,
+            validate_strings=True, values_callable=lambda enum: [m.value for m in enum]
+        ),
+        default=Roles.MEMBER, nullable=False
     )
     teams: Mapped[list[Team]] = relationship(back_populates="user", cascade="all, delete")
     team_members: Mapped[list[TeamMember]] = relationship(
@@ -72,21 +81,19 @@ class User(SQLAlchemyBaseUserTableUUID, Base):
     projects: Mapped[list["Project"]] = relationship(back_populates="user", cascade="all, delete")
     activity_logs: Mapped[list["ActivityLog"]] = relationship(back_populates="user", cascade="all, delete")
     created_at: Mapped[datetime] = mapped_column(
-        TIMESTAMP(timezone=True), nullable=False, default=datetime.now
+        TIMESTAMP(timezone=True), nullable=False, server_default=func.now()
     )
     updated_at: Mapped[datetime] = mapped_column(
         TIMESTAMP(timezone=True), nullable=False,
-        default=datetime.now, onupdate=datetime.now
+        server_default=func.now(), onupdate=func.now()
     )
 
     def __repr__(self) -> str:
         """Return a string representation of the User object."""
         fullname = f"{self.first_name} {self.last_name}"
-        return f"""
-        User(id={self.id!r}, username={self.username!r},
-        fullname={fullname!r}, created_at={self.created_at!r})
-        """
+        return (
+            f"User(id={self.id!r}, username={self.username!r}, "
+            f"fullname={fullname!r}, created_at={self.created_at!r})"
+        )
 
-    def __str__(self) -> str:
-        """Return a string representation of the User object."""
-        return self.__repr__()
+    __str__ = __repr__
@@ -3,10 +3,13 @@
 import uuid
 from datetime import datetime
 from typing import Optional
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 from src.models.activity_models import ActivityType
 
 
+_BASE_CONFIG = ConfigDict(from_attributes=True, extra="ignore", defer_build=True)
+
+
 class ReadActivity(BaseModel):
     """Read Activity schema for the Manager API."""
 
@@ -21,10 +24,7 @@ class ReadActivity(BaseModel):
     description: Optional[str] = None
     created_at: datetime
 
-    model_config = ConfigDict(
-        from_attributes=True,
-        extra="ignore"
-    )
+    model_config = _BASE_CONFIG
 
 
 class CreateActivity(BaseModel):
@@ -38,8 +38,7 @@ class CreateActivity(BaseModel):
     entity_id: uuid.UUID
     description: Optional[str] = None
 
-    model_config = ConfigDict(
-        from_attributes=True,
-        extra="ignore",
-        use_enum_values=True
-    )
+    model_config = ConfigDict(**_BASE_CONFIG, use_enum_values=True)
+
+
+READ_ACTIVITY_LIST_ADAPTER = TypeAdapter(list[ReadActivity], config=ConfigDict(defer_build=True))
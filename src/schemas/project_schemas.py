@@ -3,7 +3,10 @@
 import uuid
 from datetime import datetime
 from typing import Optional
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, TypeAdapter
+
+
+_BASE_CONFIG = ConfigDict(from_attributes=True, extra="ignore", defer_build=True)
 
 
 class CreateProject(BaseModel):
@@ -13,10 +16,7 @@ class CreateProject(BaseModel):
     description: Optional[str]
     team_id: Optional[uuid.UUID]
 
-    model_config = ConfigDict(
-        from_attributes=True,
-        extra="ignore"
-    )
+    model_config = _BASE_CONFIG
 
 
 class ReadProject(BaseModel):
@@ -30,10 +30,7 @@ class ReadProject(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    model_config = ConfigDict(
-        from_attributes=True,
-        extra="ignore"
-    )
+    model_config = _BASE_CONFIG
 
 
 class UpdateProject(BaseModel):
@@ -43,7 +40,7 @@ class UpdateProject(BaseModel):
     description: Optional[str] = None
     team_id: Optional[uuid.UUID] = None
 
-    model_config = ConfigDict(
-        from_attributes=True,
-        extra="ignore"
-    )
+    model_config = _BASE_CONFIG
+
+
+READ_PROJECT_LIST_ADAPTER = TypeAdapter(list[ReadProject], config=ConfigDict(defer_build=True))
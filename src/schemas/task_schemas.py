@@ -1,9 +1,12 @@
 """Task schemas for the API."""
 
 import uuid
-from typing import List, Optional
+from typing import Optional
 from datetime import datetime, date
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, TypeAdapter
+
+
+_BASE_CONFIG = ConfigDict(from_attributes=True, extra="ignore", defer_build=True)
 
 
 class CreateTask(BaseModel):
@@ -17,10 +20,7 @@ class CreateTask(BaseModel):
     priority: Optional[str] = "low"
     assigned_id: uuid.UUID
 
-    model_config = ConfigDict(
-        from_attributes=True,
-        extra="ignore"
-    )
+    model_config = _BASE_CONFIG
 
 
 class UpdateTask(BaseModel):
@@ -33,10 +33,7 @@ class UpdateTask(BaseModel):
     priority: Optional[str] = None
     assigned_id: Optional[uuid.UUID] = None
 
-    model_config = ConfigDict(
-        from_attributes=True,
-        extra="ignore"
-    )
+    model_config = _BASE_CONFIG
 
 
 class ReadTask(BaseModel):
@@ -50,14 +47,11 @@ class ReadTask(BaseModel):
     priority: str
     project_id: uuid.UUID
     user_id: uuid.UUID
-    assigneds: List[uuid.UUID]
+    assigned_id: Optional[uuid.UUID] = None
     created_at: datetime
     updated_at: datetime
 
-    model_config = ConfigDict(
-        from_attributes=True,
-        extra="ignore"
-    )
+    model_config = _BASE_CONFIG
 
 
 class CreateTaskComment(BaseModel):
@@ -66,10 +60,7 @@ class CreateTaskComment(BaseModel):
     comment: str
     task_id: uuid.UUID
 
-    model_config = ConfigDict(
-        from_attributes=True,
-        extra="ignore"
-    )
+    model_config = _BASE_CONFIG
 
 
 class ReadTaskComment(BaseModel):
@@ -82,10 +73,7 @@ class ReadTaskComment(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    model_config = ConfigDict(
-        from_attributes=True,
-        extra="ignore"
-    )
+    model_config = _BASE_CONFIG
 
 
 class UpdateTaskComment(BaseModel):
@@ -93,7 +81,8 @@ class UpdateTaskComment(BaseModel):
 
     comment: Optional[str] = None
 
-    model_config = ConfigDict(
-        from_attributes=True,
-        extra="ignore"
-    )
+    model_config = _BASE_CONFIG
+
+
+READ_TASK_LIST_ADAPTER = TypeAdapter(list[ReadTask], config=ConfigDict(defer_build=True))
+READ_TASK_COMMENT_LIST_ADAPTER = TypeAdapter(list[ReadTaskComment], config=ConfigDict(defer_build=True))
@@ -3,7 +3,10 @@
 import uuid
 from datetime import datetime
 from typing import Optional
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+
+
+_BASE_CONFIG = ConfigDict(from_attributes=True, extra="ignore", defer_build=True)
 
 
 class CreateTeam(BaseModel):
@@ -18,13 +21,10 @@ class ReadTeam(BaseModel):
     id: uuid.UUID
     title: str
     user_id: uuid.UUID
-    created_at: Optional[datetime]
-    updated_at: Optional[datetime]
+    created_at: datetime
+    updated_at: datetime
 
-    model_config = ConfigDict(
-        from_attributes=True,
-        extra="ignore"
-    )
+    model_config = _BASE_CONFIG
 
 
 class UpdateTeam(BaseModel):
@@ -32,10 +32,7 @@ class UpdateTeam(BaseModel):
 
     title: Optional[str]
 
-    model_config = ConfigDict(
-        from_attributes=True,
-        extra="ignore"
-    )
+    model_config = _BASE_CONFIG
 
 
 class CreateTeamMember(BaseModel):
@@ -44,10 +41,16 @@ class CreateTeamMember(BaseModel):
     team_id: uuid.UUID
     user_id: uuid.UUID
 
-    model_config = ConfigDict(
-        from_attributes=True,
-        extra="ignore"
-    )
+    model_config = _BASE_CONFIG
+
+
+class CreateTeamMembers(BaseModel):
+    """Create several members of one team"""
+
+    team_id: uuid.UUID
+    user_ids: list[uuid.UUID] = Field(min_length=1)
+
+    model_config = _BASE_CONFIG
 
 
 class ReadTeamMember(BaseModel):
@@ -56,9 +59,10 @@ class ReadTeamMember(BaseModel):
     id: uuid.UUID
     team_id: uuid.UUID
     user_id: uuid.UUID
-    created_at: Optional[datetime]
+    created_at: datetime
+
+    model_config = _BASE_CONFIG
+
 
-    model_config = ConfigDict(
-        from_attributes=True,
-        extra="ignore"
-    )
+READ_TEAM_LIST_ADAPTER = TypeAdapter(list[ReadTeam], config=ConfigDict(defer_build=True))
+READ_TEAM_MEMBER_LIST_ADAPTER = TypeAdapter(list[ReadTeamMember], config=ConfigDict(defer_build=True))
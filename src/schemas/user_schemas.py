@@ -3,20 +3,21 @@
 import uuid
 from datetime import datetime
 from typing import Optional
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 from fastapi_users import schemas
 from src.models.user_models import Roles
 
 
+_BASE_CONFIG = ConfigDict(from_attributes=True, extra="ignore")
+_USER_CONFIG = ConfigDict(from_attributes=True, extra="ignore", arbitrary_types_allowed=True)
+
+
 class User(BaseModel):
     """User"""
 
     name: str
 
-    model_config = ConfigDict(
-        from_attributes=True,
-        extra="ignore"
-    )
+    model_config = _BASE_CONFIG
 
 
 class UserCreate(schemas.BaseUserCreate):
@@ -36,14 +37,10 @@ class UserRead(schemas.BaseUser[uuid.UUID]):
     profile_picture: Optional[str]
     bio: Optional[str]
     role: Roles
-    created_at: Optional[datetime]
-    updated_at: Optional[datetime]
+    created_at: datetime
+    updated_at: datetime
 
-    model_config = ConfigDict(
-        extra="ignore",
-        from_attributes = True,
-        arbitrary_types_allowed = True
-    )
+    model_config = _USER_CONFIG
 
 
 class UserUpdate(schemas.BaseUserUpdate):
@@ -55,7 +52,7 @@ class UserUpdate(schemas.BaseUserUpdate):
     bio: Optional[str] = None
     role: Optional[Roles] = Roles.MEMBER
 
-    model_config = ConfigDict(
-        extra="ignore",
-        from_attributes = True
-    )
+    model_config = _BASE_CONFIG
+
+
+USER_READ_LIST_ADAPTER = TypeAdapter(list[UserRead], config=ConfigDict(defer_build=True))
@@ -0,0 +1,146 @@
+"""Background activity log queue for the Manager API."""
+
+import asyncio
+import logging
+from typing import Optional
+from sqlalchemy import insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from src.db.db_session import async_session_maker
+from src.models.activity_models import ActivityLog
+
+logger = logging.getLogger(__name__)
+
+
+class ActivityLogQueue:
+    """Buffer activity log payloads and write them in batches."""
+
+    def __init__(
+        self, session_maker: async_sessionmaker, maxsize: int = 10000,
+        batch_size: int = 100, flush_interval: float = 0.01
+    ):
+        """
+        Initialize the ActivityLogQueue.
+
+        Args:
+        session_maker (async_sessionmaker): Factory for the sessions used to write batches.
+        maxsize (int): Maximum number of pending activity logs before new ones are dropped.
+        batch_size (int): Maximum number of activity logs written per INSERT.
+        flush_interval (float): Seconds to wait for more logs before flushing a batch.
+        """
+        self.session_maker = session_maker
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue: asyncio.Queue[dict] = asyncio.Queue(maxsize=maxsize)
+        self._consumer: Optional[asyncio.Task] = None
+
+    def put(self, activity_data: dict) -> None:
+        """
+        Enqueue an activity log without waiting for it to be written.
+
+        If the queue is full the activity log is dropped with a warning
+        rather than blocking the request.
+
+        Args:
+        activity_data (dict): The activity log column values.
+        """
+        try:
+            self._queue.put_nowait(activity_data)
+        except asyncio.QueueFull:
+            logger.warning(
+                "Activity log queue is full, dropping %s activity for %s %s",
+                activity_data.get("activity_type"), activity_data.get("entity"),
+                activity_data.get("entity_id")
+            )
+
+    async def start(self) -> None:
+        """Start the background consumer."""
+        if self._consumer is None:
+            self._consumer = asyncio.create_task(self._consume())
+
+    async def stop(self) -> None:
+        """Stop the background consumer and write any pending activity logs."""
+        if self._consumer is not None:
+            self._consumer.cancel()
+            try:
+                await self._consumer
+            except asyncio.CancelledError:
+                pass
+            self._consumer = None
+        while not self._queue.empty():
+            await self._flush(self._drain(self.batch_size))
+
+    def _drain(self, limit: int) -> list[dict]:
+        """Pop up to `limit` queued activity logs without waiting."""
+        batch = []
+        while len(batch) < limit and not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+        return batch
+
+    async def _consume(self) -> None:
+        """Collect queued activity logs into batches and write them."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.flush_interval
+            while len(batch) < self.batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            await self._flush(batch)
+
+    async def _flush(self, batch: list[dict]) -> None:
+        """
+        Write a batch of activity logs with a single executemany INSERT.
+
+        If the batch fails, it is split in half and each half is retried, so
+        one bad row (e.g. a foreign key to a row deleted meanwhile) only
+        loses itself rather than everyone else's activity logs.
+
+        Args:
+        batch (list[dict]): The activity logs to write.
+        """
+        if not batch:
+            return
+        error = await self._write(batch)
+        if error is None:
+            return
+        if len(batch) == 1:
+            activity_data = batch[0]
+            logger.error(
+                "Dropping %s activity for %s %s by user %s that could not be written",
+                activity_data.get("activity_type"), activity_data.get("entity"),
+                activity_data.get("entity_id"), activity_data.get("user_id"),
+                exc_info=error
+            )
+            return
+        logger.warning("Failed to write %d activity logs, retrying in halves", len(batch))
+        middle = len(batch) // 2
+        await self._flush(batch[:middle])
+        await self._flush(batch[middle:])
+
+    async def _write(self, batch: list[dict]) -> Optional[SQLAlchemyError]:
+        """
+        Insert a batch of activity logs in one transaction.
+
+        Args:
+        batch (list[dict]): The activity logs to write.
+
+        Returns:
+        SQLAlchemyError: The error the batch was rolled back for, or None if it was written.
+        """
+        async with self.session_maker() as session:
+            try:
+                await session.execute(insert(ActivityLog), batch)
+                await session.commit()
+            except SQLAlchemyError as e:
+                await session.rollback()
+                return e
+        return None
+
+
+activity_queue = ActivityLogQueue(async_session_maker)
@@ -1,51 +1,150 @@
 """Activity log services."""
 
 import uuid
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 from fastapi import Depends
-from sqlalchemy import select, asc, desc
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.exc import SQLAlchemyError
-from src.db.db_session import get_async_session
+from sqlalchemy import bindparam, delete, insert, select, asc, desc
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.exc import IntegrityError
+from src.db.db_session import async_session_maker, get_async_session, get_session_maker
 from src.models.activity_models import ActivityLog, ActivityType
 from src.core.utils.check_access import require_project_access, require_task_access
+from src.core.utils.pagination import Cursor, after_cursor
+
+
+_ACTIVITY_ORDER = {
+    "desc": (desc(ActivityLog.created_at), desc(ActivityLog.id)),
+    "asc": (asc(ActivityLog.created_at), asc(ActivityLog.id)),
+}
+_DELETE_ACTIVITY = delete(ActivityLog).where(
+    ActivityLog.id == bindparam("activity_id"),
+    ActivityLog.project_id == bindparam("project_id")
+).returning(ActivityLog.id)
+
+
+async def _iter_activities(
+    session_maker: async_sessionmaker[AsyncSession], *criteria,
+    order: str, batch_size: int = 200
+) -> AsyncIterator[ActivityLog]:
+    """
+    Stream activities matching the given criteria from a server-side cursor.
+
+    Rows are fetched `batch_size` at a time, so memory stays flat however
+    many activities match. The generator opens its own session because it
+    is consumed while the response body is sent, after the request's
+    session has been closed.
+
+    Args:
+    session_maker (async_sessionmaker): The factory of the generator's session.
+    criteria: The WHERE clauses to filter activities by.
+    order (str): Order of the activities by creation time (asc or desc).
+    batch_size (int): Number of rows fetched per round trip.
+
+    Yields:
+    ActivityLog: The matching activities.
+    """
+    statement = select(ActivityLog).where(*criteria).order_by(
+        *_ACTIVITY_ORDER.get(order, _ACTIVITY_ORDER["asc"])
+    ).execution_options(yield_per=batch_size)
+    async with session_maker() as session:
+        result = await session.stream_scalars(statement)
+        async for activity in result:
+            yield activity
 
 
 class ActivityServices:
     """Activity log services for the Manager API."""
 
-    def __init__(self, session: AsyncSession):
+    def __init__(
+        self, session: AsyncSession,
+        session_maker: async_sessionmaker[AsyncSession] = async_session_maker
+    ):
         """
         Initialize the ActivityServices with a database session.
 
         Args:
         session (AsyncSession): The database session for executing queries.
+        session_maker (async_sessionmaker): The session factory used by exports.
         """
         self.session = session
+        self.session_maker = session_maker
     
-    async def create_activity(self, activity_data: dict):
+    async def _list_activities(
+        self, *criteria, order: str, limit: int, offset: int,
+        cursor: Optional[Cursor] = None
+    ) -> List[ActivityLog]:
+        """
+        Retrieve a page of activities matching the given criteria.
+
+        With a cursor the page starts right after the (created_at, id) of the
+        last activity of the previous page, which is an index range scan
+        however deep the page is; offset then only skips within that range.
+
+        Args:
+        criteria: The WHERE clauses to filter activities by.
+        order (str): Order of the activities by creation time (asc or desc).
+        limit (int): Maximum number of activities to retrieve.
+        offset (int): Number of activities to skip.
+        cursor (Cursor): The (created_at, id) of the last activity already seen.
+
+        Returns:
+        List[ActivityLog]: The matching activities.
+        """
+        statement = select(ActivityLog).where(*criteria)
+        if cursor is not None:
+            statement = statement.where(
+                after_cursor(ActivityLog.created_at, ActivityLog.id, cursor, order)
+            )
+        statement = statement.order_by(
+            *_ACTIVITY_ORDER.get(order, _ACTIVITY_ORDER["asc"])
+        ).limit(limit).offset(offset)
+        result = await self.session.execute(statement)
+        return result.scalars().all()
+
+    def stage_activity(self, activity_data: dict) -> ActivityLog:
+        """
+        Add an activity log entry to the current unit of work without committing.
+
+        The entry is written by the caller's next commit, together with the
+        change it describes.
+
+        Args:
+        activity_data (dict): The activity log column values.
+
+        Returns:
+        ActivityLog: The pending activity log.
+        """
+        activity = ActivityLog(**activity_data)
+        self.session.add(activity)
+        return activity
+
+    async def create_activity(self, activity_data: dict) -> Optional[ActivityLog]:
         """
         Create a new activity log entry in the database.
 
         Args:
-        activity_type (ActivityType): The type of activity to create.
-        
+        activity_data (dict): The activity log column values.
+
         Returns:
-        None
+        ActivityLog: The created activity log, or None if it could not be written.
         """
         try:
-            activity = ActivityLog(**activity_data)
-            self.session.add(activity)
+            statement = insert(ActivityLog).values(**activity_data).returning(ActivityLog)
+            result = await self.session.execute(
+                statement, execution_options={"populate_existing": True}
+            )
+            activity = result.scalar_one()
             await self.session.commit()
-        except SQLAlchemyError as e:
-            print(e)
+            return activity
+        except IntegrityError:
             await self.session.rollback()
             return None
 
     @require_project_access(project_arg="project_id", user_arg="user_id")
     async def get_all_activities(
         self, project_id: uuid.UUID, user_id: uuid.UUID,
-        order: str, limit: int, offset: int
+        order: str, limit: int, offset: int,
+        cursor: Optional[Cursor] = None
     ) -> List[ActivityLog]:
         """
         Retrieve all activities from the database.
@@ -56,22 +155,15 @@ class ActivityServices:
         order (str): Order of the activities (asc or desc).
         limit (int): Maximum number of activities to retrieve.
         offset (int): Number of activities to skip.
+        cursor (Cursor): The (created_at, id) of the last activity already seen.
 
         Returns:
         List[ActivityLog]: A list of ActivityLog objects representing the retrieved activities.
         """
-        try:
-            statement = select(ActivityLog).where(ActivityLog.project_id == project_id)
-            if order == "desc":
-                statement = statement.order_by(desc(ActivityLog.created_at))
-            else:
-                statement = statement.order_by(asc(ActivityLog.created_at))
-            statement = statement.limit(limit).offset(offset)
-            result = await self.session.execute(statement)
-            activities = result.scalars().all()
-            return activities
-        except SQLAlchemyError:
-            return None
+        return await self._list_activities(
+            ActivityLog.project_id == project_id,
+            order=order, limit=limit, offset=offset, cursor=cursor
+        )
 
     @require_project_access(project_arg="project_id", user_arg="user_id")
     async def get_activity_by_id(
@@ -89,20 +181,16 @@ class ActivityServices:
         Returns:
         ActivityLog: The ActivityLog object representing the retrieved activity, or None if not found.
         """
-        try:
-            statement = select(ActivityLog).where(
-                ActivityLog.id == activity_id, ActivityLog.project_id == project_id
-            )
-            result = await self.session.execute(statement)
-            activity = result.scalars().one_or_none()
-            return activity
-        except SQLAlchemyError:
+        activity = await self.session.get(ActivityLog, activity_id)
+        if activity is None or activity.project_id != project_id:
             return None
+        return activity
 
     @require_task_access(task_arg="task_id", user_arg="user_id")
     async def get_all_user_activities(
         self, user_id: uuid.UUID, task_id: uuid.UUID,
-        order: str, limit: int, offset: int
+        order: str, limit: int, offset: int,
+        cursor: Optional[Cursor] = None
     ) -> List[ActivityLog]:
         """
         Retrieve all activities for a specific user from the database.
@@ -112,29 +200,21 @@ class ActivityServices:
         order (str): Order of the activities (asc or desc).
         limit (int): Maximum number of activities to retrieve.
         offset (int): Number of activities to skip.
+        cursor (Cursor): The (created_at, id) of the last activity already seen.
 
         Returns:
         List[ActivityLog]: A list of ActivityLog objects representing the retrieved activities.
         """
-        try:
-            statement = select(ActivityLog).where(
-                ActivityLog.task_id == task_id, ActivityLog.user_id == user_id
-            )
-            if order == "desc":
-                statement = statement.order_by(desc(ActivityLog.created_at))
-            else:
-                statement = statement.order_by(asc(ActivityLog.created_at))
-            statement = statement.limit(limit).offset(offset)
-            result = await self.session.execute(statement)
-            activities = result.scalars().all()
-            return activities
-        except SQLAlchemyError:
-            return None
+        return await self._list_activities(
+            ActivityLog.task_id == task_id, ActivityLog.user_id == user_id,
+            order=order, limit=limit, offset=offset, cursor=cursor
+        )
     
     @require_task_access(task_arg="task_id", user_arg="user_id")
     async def get_all_team_activities(
         self, team_id: uuid.UUID, task_id: uuid.UUID, user_id: uuid.UUID,
-        order: str, limit: int, offset: int
+        order: str, limit: int, offset: int,
+        cursor: Optional[Cursor] = None
     ) -> List[ActivityLog]:
         """
         Retrieve all activities for a specific team from the database.
@@ -146,29 +226,21 @@ class ActivityServices:
         order (str): Order of the activities (asc or desc).
         limit (int): Maximum number of activities to retrieve.
         offset (int): Number of activities to skip.
+        cursor (Cursor): The (created_at, id) of the last activity already seen.
 
         Returns:
         List[ActivityLog]: A list of ActivityLog objects representing the retrieved activities.
         """
-        try:
-            statement = select(ActivityLog).where(
-                ActivityLog.task_id == task_id, ActivityLog.team_id == team_id
-            )
-            if order == "desc":
-                statement = statement.order_by(desc(ActivityLog.created_at))
-            else:
-                statement = statement.order_by(asc(ActivityLog.created_at))
-            statement = statement.limit(limit).offset(offset)
-            result = await self.session.execute(statement)
-            activities = result.scalars().all()
-            return activities
-        except SQLAlchemyError:
-            return None
+        return await self._list_activities(
+            ActivityLog.task_id == task_id, ActivityLog.team_id == team_id,
+            order=order, limit=limit, offset=offset, cursor=cursor
+        )
 
     @require_project_access(project_arg="project_id", user_arg="user_id")
     async def get_all_project_activities(
         self, project_id: uuid.UUID, user_id: uuid.UUID,
-        order: str, limit: int, offset: int
+        order: str, limit: int, offset: int,
+        cursor: Optional[Cursor] = None
     ) -> List[ActivityLog]:
         """
         Retrieve all activities for a specific project from the database.
@@ -179,27 +251,40 @@ class ActivityServices:
         order (str): Order of the activities (asc or desc).
         limit (int): Maximum number of activities to retrieve.
         offset (int): Number of activities to skip.
+        cursor (Cursor): The (created_at, id) of the last activity already seen.
 
         Returns:
         List[ActivityLog]: A list of ActivityLog objects representing the retrieved activities.
         """
-        try:
-            statement = select(ActivityLog).where(ActivityLog.project_id == project_id)
-            if order == "desc":
-                statement = statement.order_by(desc(ActivityLog.created_at))
-            else:
-                statement = statement.order_by(asc(ActivityLog.created_at))
-            statement = statement.limit(limit).offset(offset)
-            result = await self.session.execute(statement)
-            activities = result.scalars().all()
-            return activities
-        except SQLAlchemyError:
-            return None
+        return await self._list_activities(
+            ActivityLog.project_id == project_id,
+            order=order, limit=limit, offset=offset, cursor=cursor
+        )
     
+    @require_project_access(project_arg="project_id", user_arg="user_id")
+    async def stream_project_activities(
+        self, project_id: uuid.UUID, user_id: uuid.UUID, order: str
+    ) -> AsyncIterator[ActivityLog]:
+        """
+        Stream every activity of a project, for exports.
+
+        Args:
+        project_id (uuid.UUID): The ID of the project whose activities to stream.
+        user_id (uuid.UUID): The ID of the user who is a member of the team.
+        order (str): Order of the activities (asc or desc).
+
+        Returns:
+        AsyncIterator[ActivityLog]: The project's activities.
+        """
+        return _iter_activities(
+            self.session_maker, ActivityLog.project_id == project_id, order=order
+        )
+
     @require_task_access(task_arg="task_id", user_arg="user_id")
     async def get_all_task_activities(
         self, task_id: uuid.UUID, user_id: uuid.UUID,
-        order: str, limit: int, offset: int
+        order: str, limit: int, offset: int,
+        cursor: Optional[Cursor] = None
     ) -> List[ActivityLog]:
         """
         Retrieve all activities for a specific task from the database.
@@ -210,27 +295,21 @@ class ActivityServices:
         order (str): Order of the activities (asc or desc).
         limit (int): Maximum number of activities to retrieve.
         offset (int): Number of activities to skip.
+        cursor (Cursor): The (created_at, id) of the last activity already seen.
 
         Returns:
         List[ActivityLog]: A list of ActivityLog objects representing the retrieved activities.
         """
-        try:
-            statement = select(ActivityLog).where(ActivityLog.task_id == task_id)
-            if order == "desc":
-                statement = statement.order_by(desc(ActivityLog.created_at))
-            else:
-                statement = statement.order_by(asc(ActivityLog.created_at))
-            statement = statement.limit(limit).offset(offset)
-            result = await self.session.execute(statement)
-            activities = result.scalars().all()
-            return activities
-        except SQLAlchemyError:
-            return None
+        return await self._list_activities(
+            ActivityLog.task_id == task_id,
+            order=order, limit=limit, offset=offset, cursor=cursor
+        )
 
     @require_project_access(project_arg="project_id", user_arg="user_id")
     async def filter_activities(
         self, type: ActivityType, project_id: uuid.UUID, user_id: uuid.UUID,
-        entity: str | None, order: str, limit: int, offset: int
+        entity: str | None, order: str, limit: int, offset: int,
+        cursor: Optional[Cursor] = None
     ) -> List[ActivityLog]:
         """
         Retrieve activities filtered by type from the database.
@@ -240,28 +319,17 @@ class ActivityServices:
         order (str): Order of the activities (asc or desc).
         limit (int): Maximum number of activities to retrieve.
         offset (int): Number of activities to skip.
+        cursor (Cursor): The (created_at, id) of the last activity already seen.
 
         Returns:
         List[ActivityLog]: A list of ActivityLog objects representing the filtered activities.
         """
-        try:
-            statement = select(ActivityLog).where(ActivityLog.project_id == project_id)
-            if entity:
-                statement = select(ActivityLog).where(
-                    ActivityLog.activity_type == type, ActivityLog.entity == entity
-                )
-            else:
-                statement = select(ActivityLog).where(ActivityLog.activity_type == type)
-            if order == "desc":
-                statement = statement.order_by(desc(ActivityLog.created_at))
-            else:
-                statement = statement.order_by(asc(ActivityLog.created_at))
-            statement = statement.limit(limit).offset(offset)
-            result = await self.session.execute(statement)
-            activities = result.scalars().all()
-            return activities
-        except SQLAlchemyError:
-            return None
+        criteria = [ActivityLog.project_id == project_id, ActivityLog.activity_type == type]
+        if entity:
+            criteria.append(ActivityLog.entity == entity)
+        return await self._list_activities(
+            *criteria, order=order, limit=limit, offset=offset, cursor=cursor
+        )
 
     @require_project_access(project_arg="project_id", user_arg="user_id")
     async def delete_activity(
@@ -277,27 +345,25 @@ class ActivityServices:
         Returns:
         bool: True if the activity was deleted successfully, False otherwise.
         """
-        try:
-            statement = select(ActivityLog).where(
-                ActivityLog.id == activity_id, ActivityLog.project_id == project_id
-            )
-            result = await self.session.execute(statement)
-            activity = result.scalars().one_or_none()
-            if activity:
-                await self.session.delete(activity)
-                await self.session.commit()
-                return True
-            return False
-        except SQLAlchemyError:
-            return False
-
-
-async def get_activity_service(session: AsyncSession = Depends(get_async_session)):
+        deleted = (await self.session.execute(
+            _DELETE_ACTIVITY, {"activity_id": activity_id, "project_id": project_id}
+        )).first()
+        if deleted:
+            await self.session.commit()
+            return True
+        return False
+
+
+async def get_activity_service(
+    session: AsyncSession = Depends(get_async_session),
+    session_maker: async_sessionmaker[AsyncSession] = Depends(get_session_maker)
+):
     """
     Dependency function to retrieve the ActivityServices instance.
 
     Args:
     session (AsyncSession): The database session for executing queries.
+    session_maker (async_sessionmaker): The session factory used by exports.
 
     Returns:
     ActivityServices: The ActivityServices instance.
@@ -1,30 +1,119 @@
 """Project services for the Manager API."""
 
 import uuid
-from typing import List, Optional
-from fastapi import Depends, HTTPException
-from sqlalchemy import or_, select, asc, desc
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.orm import joinedload
-from src.db.db_session import get_async_session
+from typing import AsyncIterator, List, Optional
+from fastapi import Depends
+from sqlalchemy import Exists, Row, bindparam, delete, exists, insert, literal, or_, select, update, asc, desc
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.exc import IntegrityError
+from src.db.db_session import async_session_maker, get_async_session, get_session_maker
+from src.models.activity_models import ActivityType
 from src.models.project_models import Project
 from src.models.team_models import Team, TeamMember
-from src.services.team_services import TeamServices
+from src.services.activity_services import ActivityServices
+from src.core.utils.pagination import Cursor, after_cursor
+
+_PROJECT_ORDER = {
+    "desc": (desc(Project.created_at), desc(Project.id)),
+    "asc": (asc(Project.created_at), asc(Project.id)),
+}
+
+# Fixed-shape statements, built once and reused with bound parameters so
+# each call skips constructing the statement and computing its cache key.
+_GET_PROJECTS_FOR_MEMBER = (
+    select(Project)
+    .join(Team, Project.team_id == Team.id)
+    .join(TeamMember, TeamMember.team_id == Team.id)
+    .where(TeamMember.user_id == bindparam("user_id"))
+)
+_GET_PROJECT_IF_MEMBER = (
+    select(Project)
+    .where(
+        Project.id == bindparam("project_id"),
+        or_(
+            Project.user_id == bindparam("user_id"),
+            select(1).select_from(TeamMember).where(
+                TeamMember.team_id == Project.team_id,
+                TeamMember.user_id == bindparam("user_id")
+            ).exists()
+        )
+    )
+)
+_GET_PROJECT_BY_TITLE = select(Project).where(
+    Project.title == bindparam("title"), Project.user_id == bindparam("user_id")
+).limit(1)
+_DELETE_PROJECT = delete(Project).where(
+    Project.id == bindparam("project_id"), Project.user_id == bindparam("user_id")
+).returning(Project.id, Project.team_id, Project.user_id)
+
+# The ReadProject columns, selected directly by the list queries.
+_PROJECT_LIST_COLUMNS = (
+    Project.id, Project.title, Project.description, Project.user_id,
+    Project.team_id, Project.created_at, Project.updated_at,
+)
+
+
+def _owned_team(team_id: uuid.UUID, owner_id: uuid.UUID) -> Exists:
+    """
+    Build an EXISTS clause that holds when the user owns the team.
+
+    Args:
+    team_id (uuid.UUID): The ID of the team.
+    owner_id (uuid.UUID): The ID of the user who should own the team.
+
+    Returns:
+    Exists: The ownership check.
+    """
+    return exists().where(Team.id == team_id, Team.user_id == owner_id)
+
+
+async def _iter_projects(
+    session_maker: async_sessionmaker[AsyncSession], *criteria,
+    order: str, batch_size: int = 200
+) -> AsyncIterator[Row]:
+    """
+    Stream the ReadProject columns of matching projects from a server-side cursor.
+
+    Rows are fetched `batch_size` at a time, so memory stays flat however
+    many projects match. The generator opens its own session because it
+    is consumed while the response body is sent, after the request's
+    session has been closed.
+
+    Args:
+    session_maker (async_sessionmaker): The factory of the generator's session.
+    criteria: The WHERE clauses to filter projects by.
+    order (str): Order of the projects by creation time (asc or desc).
+    batch_size (int): Number of rows fetched per round trip.
+
+    Yields:
+    Row: The matching projects.
+    """
+    statement = select(*_PROJECT_LIST_COLUMNS).where(*criteria).order_by(
+        *_PROJECT_ORDER.get(order, _PROJECT_ORDER["asc"])
+    ).execution_options(yield_per=batch_size)
+    async with session_maker() as session:
+        result = await session.stream(statement)
+        async for project in result:
+            yield project
 
 
 class ProjectServices:
     """Project services for the Manager API."""
 
-    def __init__(self, session: AsyncSession):
+    def __init__(
+        self, session: AsyncSession,
+        session_maker: async_sessionmaker[AsyncSession] = async_session_maker
+    ):
         """
         Initialize the ProjectServices with a database session.
 
         Args:
         session (AsyncSession): The database session for executing queries.
+        session_maker (async_sessionmaker): The session factory used by exports.
         """
         self.session = session
-        self.team_services = TeamServices(self.session)
+        self.session_maker = session_maker
+        self.activity_services = ActivityServices(self.session, self.session_maker)
 
     async def create_project(self, data: dict) -> Optional[Project]:
         """
@@ -35,26 +124,40 @@ class ProjectServices:
         data (dict): The data for the project to be created.
 
         Returns:
-        Project: The created project.
+        Project: The created project. Or None if the title is taken or the
+                user does not own the team.
         """
         try:
-            team = await self.team_services.get_user_team_by_id(
-                data["user_id"], data["team_id"]
+            columns = Project.__table__.c
+            row = select(
+                *(literal(value, columns[key].type) for key, value in data.items())
+            ).where(_owned_team(data["team_id"], data["user_id"]))
+            statement = insert(Project).from_select(list(data), row).returning(Project)
+            result = await self.session.execute(
+                statement, execution_options={"populate_existing": True}
             )
-            if not team:
-                raise HTTPException(status_code=404, detail="Team not found")
-            project = Project(**data)
-            self.session.add(project)
+            project = result.scalar_one_or_none()
+            if not project:
+                return None
+            self.activity_services.stage_activity({
+                "user_id": project.user_id,
+                "team_id": project.team_id,
+                "project_id": project.id,
+                "description": f"A new Project with id {str(project.id)} has been created.",
+                "activity_type": ActivityType.CREATE,
+                "entity": "project",
+                "entity_id": project.id
+            })
             await self.session.commit()
-            await self.session.refresh(project)
             return project
-        except SQLAlchemyError:
+        except IntegrityError:
+            await self.session.rollback()
             return None
 
     async def get_all_projects(
         self, user_id: uuid.UUID, order: str = "asc",
-        limit: int = 20, offset: int = 0
-    ) -> List[Project]:
+        limit: int = 20, offset: int = 0, cursor: Optional[Cursor] = None
+    ) -> List[Row]:
         """
         Retrieve all projects from the database.
 
@@ -64,27 +167,41 @@ class ProjectServices:
         limit (int, optional): The maximum number of projects to retrieve. Default is 20.
         offset (int, optional): The number of projects to skip before
                 retrieving the first project. Default is 0.
+        cursor (Cursor, optional): The (created_at, id) of the last project already seen.
 
         Returns:
-        list: A list of all projects.
+        list: The ReadProject columns of the projects.
         """
-        try:
-            statement = select(Project).where(Project.user_id == user_id)
-            if order == "desc":
-                statement = statement.order_by(desc(Project.created_at))
-            else:
-                statement = statement.order_by(asc(Project.created_at))
-            statement = statement.limit(limit).offset(offset)
-            result = await self.session.execute(statement)
-            projects = result.scalars().all()
-            return projects
-        except SQLAlchemyError:
-            return None
+        statement = select(*_PROJECT_LIST_COLUMNS).where(Project.user_id == user_id)
+        if cursor is not None:
+            statement = statement.where(
+                after_cursor(Project.created_at, Project.id, cursor, order)
+            )
+        statement = statement.order_by(
+            *_PROJECT_ORDER.get(order, _PROJECT_ORDER["asc"])
+        ).limit(limit).offset(offset)
+        result = await self.session.execute(statement)
+        projects = result.all()
+        return projects
+
+    def stream_user_projects(self, user_id: uuid.UUID, order: str) -> AsyncIterator[Row]:
+        """
+        Stream every project of a user, for exports.
+
+        Args:
+        user_id (uuid.UUID): The ID of the user who owns the projects.
+        order (str): Order of the projects (asc or desc).
+
+        Returns:
+        AsyncIterator[Row]: The ReadProject columns of the user's projects.
+        """
+        return _iter_projects(self.session_maker, Project.user_id == user_id, order=order)
 
     async def get_all_team_projects(
         self, team_id: uuid.UUID, owner_id: uuid.UUID,
-        order: str = "asc", limit: int = 20, offset: int = 0
-    ) -> List[Project]:
+        order: str = "asc", limit: int = 20, offset: int = 0,
+        cursor: Optional[Cursor] = None
+    ) -> Optional[List[Row]]:
         """
         Retrieve all projects from the database.
 
@@ -95,25 +212,30 @@ class ProjectServices:
         limit (int, optional): The maximum number of projects to retrieve. Default is 20.
         offset (int, optional): The number of projects to skip before
                 retrieving the first project. Default is 0.
+        cursor (Cursor, optional): The (created_at, id) of the last project already seen.
 
         Returns:
-        list: A list of all projects.
+        list: The ReadProject columns of the projects. Or None if the user does not own the team.
         """
-        try:
-            team = await self.team_services.get_user_team_by_id(owner_id, team_id)
-            if not team:
-                raise HTTPException(status_code=404, detail="Team not found")
-            statement = select(Project).where(Project.team_id == team_id)
-            if order == "desc":
-                statement = statement.order_by(desc(Project.created_at))
-            else:
-                statement = statement.order_by(asc(Project.created_at))
-            statement = statement.limit(limit).offset(offset)
-            result = await self.session.execute(statement)
-            projects = result.scalars().all()
-            return projects
-        except SQLAlchemyError:
+        statement = select(*_PROJECT_LIST_COLUMNS).join(
+            Team, Team.id == Project.team_id
+        ).where(
+            Project.team_id == team_id, Team.user_id == owner_id
+        )
+        if cursor is not None:
+            statement = statement.where(
+                after_cursor(Project.created_at, Project.id, cursor, order)
+            )
+        statement = statement.order_by(
+            *_PROJECT_ORDER.get(order, _PROJECT_ORDER["asc"])
+        ).limit(limit).offset(offset)
+        result = await self.session.execute(statement)
+        projects = result.all()
+        if not projects and not await self.session.scalar(
+            select(_owned_team(team_id, owner_id))
+        ):
             return None
+        return projects
 
     async def get_team_projects_for_user(self, user_id: uuid.UUID) -> List[Project] | None:
         """
@@ -125,18 +247,8 @@ class ProjectServices:
         Returns:
         list: A list of all projects that the user is a member of.
         """
-        try:
-            statement = (
-                select(Project)
-                .join(Team, Project.team_id == Team.id)
-                .join(TeamMember, TeamMember.team_id == Team.id)
-                .where(TeamMember.user_id == user_id)
-                .options(joinedload(Project.team), joinedload(Project.user))
-            )
-            result = await self.session.execute(statement)
-            return result.scalars().all()
-        except SQLAlchemyError:
-            return None
+        result = await self.session.execute(_GET_PROJECTS_FOR_MEMBER, {"user_id": user_id})
+        return result.scalars().all()
 
     async def get_project_if_member(
         self, project_id: uuid.UUID, user_id: uuid.UUID
@@ -151,24 +263,10 @@ class ProjectServices:
         Returns:
         Project: The project if the user is a member of the project, otherwise None.
         """
-        try:
-            statement = (
-                select(Project)
-                .outerjoin(Team, Project.team_id == Team.id)
-                .outerjoin(TeamMember, TeamMember.team_id == Team.id)
-                .where(
-                    Project.id == project_id,
-                    or_(
-                        TeamMember.user_id == user_id,
-                        Project.user_id == user_id
-                    )
-                )
-                .options(joinedload(Project.team), joinedload(Project.user))
-            )
-            result = await self.session.execute(statement)
-            return result.scalar_one_or_none()
-        except SQLAlchemyError:
-            return None
+        result = await self.session.execute(
+            _GET_PROJECT_IF_MEMBER, {"project_id": project_id, "user_id": user_id}
+        )
+        return result.scalar_one_or_none()
 
     async def get_user_project_by_id(
         self, user_id: uuid.UUID, project_id: uuid.UUID
@@ -183,15 +281,10 @@ class ProjectServices:
         Returns:
         Project: The project with the specified ID and user ID.
         """
-        try:
-            statement = select(Project).where(
-                Project.id == project_id, Project.user_id == user_id
-            )
-            result = await self.session.execute(statement)
-            project = result.scalars().first()
-            return project
-        except SQLAlchemyError:
+        project = await self.session.get(Project, project_id)
+        if project is None or project.user_id != user_id:
             return None
+        return project
 
     async def get_user_project_by_title(
         self, user_id: uuid.UUID, project_title: str
@@ -206,15 +299,11 @@ class ProjectServices:
         Returns:
         Project: The project with the specified title and user ID.
         """
-        try:
-            statement = select(Project).where(
-                Project.title == project_title, Project.user_id == user_id
-            )
-            result = await self.session.execute(statement)
-            project = result.scalars().first()
-            return project
-        except SQLAlchemyError:
-            return None
+        result = await self.session.execute(
+            _GET_PROJECT_BY_TITLE, {"title": project_title, "user_id": user_id}
+        )
+        project = result.scalar_one_or_none()
+        return project
 
     async def update_project(
         self, project_id: uuid.UUID, user_id: uuid.UUID, data: dict
@@ -231,19 +320,28 @@ class ProjectServices:
         Project: The updated project. Or None if the project was not found.
         """
         try:
-            statement = select(Project).where(
+            statement = update(Project).where(
                 Project.id == project_id, Project.user_id == user_id
+            ).values(**data).returning(Project).execution_options(
+                synchronize_session=False, populate_existing=True
             )
             result = await self.session.execute(statement)
-            project = result.scalars().first()
+            project = result.scalar_one_or_none()
             if project:
-                for key, value in data.items():
-                    setattr(project, key, value)
+                self.activity_services.stage_activity({
+                    "user_id": project.user_id,
+                    "team_id": project.team_id,
+                    "project_id": project.id,
+                    "description": f"Project with id {str(project.id)} has been updated.",
+                    "activity_type": ActivityType.UPDATE,
+                    "entity": "project",
+                    "entity_id": project.id
+                })
                 await self.session.commit()
-                await self.session.refresh(project)
                 return project
             return None
-        except SQLAlchemyError:
+        except IntegrityError:
+            await self.session.rollback()
             return None
 
     async def delete_project(
@@ -259,30 +357,36 @@ class ProjectServices:
         Returns:
         bool: True if the project was deleted. Or None if the project was not found.
         """
-        try:
-            statement = select(Project).where(
-                Project.id == project_id, Project.user_id == user_id
-            )
-            result = await self.session.execute(statement)
-            project = result.scalars().first()
-            if project:
-                project_data = project
-                await self.session.delete(project)
-                await self.session.commit()
-                return project_data
-            return None
-        except SQLAlchemyError:
-            return None
+        project = (await self.session.execute(
+            _DELETE_PROJECT, {"project_id": project_id, "user_id": user_id}
+        )).first()
+        if project:
+            # project_id is left unset: the row has just been deleted.
+            self.activity_services.stage_activity({
+                "user_id": project.user_id,
+                "team_id": project.team_id,
+                "description": f"Project with id {str(project.id)} has been deleted.",
+                "activity_type": ActivityType.DELETE,
+                "entity": "project",
+                "entity_id": project.id
+            })
+            await self.session.commit()
+            return True
+        return None
 
 
-async def get_project_services(session: AsyncSession = Depends(get_async_session)):
+async def get_project_services(
+    session: AsyncSession = Depends(get_async_session),
+    session_maker: async_sessionmaker[AsyncSession] = Depends(get_session_maker)
+):
     """
     Dependency to provide the ProjectServices instance.
 
     Args:
     session (AsyncSession): The database session to be used for executing queries.
+    session_maker (async_sessionmaker): The session factory used by exports.
 
     Yields:
     ProjectServices: An instance of ProjectServices initialized with the provided session.
     """
-    yield ProjectServices(session)
+    yield ProjectServices(session, session_maker)
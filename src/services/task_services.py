@@ -2,14 +2,78 @@
 
 import uuid
 from datetime import date
+from functools import lru_cache
 from typing import List, Optional
 from fastapi import Depends
-from sqlalchemy import or_, select, asc, desc
+from sqlalchemy import Row, bindparam, or_, select, insert, update, delete, asc, desc, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.exc import IntegrityError
 from src.db.db_session import get_async_session
+from src.core.utils.pagination import Cursor, after_cursor
 from src.models.task_models import TaskStatus, TaskPriority, Task, TaskComment
 
+TASK_UPDATE_FIELDS = frozenset({
+    "title", "description", "status", "priority", "due_date", "assigned_id"
+})
+
+# Fixed-shape statements, built once and reused with bound parameters so
+# each call skips constructing the statement and computing its cache key.
+_DELETE_TASK = delete(Task).where(
+    Task.id == bindparam("task_id"), Task.user_id == bindparam("user_id")
+).returning(Task.id, Task.user_id, Task.project_id)
+_DELETE_COMMENT = delete(TaskComment).where(
+    TaskComment.user_id == bindparam("user_id"), TaskComment.id == bindparam("comment_id")
+).returning(TaskComment.id, TaskComment.user_id, TaskComment.task_id)
+_GET_TASK_COMMENTS = select(TaskComment).where(
+    TaskComment.task_id == bindparam("task_id")
+).order_by(TaskComment.created_at.desc(), TaskComment.id.desc())
+
+# The ReadTask columns, selected directly by the list queries.
+_TASK_LIST_COLUMNS = (
+    Task.id, Task.title, Task.description, Task.due_date, Task.status,
+    Task.priority, Task.project_id, Task.user_id, Task.assigned_id,
+    Task.created_at, Task.updated_at,
+)
+
+
+# Optional filter_tasks criteria, in mask bit order. The last one starts
+# the page after a keyset cursor. Filters are served by ix_tasks_filter,
+# or by the partial ix_tasks_project_due when a due date is given.
+_TASK_FILTERS = (
+    Task.status == bindparam("status"),
+    Task.priority == bindparam("priority"),
+    Task.assigned_id == bindparam("assignee_id"),
+    Task.due_date == bindparam("due_date"),
+    tuple_(Task.created_at, Task.id) < tuple_(
+        bindparam("cursor_created_at", type_=Task.created_at.type),
+        bindparam("cursor_id", type_=Task.id.type),
+    ),
+)
+
+
+@lru_cache(maxsize=2 ** len(_TASK_FILTERS))
+def _filter_tasks_statement(mask: int):
+    """
+    Build the filter_tasks statement for one combination of filters.
+
+    There are only a few dozen combinations, so each is built once and then
+    reused with bound parameters.
+
+    Args:
+    mask (int): Bit i is set when the i-th entry of _TASK_FILTERS applies.
+
+    Returns:
+    Select: The statement, ordered newest first and limited to `limit` rows.
+    """
+    criteria = [
+        criterion for bit, criterion in enumerate(_TASK_FILTERS) if mask & (1 << bit)
+    ]
+    return select(Task).where(
+        Task.project_id == bindparam("project_id"),
+        or_(Task.user_id == bindparam("user_id"), Task.assigned_id == bindparam("user_id")),
+        *criteria
+    ).order_by(desc(Task.created_at), desc(Task.id)).limit(bindparam("limit"))
+
 
 class TaskServices:
     """Task services for the Manager API."""
@@ -34,19 +98,22 @@ class TaskServices:
         Task: The created task.
         """
         try:
-            task = Task(**data)
-            self.session.add(task)
+            statement = insert(Task).values(**data).returning(Task)
+            result = await self.session.execute(
+                statement, execution_options={"populate_existing": True}
+            )
+            task = result.scalar_one()
             await self.session.commit()
-            await self.session.refresh(task)
             return task
-        except SQLAlchemyError:
+        except IntegrityError:
             await self.session.rollback()
             return None
 
     async def get_tasks_by_project_id(
         self, project_id: uuid.UUID, user_id: uuid.UUID,
-        order: str = "asc", limit: int = 10, offset: int = 0
-    ) -> List[Task]:
+        order: str = "asc", limit: int = 10, offset: int = 0,
+        cursor: Optional[Cursor] = None
+    ) -> List[Row]:
         """
         Get tasks for a specific project.
 
@@ -56,26 +123,28 @@ class TaskServices:
         order (str, optional): The order in which to retrieve tasks. Defaults to "asc".
         limit (int, optional): The maximum number of tasks to retrieve. Defaults to 10.
         offset (int, optional): The number of tasks to skip before retrieving tasks. Defaults to 0.
+        cursor (Cursor, optional): The (created_at, id) of the last task already seen.
 
         Returns:
-        List[Task]: A list of tasks associated with the project.
+        List[Row]: The ReadTask columns of the tasks associated with the project.
         """
-        try:
-            statement = select(Task).where(Task.project_id == project_id,
-                or_(Task.user_id == user_id, Task.assigned_id == user_id)
-            )
+        statement = select(*_TASK_LIST_COLUMNS).where(Task.project_id == project_id,
+            or_(Task.user_id == user_id, Task.assigned_id == user_id)
+        )
 
-            if order == "desc":
-                statement = statement.order_by(desc(Task.created_at))
-            else:
-                statement = statement.order_by(asc(Task.created_at))
+        if cursor is not None:
+            statement = statement.where(
+                after_cursor(Task.created_at, Task.id, cursor, order)
+            )
+        if order == "desc":
+            statement = statement.order_by(desc(Task.created_at), desc(Task.id))
+        else:
+            statement = statement.order_by(asc(Task.created_at), asc(Task.id))
 
-            statement = statement.limit(limit).offset(offset)
-            result = await self.session.execute(statement)
-            tasks = result.scalars().all()
-            return tasks
-        except SQLAlchemyError:
-            return None
+        statement = statement.limit(limit).offset(offset)
+        result = await self.session.execute(statement)
+        tasks = result.all()
+        return tasks
 
     async def get_task_by_id(self, task_id: uuid.UUID, user_id: uuid.UUID) -> Task | None:
         """
@@ -88,20 +157,16 @@ class TaskServices:
         Returns:
         Task: The task with the specified ID.
         """
-        try:
-            statement = select(Task).where(Task.id == task_id,
-                or_(Task.user_id == user_id, Task.assigned_id == user_id)
-            )
-            result = await self.session.execute(statement)
-            task = result.scalars().first()
-            return task
-        except SQLAlchemyError:
+        task = await self.session.get(Task, task_id)
+        if task is None or user_id not in (task.user_id, task.assigned_id):
             return None
+        return task
 
     async def filter_tasks(
         self, project_id: uuid.UUID, task_status: Optional[str],
         task_priority: Optional[str], user_id: uuid.UUID,
-        assignee_id: Optional[uuid.UUID], due_date: Optional[date]
+        assignee_id: Optional[uuid.UUID], due_date: Optional[date],
+        limit: int = 20, cursor: Optional[Cursor] = None
     ) -> List[Task]:
         """
         Filter tasks based on the provided criteria.
@@ -113,35 +178,37 @@ class TaskServices:
             user_id (uuid.UUID): The ID of the user who created the tasks.
             assignee_id (uuid.UUID, optional): The ID of the assignee to filter tasks by.
             due_date (date, optional): The due date to filter tasks by.
+            limit (int): Maximum number of tasks to retrieve.
+            cursor (Cursor, optional): The (created_at, id) of the last task already seen.
 
         Returns:
-            List[Task]: A list of tasks that match the filter criteria.
+            List[Task]: A page of tasks that match the filter criteria, newest first.
+                Or None if the status or priority is not a valid value.
         """
         try:
-            statement = select(Task).where(
-                Task.project_id == project_id, or_(
-                    Task.user_id == user_id, Task.assigned_id == user_id
-                )
-            )
-            if task_status:
-                statement = statement.where(Task.status == TaskStatus(task_status))
-
-            if task_priority:
-                statement = statement.where(Task.priority == TaskPriority(task_priority))
-
-            if assignee_id:
-                statement = statement.where(Task.assigned_id == assignee_id)
-
-            if due_date:
-                statement = statement.where(Task.due_date == due_date)
-
-            result = await self.session.execute(statement)
-            tasks = result.scalars().all()
-            return tasks
-        except SQLAlchemyError:
+            task_status = TaskStatus(task_status) if task_status else None
+            task_priority = TaskPriority(task_priority) if task_priority else None
+        except ValueError:
             return None
-
-    async def delete_task(self, task_id: uuid.UUID, user_id: uuid.UUID) -> Task | None:
+        # In _TASK_FILTERS order, so each value maps to its mask bit.
+        filters = (task_status, task_priority, assignee_id, due_date, cursor)
+        mask = 0
+        for bit, value in enumerate(filters):
+            if value:
+                mask |= 1 << bit
+        params = {
+            "project_id": project_id, "user_id": user_id, "limit": limit,
+            "status": task_status, "priority": task_priority,
+            "assignee_id": assignee_id, "due_date": due_date,
+        }
+        if cursor is not None:
+            params["cursor_created_at"], params["cursor_id"] = cursor
+        statement = _filter_tasks_statement(mask)
+        result = await self.session.execute(statement, params)
+        tasks = result.scalars().all()
+        return tasks
+
+    async def delete_task(self, task_id: uuid.UUID, user_id: uuid.UUID) -> Row | None:
         """
         Delete a task by its ID.
 
@@ -150,20 +217,14 @@ class TaskServices:
         user_id (uuid.UUID): The ID of the user who created the task.
 
         Returns:
-        Task: The deleted task.
+        Row: The id, user_id and project_id of the deleted task.
         """
-        try:
-            statement = select(Task).where(Task.id == task_id, Task.user_id == user_id)
-            result = await self.session.execute(statement)
-            task = result.scalars().first()
-            if task:
-                task_data = task
-                await self.session.delete(task)
-                await self.session.commit()
-                return task_data
-            return None
-        except SQLAlchemyError:
-            return None
+        result = await self.session.execute(
+            _DELETE_TASK, {"task_id": task_id, "user_id": user_id}
+        )
+        task = result.first()
+        await self.session.commit()
+        return task
 
     async def update_task(
         self, task_id: uuid.UUID,
@@ -180,26 +241,23 @@ class TaskServices:
         Returns:
         Task: The updated task. Or None if the task was not found.
         """
+        values = {key: value for key, value in data.items() if key in TASK_UPDATE_FIELDS}
+        if not values:
+            return await self.get_task_by_id(task_id, user_id)
         try:
-            statement = select(Task).where(
+            statement = update(Task).where(
                 Task.id == task_id, or_(
                     Task.assigned_id == user_id, Task.user_id == user_id
                 )
+            ).values(**values).returning(Task).execution_options(
+                synchronize_session=False, populate_existing=True
             )
             result = await self.session.execute(statement)
-            task = result.scalars().first()
-            if task:
-                ALLOWED_FIELDS = {
-                    "title", "description", "status", "priority", "due_date", "assigned_id"
-                }
-                for key, value in data.items():
-                    if key in ALLOWED_FIELDS:
-                        setattr(task, key, value)
-                await self.session.commit()
-                await self.session.refresh(task)
-                return task
-            return None
-        except SQLAlchemyError:
+            task = result.scalar_one_or_none()
+            await self.session.commit()
+            return task
+        except IntegrityError:
+            await self.session.rollback()
             return None
 
 
@@ -226,12 +284,14 @@ class TaskCommentService:
         Task: The new created comment. Otherwise None
         """
         try:
-            comment = TaskComment(**data)
-            await self.session.add(comment)
+            statement = insert(TaskComment).values(**data).returning(TaskComment)
+            result = await self.session.execute(
+                statement, execution_options={"populate_existing": True}
+            )
+            comment = result.scalar_one()
             await self.session.commit()
-            await self.session.refresh(comment)
             return comment
-        except SQLAlchemyError:
+        except IntegrityError:
             await self.session.rollback()
             return None
 
@@ -246,13 +306,7 @@ class TaskCommentService:
         Returns:
         Task: The comment with the specified ID.
         """
-        try:
-            statement = select(TaskComment).where(TaskComment.id == comment_id)
-            result = await self.session.execute(statement)
-            comment = result.scalars().first()
-            return comment
-        except SQLAlchemyError:
-            return None
+        return await self.session.get(TaskComment, comment_id)
 
     async def get_comments_by_task_id(self, task_id: uuid.UUID, user_id: uuid.UUID) -> List[TaskComment]:
         """
@@ -265,17 +319,11 @@ class TaskCommentService:
         Returns:
         List[TaskComment]: A list of comments associated with the task.
         """
-        try:
-            statement = select(TaskComment).where(
-                TaskComment.task_id == task_id
-            ).order_by(TaskComment.created_at.desc())
-            result = await self.session.execute(statement)
-            comments = result.scalars().all()
-            return comments
-        except SQLAlchemyError:
-            return None
+        result = await self.session.execute(_GET_TASK_COMMENTS, {"task_id": task_id})
+        comments = result.scalars().all()
+        return comments
 
-    async def delete_comment(self, comment_id: uuid.UUID, user_id: uuid.UUID) -> TaskComment | None:
+    async def delete_comment(self, comment_id: uuid.UUID, user_id: uuid.UUID) -> Row | None:
         """
         Delete a comment by its ID.
 
@@ -284,22 +332,14 @@ class TaskCommentService:
         user_id (uuid.UUID): The ID of the user who created the comment.
 
         Returns:
-        Task: The deleted comment.
+        Row: The id, user_id and task_id of the deleted comment.
         """
-        try:
-            statement = select(TaskComment).where(
-                TaskComment.user_id == user_id, TaskComment.id == comment_id
-            )
-            result = await self.session.execute(statement)
-            comment = result.scalars().first()
-            if comment:
-                comment_data = comment
-                await self.session.delete(comment)
-                await self.session.commit()
-                return comment_data
-            return None
-        except SQLAlchemyError:
-            return None
+        result = await self.session.execute(
+            _DELETE_COMMENT, {"comment_id": comment_id, "user_id": user_id}
+        )
+        comment = result.first()
+        await self.session.commit()
+        return comment
 
     async def update_comment(
         self, comment_id: uuid.UUID,
@@ -316,20 +356,22 @@ class TaskCommentService:
         Returns:
         Task: The updated comment. Or None if the comment was not found.
         """
+        if not data:
+            return await self.session.scalar(select(TaskComment).where(
+                TaskComment.id == comment_id, TaskComment.user_id == user_id
+            ))
         try:
-            statement = select(TaskComment).where(
+            statement = update(TaskComment).where(
                 TaskComment.id == comment_id, TaskComment.user_id == user_id
+            ).values(**data).returning(TaskComment).execution_options(
+                synchronize_session=False, populate_existing=True
             )
             result = await self.session.execute(statement)
-            comment = result.scalars().first()
-            if comment:
-                for key, value in data.items():
-                    setattr(comment, key, value)
-                await self.session.commit()
-                await self.session.refresh(comment)
-                return comment
-            return None
-        except SQLAlchemyError:
+            comment = result.scalar_one_or_none()
+            await self.session.commit()
+            return comment
+        except IntegrityError:
+            await self.session.rollback()
             return None
 
 
@@ -3,10 +3,26 @@
 import uuid
 from typing import Optional
 from fastapi import Depends, HTTPException
-from sqlalchemy import select, asc, desc
+from sqlalchemy import bindparam, delete, func, insert, select, update, asc, desc
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
 from src.db.db_session import get_async_session
 from src.models.team_models import Team, TeamMember
+from src.core.utils.pagination import Cursor, after_cursor
+
+# The ReadTeamMember columns, selected directly by the member listing.
+_TEAM_MEMBER_LIST_COLUMNS = (
+    TeamMember.id, TeamMember.team_id, TeamMember.user_id, TeamMember.created_at,
+)
+
+# Fixed-shape statements, built once and reused with bound parameters.
+_GET_USER_TEAM_BY_NAME = select(Team).where(
+    Team.user_id == bindparam("user_id"), Team.title == bindparam("team_name")
+).limit(1)
+_DELETE_TEAM = delete(Team).where(
+    Team.id == bindparam("team_id"), Team.user_id == bindparam("user_id")
+).returning(Team.id)
 
 
 class TeamServices:
@@ -32,15 +48,21 @@ class TeamServices:
         Team: The created team.
         """
         try:
-            team = Team(**data)
-            self.session.add(team)
+            statement = insert(Team).values(**data).returning(Team)
+            result = await self.session.execute(
+                statement, execution_options={"populate_existing": True}
+            )
+            team = result.scalar_one()
             await self.session.commit()
-            await self.session.refresh(team)
             return team
-        except Exception as e:
+        except IntegrityError:
+            await self.session.rollback()
             return None
     
-    async def get_all_teams(self, owner_id: uuid.UUID, order: str = "asc", limit: int = 20, offset: int = 0):
+    async def get_all_teams(
+        self, owner_id: uuid.UUID, order: str = "asc", limit: int = 20, offset: int = 0,
+        cursor: Optional[Cursor] = None
+    ):
         """
         Retrieve all teams from the database.
 
@@ -49,15 +71,19 @@ class TeamServices:
         order (str): Order of the teams (asc or desc).
         limit (int): Maximum number of teams to retrieve.
         offset (int): Number of teams to skip.
+        cursor (Cursor): The (created_at, id) of the last team already seen.
 
         Returns:
         List[Team]: A list of teams.
         """
-        statement = select(Team).where(Team.user_id == owner_id)
+        # ReadTeam needs no relationships.
+        statement = select(Team).where(Team.user_id == owner_id).options(raiseload("*"))
+        if cursor is not None:
+            statement = statement.where(after_cursor(Team.created_at, Team.id, cursor, order))
         if order == "desc":
-            statement = statement.order_by(desc(Team.created_at))
+            statement = statement.order_by(desc(Team.created_at), desc(Team.id))
         else:
-            statement = statement.order_by(asc(Team.created_at))
+            statement = statement.order_by(asc(Team.created_at), asc(Team.id))
         statement = statement.limit(limit).offset(offset)
         result = await self.session.execute(statement)
         teams = result.scalars().all()
@@ -74,16 +100,11 @@ class TeamServices:
         Returns:
         Team: The team with the specified ID.
         """
-        statement = select(Team).where(
-            Team.id == team_id, Team.user_id == owner_id
-        )
-        result = await self.session.execute(statement)
-        team = result.scalars().first()
-        return team
+        return await self.get_user_team_by_id(owner_id, team_id)
     
     async def get_user_teams(
         self, user_id: uuid.UUID, order: str = "asc",
-        limit: int = 20, offset: int = 0
+        limit: int = 20, offset: int = 0, cursor: Optional[Cursor] = None
     ):
         """
         Retrieve all teams associated with a user from the database.
@@ -93,15 +114,18 @@ class TeamServices:
         order (str): Order of the teams (asc or desc).
         limit (int): Maximum number of teams to retrieve.
         offset (int): Number of teams to skip.
+        cursor (Cursor): The (created_at, id) of the last team already seen.
 
         Returns:
         List[Team]: A list of teams associated with the user.
         """
-        statement = select(Team).where(Team.user_id == user_id)
+        statement = select(Team).where(Team.user_id == user_id).options(raiseload("*"))
+        if cursor is not None:
+            statement = statement.where(after_cursor(Team.created_at, Team.id, cursor, order))
         if order == "desc":
-            statement = statement.order_by(desc(Team.created_at))
+            statement = statement.order_by(desc(Team.created_at), desc(Team.id))
         else:
-            statement = statement.order_by(asc(Team.created_at))
+            statement = statement.order_by(asc(Team.created_at), asc(Team.id))
         statement = statement.limit(limit).offset(offset)
         result = await self.session.execute(statement)
         teams = result.scalars().all()
@@ -118,9 +142,9 @@ class TeamServices:
         Returns:
         Team: The team with the specified ID associated with the user.
         """
-        statement = select(Team).where(Team.user_id == user_id, Team.id == team_id)
-        result = await self.session.execute(statement)
-        team = result.scalars().first()
+        team = await self.session.get(Team, team_id, options=[raiseload("*")])
+        if team is None or team.user_id != user_id:
+            return None
         return team
     
     async def get_user_team_by_name(self, user_id: uuid.UUID, team_name: str):
@@ -134,10 +158,10 @@ class TeamServices:
         Returns:
         Team: The team with the specified name associated with the user.
         """
-        statement = select(Team).where(Team.user_id == user_id, Team.title == team_name)
-        result = await self.session.execute(statement)
-        team = result.scalars().first()
-        return team
+        result = await self.session.execute(
+            _GET_USER_TEAM_BY_NAME, {"user_id": user_id, "team_name": team_name}
+        )
+        return result.scalar_one_or_none()
     
     async def get_total_teams(self, user_id: uuid.UUID) -> int:
         """
@@ -149,10 +173,9 @@ class TeamServices:
         Returns:
         int: The total number of teams.
         """
-        statement = select(Team).where(Team.user_id == user_id)
+        statement = select(func.count(Team.id)).where(Team.user_id == user_id)
         result = await self.session.execute(statement)
-        total_teams = len(result.scalars().all())
-        return total_teams
+        return result.scalar_one()
     
     async def get_total_members(self, team_id: uuid.UUID) -> int:
         """
@@ -182,17 +205,17 @@ class TeamServices:
         Team: The updated team. Or None if the team was not found.
         """
         try:
-            statement = select(Team).where(Team.id == team_id, Team.user_id == user_id)
+            statement = update(Team).where(
+                Team.id == team_id, Team.user_id == user_id
+            ).values(**data).returning(Team).execution_options(
+                synchronize_session=False, populate_existing=True
+            )
             result = await self.session.execute(statement)
-            team = result.scalars().first()
-            if team:
-                for key, value in data.items():
-                    setattr(team, key, value)
-                await self.session.commit()
-                await self.session.refresh(team)
-                return team
-            return None
-        except Exception as e:
+            team = result.scalar_one_or_none()
+            await self.session.commit()
+            return team
+        except IntegrityError:
+            await self.session.rollback()
             return None
     
     async def delete_team(self, team_id: uuid.UUID, user_id: uuid.UUID):
@@ -206,14 +229,13 @@ class TeamServices:
         Returns:
         bool: True if the team was deleted successfully, False otherwise.
         """
-        statement = select(Team).where(Team.id == team_id, Team.user_id == user_id)
-        result = await self.session.execute(statement)
-        team = result.scalars().first()
-        if team:
-            await self.session.delete(team)
-            await self.session.commit()
-            return True
-        return False
+        deleted = (await self.session.execute(
+            _DELETE_TEAM, {"team_id": team_id, "user_id": user_id}
+        )).scalar_one_or_none()
+        if deleted is None:
+            return False
+        await self.session.commit()
+        return True
 
 
 class TeamMemberServices:
@@ -238,25 +260,52 @@ class TeamMemberServices:
         Returns:
         Team: The team with the added member.
         """
+        data = dict(data)
+        team_id = data.pop("team_id")
+        members = await self.add_members_to_team(team_owner_id, team_id, [data])
+        return members[0] if members else None
+
+    async def add_members_to_team(
+        self, team_owner_id: uuid.UUID, team_id: uuid.UUID, members: list[dict]
+    ):
+        """
+        Add several members to a team with a single INSERT.
+
+        Team ownership is checked once for the whole batch.
+
+        Args:
+        team_owner_id (uuid.UUID): The ID of the user who owns the team.
+        team_id (uuid.UUID): The ID of the team to add the members to.
+        members (list[dict]): The data for each member to be added.
+
+        Returns:
+        List[TeamMember]: The added team members. Or None if the team was not
+        found or any of the members could not be added.
+        """
         try:
             team = await TeamServices(self.session).get_user_team_by_id(
-                team_owner_id, data["team_id"]
+                team_owner_id, team_id
             )
             if not team:
                 raise HTTPException(status_code=404, detail="Team not found")
-            data["team_id"] = team.id
-            member = TeamMember(**data)
-            self.session.add(member)
+            statement = insert(TeamMember).values(
+                [{**member, "team_id": team.id} for member in members]
+            ).returning(TeamMember)
+            result = await self.session.execute(
+                statement, execution_options={"populate_existing": True}
+            )
+            added = result.scalars().all()
             await self.session.commit()
-            await self.session.refresh(member)
-            return member
-        except Exception as e:
+            return added
+        except IntegrityError:
+            await self.session.rollback()
             return None
 
     async def get_team_members(
         self, team_id: uuid.UUID,
         team_owner_id: uuid.UUID,
-        order: str = "asc", limit: int = 10, offset: int = 0
+        order: str = "asc", limit: int = 10, offset: int = 0,
+        cursor: Optional[Cursor] = None
     ):
         """
         Retrieve all members of a team from the database.
@@ -267,25 +316,30 @@ class TeamMemberServices:
         order (str): Order of the members (asc or desc).
         limit (int): Maximum number of members to retrieve.
         offset (int): Number of members to skip.
+        cursor (Cursor): The (created_at, id) of the last member already seen.
 
         Returns:
-        List[TeamMember]: A list of team members.
+        List[Row]: A list of team members.
         """
         statement = (
-            select(TeamMember)
+            select(*_TEAM_MEMBER_LIST_COLUMNS)
             .join(Team)
             .where(
                 TeamMember.team_id == team_id,
                 Team.user_id == team_owner_id
             )
         )
+        if cursor is not None:
+            statement = statement.where(
+                after_cursor(TeamMember.created_at, TeamMember.id, cursor, order)
+            )
         if order == "desc":
-            statement = statement.order_by(desc(TeamMember.created_at))
+            statement = statement.order_by(desc(TeamMember.created_at), desc(TeamMember.id))
         else:
-            statement = statement.order_by(asc(TeamMember.created_at))
+            statement = statement.order_by(asc(TeamMember.created_at), asc(TeamMember.id))
         statement = statement.limit(limit).offset(offset)
         result = await self.session.execute(statement)
-        members = result.scalars().all()
+        members = result.all()
         return members
 
     async def get_member_by_id(
@@ -301,16 +355,14 @@ class TeamMemberServices:
         Returns:
         TeamMember: The team member with the specified ID.
         """
-        statement = (
-            select(TeamMember)
-            .join(Team)
-            .where(
-                TeamMember.id == member_id,
-                Team.user_id == team_owner_id
-            )
+        member = await self.session.get(TeamMember, member_id, options=[raiseload("*")])
+        if member is None:
+            return None
+        team = await TeamServices(self.session).get_user_team_by_id(
+            team_owner_id, member.team_id
         )
-        result = await self.session.execute(statement)
-        member = result.scalars().first()
+        if team is None:
+            return None
         return member
     
     async def remove_member_from_team(
@@ -1,21 +1,33 @@
 """User services for the Manager API."""
 
+import logging
 import uuid
 from typing import Any, Dict, Optional, Union, List
 from fastapi import Depends, Request, Response
-from sqlalchemy import select, asc, desc
+from sqlalchemy import Row, bindparam, select, asc, desc
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi_users import BaseUserManager, InvalidPasswordException, UUIDIDMixin
 from fastapi_users.db import SQLAlchemyUserDatabase
 from src.core.configs import settings
-from src.models.user_models import User
+from src.models.user_models import Roles, User
 from src.db.db_session import get_async_session
+from src.core.utils.pagination import Cursor, after_cursor
 from src.schemas.user_schemas import UserCreate
 from src.models.activity_models import ActivityType
-from src.services.activity_services import ActivityServices
+from src.services.activity_queue import activity_queue
 
 SECRET = settings.OAUTH_SECRET
 
+logger = logging.getLogger(__name__)
+
+# The UserRead columns, selected directly by the list queries. This also
+# keeps hashed_password out of them.
+_USER_LIST_COLUMNS = (
+    User.id, User.email, User.is_active, User.is_superuser, User.is_verified,
+    User.first_name, User.last_name, User.profile_picture, User.bio, User.role,
+    User.created_at, User.updated_at,
+)
+
 
 class UserManager(UUIDIDMixin, BaseUserManager[User, uuid.UUID]):
     """User manager for the Manager API."""
@@ -34,75 +46,62 @@ class UserManager(UUIDIDMixin, BaseUserManager[User, uuid.UUID]):
 
         super().__init__(user_db)
         self.session = session
-        self.activity_logs = ActivityServices(self.session)
 
-    async def create(
-        self,
-        user_create,
-        safe: bool = False,
-        request: Optional[Request] = None,
-    ) -> User:
+    async def _list_users(
+        self, role: Optional[Roles], order: str, limit: int, offset: int,
+        cursor: Optional[Cursor]
+    ) -> List[Row]:
         """
-        Create a new user.
+        Retrieve a page of users, optionally of a single role.
+
+        The role is a bound parameter, so every role shares one statement
+        shape with the unfiltered listing.
 
         Args:
-        user_create (UserCreate): The user data to be created.
-        safe (bool): Whether to create the user in a safe way.
-        request (Optional[Request]): The request that triggered the user creation.
+            role (Roles, optional): Only list users with this role.
+            order (str): Order of the users (asc or desc).
+            limit (int): Maximum number of users to retrieve.
+            offset (int): Number of users to skip.
+            cursor (Cursor): The (created_at, id) of the last user already seen.
 
         Returns:
-        User: The created user.
+            List[Row]: The UserRead columns of the users.
         """
-
-        user = await super().create(user_create, safe=safe, request=request)
-        await self.session.refresh(user)
-
-        user_id = user.id
-        data={
-                "user_id": user_id,
-                "description": f"A new User with id {str(user_id)} has registered.",
-                "activity_type": ActivityType.CREATE,
-                "entity": "user",
-                "entity_id": str(user_id),
-            }
-
-        await self.activity_logs.create_activity(
-            activity_data=data
-        )
-        print(
-            f"User {user_id} has registered from {request.client.host}"
-        )
-
-        return user
+        statement = select(*_USER_LIST_COLUMNS)
+        if role is not None:
+            statement = statement.where(User.role == bindparam("role"))
+        if cursor is not None:
+            statement = statement.where(after_cursor(User.created_at, User.id, cursor, order))
+        if order == "desc":
+            statement = statement.order_by(desc(User.created_at), desc(User.id))
+        else:
+            statement = statement.order_by(asc(User.created_at), asc(User.id))
+        statement = statement.limit(limit).offset(offset)
+        result = await self.session.execute(statement, {"role": role})
+        users = result.all()
+        return users
 
     async def get_all_users(
         self, order: str = "asc",
-        limit: int = 20, offset: int = 0
-    ) -> List[User]:
+        limit: int = 20, offset: int = 0, cursor: Optional[Cursor] = None
+    ) -> List[Row]:
         """
         Retrieve all users from the database.
 
         Args:
             limit (int): Maximum number of users to retrieve.
             offset (int): Number of users to skip.
+            cursor (Cursor): The (created_at, id) of the last user already seen.
 
         Returns:
-            List[User]: A list of users both admin and non-admin.
+            List[Row]: A list of users both admin and non-admin.
         """
-        statement = select(User)
-        if order == "desc":
-            statement = statement.order_by(desc(User.created_at))
-        else:
-            statement = statement.order_by(asc(User.created_at))
-        statement = statement.limit(limit).offset(offset)
-        result = await self.session.execute(statement)
-        users = result.scalars().all()
-        return users
+        return await self._list_users(None, order, limit, offset, cursor)
 
     async def get_all_admins(
         self, order: str = "asc",
-        limit: int = 20, offset: int = 0
-    ) -> List[User]:
+        limit: int = 20, offset: int = 0, cursor: Optional[Cursor] = None
+    ) -> List[Row]:
         """
         Retrieve all admin users from the database.
 
@@ -110,24 +109,17 @@ class UserManager(UUIDIDMixin, BaseUserManager[User, uuid.UUID]):
             order (str): Order of the users (asc or desc).
             limit (int): Maximum number of users to retrieve.
             offset (int): Number of users to skip.
+            cursor (Cursor): The (created_at, id) of the last user already seen.
 
         Returns:
-            List[User]: A list of admin users.
+            List[Row]: A list of admin users.
         """
-        statement = select(User).where(User.role == "admin")
-        if order == "desc":
-            statement = statement.order_by(desc(User.created_at))
-        else:
-            statement = statement.order_by(asc(User.created_at))
-        statement = statement.limit(limit).offset(offset)
-        result = await self.session.execute(statement)
-        users = result.scalars().all()
-        return users
+        return await self._list_users(Roles.ADMIN, order, limit, offset, cursor)
 
     async def get_all_members(
         self, order: str = "asc",
-        limit: int = 20, offset: int = 0
-    ) -> List[User]:
+        limit: int = 20, offset: int = 0, cursor: Optional[Cursor] = None
+    ) -> List[Row]:
         """
         Retrieve all member users from the database.
 
@@ -135,19 +127,12 @@ class UserManager(UUIDIDMixin, BaseUserManager[User, uuid.UUID]):
             order (str): Order of the users (asc or desc).
             limit (int): Maximum number of users to retrieve.
             offset (int): Number of users to skip.
+            cursor (Cursor): The (created_at, id) of the last user already seen.
 
         Returns:
-            List[User]: A list of member users.
+            List[Row]: A list of member users.
         """
-        statement = select(User).where(User.role == "member")
-        if order == "desc":
-            statement = statement.order_by(desc(User.created_at))
-        else:
-            statement = statement.order_by(asc(User.created_at))
-        statement = statement.limit(limit).offset(offset)
-        result = await self.session.execute(statement)
-        users = result.scalars().all()
-        return users
+        return await self._list_users(Roles.MEMBER, order, limit, offset, cursor)
 
     async def on_after_register(self, user: User, request: Optional[Request] = None):
         """
@@ -157,7 +142,15 @@ class UserManager(UUIDIDMixin, BaseUserManager[User, uuid.UUID]):
         user (User): The newly-created user.
         request (Optional[Request]): The request that triggered the registration.
         """
-        print(f"User {user.id} has registered from {request.client.host}.")
+        activity_queue.put({
+            "user_id": user.id,
+            "description": f"A new User with id {str(user.id)} has registered.",
+            "activity_type": ActivityType.CREATE,
+            "entity": "user",
+            "entity_id": user.id,
+        })
+        host = request.client.host if request and request.client else None
+        logger.info("User %s has registered from %s.", user.id, host)
 
     async def on_after_forgot_password(
         self, user: User, token: str, request: Optional[Request] = None
@@ -170,7 +163,8 @@ class UserManager(UUIDIDMixin, BaseUserManager[User, uuid.UUID]):
         token (str): The password reset token sent to the user.
         request (Optional[Request]): The request that triggered the password reset.
         """
-        print(f"User {user.id} has forgot their password. Reset token: {token}")
+        logger.info("User %s has forgot their password.", user.id)
+        logger.debug("Reset token for user %s: %s", user.id, token)
 
     async def on_after_reset_password(self, user: User, request: Optional[Request] = None):
         """
@@ -180,7 +174,7 @@ class UserManager(UUIDIDMixin, BaseUserManager[User, uuid.UUID]):
         user (User): The user that reset their password.
         request (Optional[Request]): The request that triggered the password reset.
         """
-        print(f"User {user.id} has reset their password.")
+        logger.info("User %s has reset their password.", user.id)
 
     async def on_after_request_verify(
         self, user: User, token: str, request: Optional[Request] = None
@@ -193,7 +187,8 @@ class UserManager(UUIDIDMixin, BaseUserManager[User, uuid.UUID]):
         token (str): The verification token sent to the user.
         request (Optional[Request]): The request that initiated the verification process.
         """
-        print(f"Verification requested for user {user.id}. Verification token: {token}")
+        logger.info("Verification requested for user %s.", user.id)
+        logger.debug("Verification token for user %s: %s", user.id, token)
 
     async def on_after_verify(
         self, user: User, request: Optional[Request] = None
@@ -205,7 +200,7 @@ class UserManager(UUIDIDMixin, BaseUserManager[User, uuid.UUID]):
         user (User): The user that was verified.
         request (Optional[Request]): The request that initiated the verification process.
         """
-        print(f"User {user.id} has been verified")
+        logger.info("User %s has been verified", user.id)
 
     async def validate_password(
         self,
@@ -245,16 +240,14 @@ class UserManager(UUIDIDMixin, BaseUserManager[User, uuid.UUID]):
         update_dict (Dict[str, Any]): A dictionary of the fields that were updated.
         request (Optional[Request]): The request that initiated the update process.
         """
-        await self.activity_logs.create_activity(
-            activity_data = {
-                "user_id": user.id,
-                "description": f"User with id {str(user.id)} has been updated.",
-                "activity_type": ActivityType.UPDATE,
-                "entity": "user",
-                "entity_id": str(user.id)
-            }
-        )
-        print(f"User {user.id} has been updated with {update_dict}.")
+        activity_queue.put({
+            "user_id": user.id,
+            "description": f"User with id {str(user.id)} has been updated.",
+            "activity_type": ActivityType.UPDATE,
+            "entity": "user",
+            "entity_id": user.id
+        })
+        logger.info("User %s has been updated: %s.", user.id, ", ".join(update_dict))
 
     async def on_after_login(
         self,
@@ -270,7 +263,7 @@ class UserManager(UUIDIDMixin, BaseUserManager[User, uuid.UUID]):
         request (Optional[Request]): The request that initiated the login process.
         response (Optional[Response]): The response that will be sent back to the client.
         """
-        print(f"User {user.id} logged in.")
+        logger.info("User %s logged in.", user.id)
 
     async def on_before_delete(self, user: User, request: Optional[Request] = None):
         """
@@ -280,7 +273,7 @@ class UserManager(UUIDIDMixin, BaseUserManager[User, uuid.UUID]):
         user (User): The user that is about to be deleted.
         request (Optional[Request]): The request that initiated the deletion process.
         """
-        print(f"User {user.id} is going to be deleted")
+        logger.info("User %s is going to be deleted", user.id)
 
     async def on_after_delete(self, user: User, request: Optional[Request] = None):
         """
@@ -290,16 +283,14 @@ class UserManager(UUIDIDMixin, BaseUserManager[User, uuid.UUID]):
         user (User): The user that was deleted.
         request (Optional[Request]): The request that triggered the deletion.
         """
-        await self.activity_logs.create_activity(
-            activity_data = {
-                "user_id": user.id,
-                "description": f"User with id {str(user.id)} is successfully deleted",
-                "activity_type": ActivityType.DELETE,
-                "entity": "user",
-                "entity_id": str(user.id)
-            }
-        )
-        print(f"User {user.id} is successfully deleted")
+        # user_id is left unset: the row has just been deleted.
+        activity_queue.put({
+            "description": f"User with id {str(user.id)} is successfully deleted",
+            "activity_type": ActivityType.DELETE,
+            "entity": "user",
+            "entity_id": user.id
+        })
+        logger.info("User %s is successfully deleted", user.id)
 
 
 async def get_user_db(session: AsyncSession = Depends(get_async_session)):
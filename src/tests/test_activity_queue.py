@@ -0,0 +1,71 @@
+"""Test the background activity log queue."""
+
+import pytest
+from sqlalchemy import func, select
+from src.models.activity_models import ActivityLog, ActivityType
+from src.services.activity_queue import ActivityLogQueue
+
+
+def _activity(description: str, user_id=None) -> dict:
+    return {
+        "user_id": user_id,
+        "activity_type": ActivityType.CREATE,
+        "entity": "task",
+        "entity_id": None,
+        "description": description,
+    }
+
+
+async def _count(session_maker, description: str) -> int:
+    async with session_maker() as session:
+        return await session.scalar(
+            select(func.count(ActivityLog.id)).where(ActivityLog.description == description)
+        )
+
+
+@pytest.mark.asyncio
+async def test_flush_drops_only_the_failing_row(test_session_maker, next_uuid):
+    """
+    Test that a batch with one foreign key violation only loses that row.
+
+    The queue writes with its own sessions, which commit outside the test's
+    rolled-back transaction, so the rows are told apart by description.
+    """
+    queue = ActivityLogQueue(test_session_maker)
+    batch = [_activity("flush-ok") for _ in range(9)]
+    batch.insert(4, _activity("flush-bad", user_id=next_uuid()))
+
+    await queue._flush(batch)
+
+    assert await _count(test_session_maker, "flush-ok") == 9
+    assert await _count(test_session_maker, "flush-bad") == 0
+
+
+@pytest.mark.asyncio
+async def test_stop_writes_pending_activity(test_session_maker):
+    """
+    Test that stopping the queue writes everything still queued.
+
+    More activity logs are queued than fit in one batch, so stop() has to
+    drain the queue over several flushes.
+    """
+    queue = ActivityLogQueue(test_session_maker, batch_size=4, flush_interval=60)
+    await queue.start()
+    for _ in range(10):
+        queue.put(_activity("stop-drain"))
+
+    await queue.stop()
+
+    assert await _count(test_session_maker, "stop-drain") == 10
+
+
+@pytest.mark.asyncio
+async def test_put_drops_activity_when_full(test_session_maker):
+    """Test that a full queue drops new activity logs instead of blocking."""
+    queue = ActivityLogQueue(test_session_maker, maxsize=2)
+    for _ in range(3):
+        queue.put(_activity("queue-full"))
+
+    await queue.stop()
+
+    assert await _count(test_session_maker, "queue-full") == 2
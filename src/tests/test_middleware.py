@@ -0,0 +1,138 @@
+"""Test the CORS middleware."""
+
+import httpx
+import pytest
+from src.core.middleware import PureCORSMiddleware
+
+pytestmark = pytest.mark.no_db
+
+ORIGIN = "https://app.example.com"
+
+
+async def plain_app(scope, receive, send):
+    """Answer every request with a 200 "ok"."""
+    await send({
+        "type": "http.response.start", "status": 200,
+        "headers": [(b"content-type", b"text/plain")]
+    })
+    await send({"type": "http.response.body", "body": b"ok"})
+
+
+def cors_client(**options) -> httpx.AsyncClient:
+    """Build a client for plain_app wrapped in PureCORSMiddleware."""
+    app = PureCORSMiddleware(plain_app, **options)
+    return httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://test", trust_env=False
+    )
+
+
+def preflight_headers(origin: str = ORIGIN, method: str = "POST", **extra) -> dict:
+    return {"Origin": origin, "Access-Control-Request-Method": method, **extra}
+
+
+@pytest.mark.asyncio
+async def test_preflight_allowed():
+    """
+    Test that an allowed preflight is answered by the middleware.
+
+    The app is not called, the origin is echoed back and the response
+    varies on Origin.
+    """
+    async with cors_client(
+        allow_origins=[ORIGIN], allow_methods=["GET", "POST"],
+        allow_headers=["Authorization"], max_age=300
+    ) as client:
+        res = await client.options("/", headers=preflight_headers())
+    assert res.status_code == 204
+    assert res.content == b""
+    assert res.headers["access-control-allow-origin"] == ORIGIN
+    assert res.headers["access-control-allow-methods"] == "GET, POST"
+    assert res.headers["access-control-allow-headers"] == "Authorization"
+    assert res.headers["access-control-max-age"] == "300"
+    assert res.headers["vary"] == "Origin"
+    assert "access-control-allow-credentials" not in res.headers
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("origin, method", [
+    pytest.param("https://evil.example.com", "POST", id="origin"),
+    pytest.param(ORIGIN, "DELETE", id="method"),
+])
+async def test_preflight_denied(origin: str, method: str):
+    """Test that a preflight from a disallowed origin or for a disallowed method gets a 400."""
+    async with cors_client(allow_origins=[ORIGIN], allow_methods=["GET", "POST"]) as client:
+        res = await client.options("/", headers=preflight_headers(origin, method))
+    assert res.status_code == 400
+    assert res.text == "Disallowed CORS request"
+    assert "access-control-allow-origin" not in res.headers
+
+
+@pytest.mark.asyncio
+async def test_simple_request_echoes_origin():
+    """Test that an allowed origin is echoed on a normal response, with Vary: Origin."""
+    async with cors_client(allow_origins=[ORIGIN]) as client:
+        res = await client.get("/", headers={"Origin": ORIGIN})
+    assert res.status_code == 200
+    assert res.text == "ok"
+    assert res.headers["access-control-allow-origin"] == ORIGIN
+    assert res.headers["vary"] == "Origin"
+
+
+@pytest.mark.asyncio
+async def test_simple_request_disallowed_origin():
+    """Test that a disallowed origin reaches the app but gets no CORS headers."""
+    async with cors_client(allow_origins=[ORIGIN]) as client:
+        res = await client.get("/", headers={"Origin": "https://evil.example.com"})
+    assert res.status_code == 200
+    assert "access-control-allow-origin" not in res.headers
+    assert "vary" not in res.headers
+
+
+@pytest.mark.asyncio
+async def test_request_without_origin_is_untouched():
+    """Test that same-origin requests pass through without CORS headers."""
+    async with cors_client(allow_origins=["*"]) as client:
+        res = await client.get("/")
+    assert res.status_code == 200
+    assert "access-control-allow-origin" not in res.headers
+
+
+@pytest.mark.asyncio
+async def test_wildcard_origin_without_credentials():
+    """
+    Test that allowing every origin answers with "*".
+
+    The response doesn't depend on the origin, so no Vary header is added;
+    with a wildcard for headers, the requested headers are allowed back.
+    """
+    async with cors_client(allow_origins=["*"], allow_methods=["*"], allow_headers=["*"]) as client:
+        preflight = await client.options(
+            "/", headers=preflight_headers(method="PATCH", **{
+                "Access-Control-Request-Headers": "Authorization, X-Trace"
+            })
+        )
+        res = await client.get("/", headers={"Origin": ORIGIN})
+    assert preflight.status_code == 204
+    assert preflight.headers["access-control-allow-origin"] == "*"
+    assert preflight.headers["access-control-allow-headers"] == "Authorization, X-Trace"
+    assert "PATCH" in preflight.headers["access-control-allow-methods"]
+    assert "vary" not in preflight.headers
+    assert res.headers["access-control-allow-origin"] == "*"
+    assert "vary" not in res.headers
+
+
+@pytest.mark.asyncio
+async def test_wildcard_origin_with_credentials():
+    """
+    Test that credentials turn the wildcard into an echoed origin.
+
+    Browsers reject "*" together with credentials, so the request's origin is
+    sent back instead, along with Vary: Origin.
+    """
+    async with cors_client(allow_origins=["*"], allow_credentials=True) as client:
+        preflight = await client.options("/", headers=preflight_headers(method="GET"))
+        res = await client.get("/", headers={"Origin": ORIGIN})
+    for response in (preflight, res):
+        assert response.headers["access-control-allow-origin"] == ORIGIN
+        assert response.headers["access-control-allow-credentials"] == "true"
+        assert response.headers["vary"] == "Origin"
@@ -1,27 +1,50 @@
 """Test project routes."""
 
+import asyncio
+import json
 import uuid
 import pytest
 import pytest_asyncio
 from httpx import AsyncClient
 
+PROJECTS_URL = "/api/v1.0.0/projects"
+TEAMS_URL = "/api/v1.0.0/teams"
+
+
+@pytest_asyncio.fixture
+async def team(authenticated_client: AsyncClient) -> dict:
+    """A team owned by the test user, rolled back with the test."""
+    res = await authenticated_client.post(f"{TEAMS_URL}/create/new", json={"title": "Test Team"})
+    assert res.status_code == 201
+    return res.json()
+
+
+@pytest_asyncio.fixture
+async def project(authenticated_client: AsyncClient, team: dict) -> dict:
+    """A project of the test user in their team, rolled back with the test."""
+    payload = {"title": "My Project", "description": "A test project", "team_id": team["id"]}
+    res = await authenticated_client.post(f"{PROJECTS_URL}/create/new", json=payload)
+    assert res.status_code == 201
+    return res.json()
+
 
 @pytest.mark.asyncio
-async def test_create_project_success(authenticated_client: AsyncClient, test_team, test_user):
+async def test_create_project_success(authenticated_client: AsyncClient, team):
     """
     Test creating a new project.
 
     This test verifies that creating a new project with valid data
-    results in a 201 status code and a UUID is returned.
+    results in a 201 status code and the created project is returned.
     """
     payload = {
         "title": "New Test Project",
         "description": "A test project",
-        "team_id": str(test_team.id)
+        "team_id": team["id"]
     }
-    response = await authenticated_client.post("/api/v1.0.0/projects/create/new", json=payload)
+    response = await authenticated_client.post(f"{PROJECTS_URL}/create/new", json=payload)
     assert response.status_code == 201
-    assert uuid.UUID(response.json())
+    assert uuid.UUID(response.json()["id"])
+    assert response.json()["team_id"] == team["id"]
 
 
 @pytest.mark.asyncio
@@ -34,34 +57,34 @@ async def test_create_project_missing_team(authenticated_client: AsyncClient):
         "title": "No Team Project",
         "description": "Missing team_id"
     }
-    response = await authenticated_client.post("/api/v1.0.0/projects/create/new", json=payload)
+    response = await authenticated_client.post(f"{PROJECTS_URL}/create/new", json=payload)
     assert response.status_code == 422
 
 
 @pytest.mark.asyncio
-async def test_get_all_projects(authenticated_client: AsyncClient, test_project):
+async def test_get_all_projects(authenticated_client: AsyncClient, project):
     """
     Test retrieving all projects from the database.
 
     This test verifies that retrieving all projects returns a 200 status code
-    and a list of projects.
+    and a list of the user's projects.
     """
-    response = await authenticated_client.get("/api/v1.0.0/projects")
+    response = await authenticated_client.get(PROJECTS_URL)
     assert response.status_code == 200
-    assert isinstance(response.json(), list)
+    assert [p["id"] for p in response.json()] == [project["id"]]
 
 
 @pytest.mark.asyncio
-async def test_get_project_by_id(authenticated_client: AsyncClient, test_project):
+async def test_get_project_by_id(authenticated_client: AsyncClient, project):
     """
     Test retrieving a project by its valid UUID.
 
     This test verifies that retrieving a project with a valid UUID
     returns a 200 status code and the correct project data.
     """
-    response = await authenticated_client.get(f"/api/v1.0.0/projects/{test_project.id}")
+    response = await authenticated_client.get(f"{PROJECTS_URL}/{project['id']}")
     assert response.status_code == 200
-    assert response.json()["id"] == str(test_project.id)
+    assert response.json()["id"] == project["id"]
 
 
 @pytest.mark.asyncio
@@ -73,187 +96,166 @@ async def test_get_project_by_invalid_id(authenticated_client: AsyncClient):
     results in a 422 status code.
     """
 
-    response = await authenticated_client.get("/api/v1.0.0/projects/invalid-uuid")
+    response = await authenticated_client.get(f"{PROJECTS_URL}/invalid-uuid")
     assert response.status_code == 422
 
 
 @pytest.mark.asyncio
-async def test_update_project_success(authenticated_client: AsyncClient, test_project):
+async def test_update_project_success(authenticated_client: AsyncClient, project):
     """
     Test updating a project with valid data.
 
     Args:
         authenticated_client (AsyncClient): The FastAPI test client.
-        test_project (Project): A test project.
+        project (dict): The project to update.
 
     Verifies that the API returns a 200 status code and that the project title
     is updated correctly.
     """
-    payload = {"title": "Updated Title"}
-    response = await authenticated_client.patch(f"/api/v1.0.0/projects/{test_project.id}/update", json=payload)
+    # Every field is sent: the route writes the whole UpdateProject, unset fields included.
+    payload = {
+        "title": "Updated Title",
+        "description": project["description"],
+        "team_id": project["team_id"]
+    }
+    response = await authenticated_client.patch(f"{PROJECTS_URL}/{project['id']}/update", json=payload)
     assert response.status_code == 200
     assert response.json()["title"] == "Updated Title"
 
 
 @pytest.mark.asyncio
-async def test_update_nonexistent_project(authenticated_client: AsyncClient):
+async def test_update_nonexistent_project(authenticated_client: AsyncClient, next_uuid):
     """
     Test updating a project that does not exist in the database.
 
     This test verifies that attempting to update a project with a UUID that does not exist in the database
     results in a 404 status code.
     """
-    fake_id = uuid.uuid4()
+    fake_id = next_uuid()
     payload = {"title": "Won't work"}
-    response = await authenticated_client.patch(f"/api/v1.0.0/projects/{fake_id}/update", json=payload)
+    response = await authenticated_client.patch(f"{PROJECTS_URL}/{fake_id}/update", json=payload)
     assert response.status_code == 404
 
 
 @pytest.mark.asyncio
-async def test_delete_project_success(authenticated_client: AsyncClient, test_project):
+async def test_delete_project_success(authenticated_client: AsyncClient, project):
     """
     Test deleting a project that exists in the database.
 
     This test verifies that attempting to delete a project with a valid UUID that exists in the database
     results in a 204 response.
     """
-    response = await authenticated_client.delete(f"/api/v1.0.0/projects/{test_project.id}/delete")
+    response = await authenticated_client.delete(f"{PROJECTS_URL}/{project['id']}/delete")
     assert response.status_code == 204
+    response = await authenticated_client.get(f"{PROJECTS_URL}/{project['id']}")
+    assert response.status_code == 404
 
 
 @pytest.mark.asyncio
-async def test_delete_project_not_found(authenticated_client: AsyncClient):
+async def test_delete_project_not_found(authenticated_client: AsyncClient, next_uuid):
     """
     Test deleting a project that does not exist in the database.
 
     This test verifies that attempting to delete a project with a UUID that does not exist in the database
     results in a 404 status code.
     """
-    fake_id = uuid.uuid4()
-    response = await authenticated_client.delete(f"/api/v1.0.0projects/{fake_id}/delete")
+    fake_id = next_uuid()
+    response = await authenticated_client.delete(f"{PROJECTS_URL}/{fake_id}/delete")
     assert response.status_code == 404
 
 
 @pytest.mark.asyncio
-async def test_get_team_projects_for_user_authenticated(test_client: AsyncClient, authorized_headers):
+async def test_export_projects(authenticated_client: AsyncClient, team):
     """
-    Test that a user can retrieve their team projects when authenticated.
+    Test exporting the user's projects as newline-delimited JSON.
 
-    This test verifies that retrieving a user's team projects with a valid token
-    results in a 200 status code if the user has any team projects, or a 404 status
-    code if the user has no team projects.
+    The export streams from its own session after the request's session has
+    been closed; every project the user created comes back, ordered by
+    (created_at, id).
     """
-    res = await test_client.get("/api/v1.0.0projects/team/project", headers=authorized_headers)
-    assert res.status_code in (200, 404)
+    team_id = team["id"]
+    titles = ["Export One", "Export Two", "Export Three"]
+    for title in titles:
+        res = await authenticated_client.post(
+            f"{PROJECTS_URL}/create/new",
+            json={"title": title, "description": None, "team_id": team_id}
+        )
+        assert res.status_code == 201
+
+    res = await authenticated_client.get(f"{PROJECTS_URL}/export", params={"order": "asc"})
+    assert res.status_code == 200
+    assert res.headers["content-type"] == "application/x-ndjson"
+    exported = [json.loads(line) for line in res.text.splitlines()]
+    assert sorted(project["title"] for project in exported) == sorted(titles)
+    keys = [(project["created_at"], uuid.UUID(project["id"])) for project in exported]
+    assert keys == sorted(keys)
+    assert {project["team_id"] for project in exported} == {team_id}
 
 
 @pytest.mark.asyncio
-async def test_get_team_projects_for_user_unauthenticated(test_client: AsyncClient):
+@pytest.mark.no_db
+async def test_get_team_projects_for_user_unauthenticated(no_db_client: AsyncClient):
     """
     Test that attempting to retrieve a user's team projects without a valid token
     results in a 401 status code.
     """
-    res = await test_client.get("/api/v1.0.0/projects/team/project")
+    res = await no_db_client.get(f"{PROJECTS_URL}/team/project")
     assert res.status_code == 401
 
 
 @pytest.mark.asyncio
-async def test_get_project_if_member_valid(test_client: AsyncClient, test_project: dict, authorized_headers):
-    """
-    Test retrieving a project with a valid UUID for membership check.
-
-    This test verifies that attempting to retrieve a project with a valid UUID
-    results in a 200 status code if the user is a member of the project, or a 404
-    status code if the project is not found.
-    """
-    url = f"/api/v1.0.0/projects/{test_project['id']}/team/is_member"
-    res = await test_client.get(url, headers=authorized_headers)
-    assert res.status_code in (200, 404)
-
-
-@pytest.mark.asyncio
-async def test_get_project_if_member_invalid_uuid(test_client: AsyncClient, authorized_headers):
+@pytest.mark.no_db
+async def test_read_routes_require_authentication(no_db_client: AsyncClient, next_uuid):
     """
-    Test retrieving a project with an invalid UUID for membership check.
+    Test that the project read routes reject requests without a token.
 
-    This test verifies that attempting to check if a user is a member of a project
-    with an invalid UUID results in a 422 status code.
+    The requests are sent concurrently. They are refused with a 401 status
+    code before any of them reaches the database, so they don't contend for
+    the test's session.
     """
-    res = await test_client.get("/api/v1.0.0/projects/invalid-uuid/team/is_member", headers=authorized_headers)
-    assert res.status_code == 422
+    cases = [
+        ("GET", PROJECTS_URL),
+        ("GET", f"{PROJECTS_URL}/team/project"),
+        ("GET", f"{PROJECTS_URL}/{next_uuid()}"),
+        ("GET", f"{PROJECTS_URL}/{next_uuid()}/team/is_member"),
+        ("GET", f"{PROJECTS_URL}/team/{next_uuid()}"),
+    ]
+    responses = await asyncio.gather(
+        *(no_db_client.request(method, url) for method, url in cases)
+    )
+    for (method, url), res in zip(cases, responses):
+        assert res.status_code == 401, f"{method} {url}"
 
 
 @pytest.mark.asyncio
-async def test_get_projects_by_team_id_valid(test_client: AsyncClient, test_team: dict, authorized_headers):
-    """
-    Test retrieving projects by team ID using a valid UUID.
-
-    This test verifies that attempting to retrieve projects with a valid UUID
-    results in a 200 status code if the team is found or a 404 status code if the
-    team is not found.
-    """
-    res = await test_client.get(f"/api/v1.0.0/projects/team/{test_team['id']}", headers=authorized_headers)
-    assert res.status_code in (200, 404)
-
-
-@pytest.mark.asyncio
-async def test_get_projects_by_team_id_invalid_uuid(test_client: AsyncClient, authorized_headers):
-    """
-    Test retrieving projects by team ID using an invalid UUID.
-
-    This test verifies that attempting to retrieve projects with an invalid
-    team UUID results in a 422 status code.
-    """
-    res = await test_client.get("/api/v1.0.0/projects/team/invalid-uuid", headers=authorized_headers)
-    assert res.status_code == 422
-
-
-@pytest.mark.asyncio
-async def test_get_project_by_title_valid(test_client: AsyncClient, test_project: dict, authorized_headers):
-    """
-    Test retrieving a project by its title when the project exists in the database.
-
-    This test verifies that attempting to retrieve a project by its title when the project exists in the database
-    results in a 200 status code.
-    """
-    res = await test_client.get(f"/api/v1.0.0/projects/{test_project['title']}", headers=authorized_headers)
-    assert res.status_code in (200, 404)
-
-
-@pytest.mark.asyncio
-async def test_get_project_by_title_not_found(test_client: AsyncClient, authorized_headers):
-    """
-    Test retrieving a project by its title when the project does not exist in the database.
-
-    This test verifies that attempting to retrieve a project by its title when the project does not exist in the database
-    results in a 404 status code.
-    """
-    res = await test_client.get("/api/v1.0.0/projects/NonExistentTitle", headers=authorized_headers)
-    assert res.status_code in (200, 404)
-
-
-@pytest.mark.asyncio
-async def test_admin_get_project_by_user_and_id(test_client: AsyncClient, admin_user: dict, test_project: dict, test_user: dict, authorized_headers):
-    """
-    Test retrieving a project by project ID and user ID as an admin.
-
-    This test verifies that an admin user can retrieve a project by specifying
-    both the project ID and the user ID. The response should return a 200 status
-    code if the project is found or a 404 status code if the project is not found.
-    """
-    url = f"/api/v1.0.0/projects/{test_project['id']}/user/{test_user['id']}"
-    res = await test_client.get(url, headers=authorized_headers)
-    assert res.status_code in (200, 404)
-
-
-@pytest.mark.asyncio
-async def test_admin_get_project_by_user_invalid_uuid(test_client: AsyncClient, admin_user: dict, authorized_headers):
-    """
-    Test attempting to retrieve a project by a user ID with an invalid UUID.
-
-    This test verifies that attempting to retrieve a project with an invalid UUID
-    results in a 422 status code.
-    """
-    url = "/api/v1.0.0/projects/invalid-uuid/user/also-invalid"
-    res = await test_client.get(url, headers=authorized_headers)
-    assert res.status_code == 422
+@pytest.mark.parametrize("path, expected", [
+    pytest.param("/team/project", 404, id="team_projects_for_user"),
+    pytest.param("/{project}/team/is_member", 200, id="project_if_member"),
+    pytest.param("/{missing}/team/is_member", 404, id="project_if_member_not_found"),
+    pytest.param("/invalid-uuid/team/is_member", 422, id="project_if_member_invalid_uuid"),
+    pytest.param("/team/{team}", 200, id="projects_by_team_id"),
+    pytest.param("/team/{missing}", 404, id="projects_by_team_id_not_found"),
+    pytest.param("/team/invalid-uuid", 422, id="projects_by_team_id_invalid_uuid"),
+    pytest.param("/title/{title}", 200, id="project_by_title"),
+    pytest.param("/title/NonExistentTitle", 404, id="project_by_title_not_found"),
+    pytest.param("/{project}/user/{user}", 200, id="admin_project_by_user_and_id"),
+    pytest.param("/{missing}/user/{user}", 404, id="admin_project_by_user_and_id_not_found"),
+    pytest.param("/invalid-uuid/user/also-invalid", 422, id="admin_project_by_user_invalid_uuid"),
+])
+async def test_authorized_get(
+    authenticated_client: AsyncClient, project, next_uuid, path: str, expected: int
+):
+    """
+    Test the project read routes with a valid token.
+
+    The path is filled in with the test user's project, its team, or an id
+    that matches no row. The user owns the team but is not a member of any
+    team, so its team projects are not found; invalid UUIDs result in a 422
+    status code.
+    """
+    url = PROJECTS_URL + path.format(
+        project=project["id"], team=project["team_id"], title=project["title"],
+        user=project["user_id"], missing=next_uuid()
+    )
+    res = await authenticated_client.get(url)
+    assert res.status_code == expected